@@ -1,5 +1,8 @@
 import streamlit as st
 
+import instrumentasi
+import pemanasan
+
 st.set_page_config(page_title="Aplikasi Pertanian", layout="wide", page_icon="🌿")
 
 css = """
@@ -35,12 +38,27 @@ css = """
 """
 
 st.markdown(css, unsafe_allow_html=True)
-st.balloons()
+# Balon hanya sekali per sesi, bukan pada setiap rerun
+if not st.session_state.get('sudah_disambut'):
+    st.session_state['sudah_disambut'] = True
+    st.balloons()
 # Definisikan halaman
 rekomendasi = st.Page("rekomendasi.py", title="Rekomendasi Tanaman", icon="🌱")
 kelembapan = st.Page("kelembapan.py", title="Kelembapan", icon="💧")
 suhu = st.Page("suhu.py", title="Suhu", icon="🌡️")
 curah_hujan = st.Page("curah_hujan.py", title="Curah Hujan", icon="🌧️")
+# Tidak tampil di menu; dibuka lewat URL /diagnostik
+diagnostik = st.Page("diagnostik.py", title="Diagnostik", icon="🩺", visibility="hidden")
 # Buat navigasi
-pg = st.navigation([suhu,kelembapan,curah_hujan,rekomendasi])
-pg.run()
\ No newline at end of file
+pg = st.navigation([suhu,kelembapan,curah_hujan,rekomendasi,diagnostik])
+
+# Cache bersama dipanaskan di thread pool sejak rerun pertama proses (lihat pemanasan.py)
+pemanasan.mulai()
+if not pemanasan.siap():
+    tugas = pemanasan.status().values()
+    selesai = sum(info['status'] in ('siap', 'gagal') for info in tugas)
+    st.sidebar.caption(f"⏳ Menyiapkan cache: {selesai}/{len(tugas)} tugas selesai")
+
+# Setiap bagian yang diukur selama rerun diberi tag halaman ini (lihat instrumentasi.py)
+with instrumentasi.rerun(pg.title):
+    pg.run()
@@ -0,0 +1,347 @@
+"""
+Utilitas bersama untuk artefak turunan (hash versi file dan penyimpanan array di disk).
+
+Artefak disimpan sebagai folder berisi file `.npy` tanpa kompresi ditambah `meta.json`,
+sehingga array dapat dibuka dengan `mmap_mode='r'` tanpa menyalin isinya ke memori.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_DIR, 'Cache')
+
+# Stasiun asal Dataset/dataset time series.csv, Model/ dan Split_Data/
+STASIUN_UTAMA = 'utama'
+
+# ID stasiun dipakai sebagai nama folder/file sehingga dibatasi ke karakter aman
+_POLA_ID_STASIUN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+# Jumlah entri maksimum cache per proses; entri yang paling lama tidak dipakai dibuang
+BATAS_CACHE = 32
+
+_cache_hash = {}
+_lock_hash = threading.Lock()
+
+
+def validasi_stasiun(stasiun):
+    """
+    Memastikan ID stasiun aman dipakai sebagai nama folder.
+
+    Raises:
+        ValueError: Jika ID mengandung karakter selain huruf, angka, '_' atau '-'
+    """
+    if not isinstance(stasiun, str) or not _POLA_ID_STASIUN.match(stasiun):
+        raise ValueError(f"ID stasiun tidak valid: {stasiun!r}")
+    return stasiun
+
+
+def folder_stasiun(stasiun):
+    """
+    Folder partisi artefak turunan milik satu stasiun di dalam Cache/.
+    """
+    return os.path.join(CACHE_DIR, 'stasiun', validasi_stasiun(stasiun))
+
+
+def ambil_cache_lru(cache, kunci, pembuat, batas=BATAS_CACHE):
+    """
+    Mengambil entri dari OrderedDict `cache`, membuatnya jika belum ada, lalu membuang
+    entri paling lama tidak dipakai jika melebihi `batas`. Pemanggil memegang lock.
+    """
+    if kunci in cache:
+        cache.move_to_end(kunci)
+        return cache[kunci]
+    nilai = cache[kunci] = pembuat()
+    while len(cache) > batas:
+        cache.popitem(last=False)
+    return nilai
+
+
+def _ringkas(digest):
+    return digest.hexdigest()[:16]
+
+
+def hash_isi(isi):
+    """
+    Hash isi file yang sudah dibaca ke memori; sama dengan `hash_file` untuk isi yang sama.
+    """
+    return _ringkas(hashlib.sha256(isi))
+
+
+def hash_file(path):
+    """
+    Menghitung hash SHA-256 isi file. Hasilnya diingat selama ukuran dan waktu
+    modifikasi file tidak berubah, sehingga file besar tidak dibaca ulang setiap rerun.
+    """
+    stat = os.stat(path)
+    kunci_stat = (stat.st_size, stat.st_mtime_ns)
+    with _lock_hash:
+        tersimpan = _cache_hash.get(path)
+    if tersimpan is not None and tersimpan[0] == kunci_stat:
+        return tersimpan[1]
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for blok in iter(lambda: file.read(1 << 20), b''):
+            digest.update(blok)
+    hasil = _ringkas(digest)
+    with _lock_hash:
+        _cache_hash[path] = (kunci_stat, hasil)
+    return hasil
+
+
+def hash_gabungan(*paths):
+    """
+    Hash versi gabungan dari beberapa file, dipakai sebagai penanda versi artefak turunan.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(hash_file(path).encode())
+    return _ringkas(digest)
+
+
+def simpan_array(folder, arrays, meta=None, ganti=False):
+    """
+    Menyimpan kumpulan array ke folder artefak secara atomik.
+
+    Isi folder ditulis ke folder sementara lalu dipindahkan ke tujuan dengan satu rename,
+    sehingga pembaca tidak pernah melihat folder yang setengah jadi. Secara default penulis
+    pertama yang menang: folder artefak berversi (nama memuat hash sumbernya) berisi data
+    yang sama untuk penulis mana pun, sehingga jika folder tujuan sudah ada, folder
+    sementara dibuang dan folder yang sudah ada tidak disentuh.
+
+    Args:
+        folder: Path folder tujuan
+        arrays: Dictionary nama -> array NumPy
+        meta: Dictionary tambahan yang dapat diserialisasi ke JSON
+        ganti: Ganti folder yang sudah ada (untuk folder tanpa versi pada namanya). Folder
+            lama dipindahkan ke samping sebelum dihapus sehingga memmap yang sedang dibuka
+            pembaca tetap valid; pemanggil wajib memegang `kunci_file` folder tersebut
+    Returns:
+        True jika folder ini yang dipublikasikan, False jika folder penulis lain dipertahankan
+    """
+    akhiran = f"{os.getpid()}-{threading.get_ident()}"
+    sementara = f"{folder}.tmp-{akhiran}"
+    os.makedirs(sementara, exist_ok=True)
+    for nama, array in arrays.items():
+        np.save(os.path.join(sementara, f'{nama}.npy'), np.ascontiguousarray(array), allow_pickle=False)
+    with open(os.path.join(sementara, 'meta.json'), 'w', encoding='utf-8') as file:
+        json.dump(meta or {}, file, ensure_ascii=False)
+
+    lama = None
+    if ganti and os.path.isdir(folder):
+        lama = f"{folder}.lama-{akhiran}"
+        os.rename(folder, lama)
+    try:
+        # rename folder gagal jika tujuan sudah ada dan tidak kosong (POSIX) atau sudah ada (Windows)
+        os.rename(sementara, folder)
+    except OSError:
+        if not os.path.isdir(folder):
+            raise
+        shutil.rmtree(sementara, ignore_errors=True)
+        return False
+    finally:
+        if lama is not None:
+            shutil.rmtree(lama, ignore_errors=True)
+    return True
+
+
+def _identitas_folder(folder):
+    try:
+        stat = os.stat(folder)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns
+
+
+def muat_array(folder, mmap_mode='r'):
+    """
+    Membuka folder artefak. Array dibuka memory-mapped sehingga beberapa proses
+    berbagi halaman memori fisik yang sama.
+
+    Folder yang diganti (`simpan_array(..., ganti=True)`) atau meta-nya diperbarui selama
+    dibaca tidak menghasilkan campuran isi lama dan baru: identitas folder dibandingkan
+    sebelum dan sesudah membaca, dan jika berubah hasilnya None sehingga pemanggil membaca ulang.
+
+    Returns:
+        Tuple (arrays, meta), atau None jika folder belum ada atau sedang diganti
+    """
+    identitas = _identitas_folder(folder)
+    if identitas is None:
+        return None
+    try:
+        with open(os.path.join(folder, 'meta.json'), encoding='utf-8') as file:
+            meta = json.load(file)
+        arrays = {}
+        for nama_file in os.listdir(folder):
+            if nama_file.endswith('.npy'):
+                arrays[nama_file[:-4]] = np.load(
+                    os.path.join(folder, nama_file), mmap_mode=mmap_mode, allow_pickle=False
+                )
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        # np.load membaca header lalu membuka ulang file lewat path; jika folder diganti di
+        # antaranya, header dan isi berasal dari file berbeda
+        if _identitas_folder(folder) == identitas:
+            raise
+        return None
+    if _identitas_folder(folder) != identitas:
+        return None
+    return arrays, meta
+
+
+def buka_artefak(folder, ekspor, percobaan=3):
+    """
+    Membuka folder artefak, memanggil `ekspor` untuk membuatnya jika belum ada.
+
+    Args:
+        folder: Path folder artefak
+        ekspor: Fungsi tanpa argumen yang menulis folder tersebut lewat `simpan_array`
+        percobaan: Jumlah maksimum percobaan ekspor lalu baca ulang
+    Returns:
+        Tuple (arrays, meta) seperti `muat_array`
+    Raises:
+        FileNotFoundError: Jika folder tetap tidak dapat dibuka setelah semua percobaan
+    """
+    bundel = muat_array(folder)
+    for _ in range(percobaan):
+        if bundel is not None:
+            return bundel
+        ekspor()
+        bundel = muat_array(folder)
+    if bundel is None:
+        raise FileNotFoundError(f"Artefak {folder} tidak dapat dibuka setelah {percobaan} kali ekspor")
+    return bundel
+
+
+def simpan_meta(folder, meta):
+    """
+    Mengganti meta.json folder artefak secara atomik.
+    """
+    path = os.path.join(folder, 'meta.json')
+    sementara = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    with open(sementara, 'w', encoding='utf-8') as file:
+        json.dump(meta, file, ensure_ascii=False)
+    os.replace(sementara, path)
+
+
+def tulis_baris_array(folder, arrays, mulai):
+    """
+    Menulis baris ke file `.npy` yang sudah ada mulai dari baris `mulai`, menimpa baris
+    lama dan memperpanjang file jika perlu. Hanya baris yang ditulis yang menyentuh disk:
+    header `.npy` disiapkan NumPy dengan ruang cadangan untuk sumbu pertama yang tumbuh.
+
+    Args:
+        folder: Path folder artefak
+        arrays: Dictionary nama -> array baris baru (dtype dan bentuk selain sumbu 0 harus sama)
+        mulai: Indeks baris pertama yang ditulis
+    Returns:
+        Jumlah baris akhir, atau None jika ada file yang tidak dapat ditulis in-place
+    """
+    n_akhir = None
+    for nama, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        with open(os.path.join(folder, f'{nama}.npy'), 'r+b') as file:
+            versi = np.lib.format.read_magic(file)
+            if versi != (1, 0):
+                return None
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+            awal_data = file.tell()
+            if fortran_order or dtype != array.dtype or shape[1:] != array.shape[1:] or mulai > shape[0]:
+                return None
+            n_baris = max(shape[0], mulai + len(array))
+
+            # Data ditulis lebih dulu sehingga pembaca tidak pernah melihat header yang lebih panjang dari isinya
+            file.seek(awal_data + mulai * array[:1].nbytes)
+            file.write(array.tobytes())
+            file.seek(0)
+            np.lib.format.write_array_header_1_0(
+                file, {'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False, 'shape': (n_baris,) + shape[1:]}
+            )
+            if file.tell() != awal_data:
+                raise OSError(f"Header {nama}.npy berubah panjang saat ditulis ulang")
+        n_akhir = n_baris
+    return n_akhir
+
+
+def _kunci_basi(path, batas_waktu):
+    try:
+        return time.time() - os.stat(path).st_mtime > batas_waktu
+    except FileNotFoundError:
+        return False
+
+
+def _ambil_alih_kunci(path, batas_waktu):
+    """
+    Menghapus kunci yang tidak diperbarui lebih dari `batas_waktu` detik. Pemeriksaan ulang dan
+    penghapusan dilakukan di bawah penjaga `path + '.ambil'` agar dua proses yang sama-sama
+    menunggu tidak menghapus kunci baru yang baru saja dibuat salah satunya.
+
+    Returns:
+        True jika kunci basi dihapus
+    """
+    if not _kunci_basi(path, batas_waktu):
+        return False
+    penjaga = path + '.ambil'
+    try:
+        fd = os.open(penjaga, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        # Penjaga hanya dipegang sesaat; penjaga basi berarti pemegangnya mati saat mengambil alih
+        if _kunci_basi(penjaga, batas_waktu):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(penjaga)
+        return False
+    try:
+        if not _kunci_basi(path, batas_waktu):
+            return False
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+        return True
+    finally:
+        os.close(fd)
+        os.remove(penjaga)
+
+
+def _perbarui_kunci(path, interval, selesai):
+    while not selesai.wait(interval):
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return
+
+
+@contextlib.contextmanager
+def kunci_file(path, batas_waktu=60.0):
+    """
+    Kunci antar-proses sederhana berbasis file (portabel, tanpa fcntl). Selama kunci dipegang,
+    thread latar memperbarui mtime file setiap `batas_waktu / 4` detik, sehingga kunci yang
+    tidak diperbarui lebih dari `batas_waktu` detik hanya mungkin sisa proses yang sudah mati
+    dan diambil alih. Pemegang yang masih hidup tidak pernah kehilangan kuncinya, berapa pun
+    lamanya ia bekerja.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if not _ambil_alih_kunci(path, batas_waktu):
+                time.sleep(0.05)
+    selesai = threading.Event()
+    detak = threading.Thread(target=_perbarui_kunci, args=(path, batas_waktu / 4, selesai), daemon=True)
+    detak.start()
+    try:
+        yield
+    finally:
+        selesai.set()
+        detak.join()
+        os.close(fd)
+        os.remove(path)
@@ -0,0 +1,401 @@
+"""
+Benchmark jalur panas aplikasi tanpa Streamlit: parsing dan pembersihan CSV, pemuatan model,
+prediksi tanaman batch, peramalan rekursif, perhitungan metrik dan pembuatan figure Plotly.
+
+Setiap benchmark diukur dengan `timeit` (jumlah pemanggilan per sampel dipilih otomatis
+agar satu sampel >= 0,2 detik) lalu hasilnya disimpan per commit di Benchmark/<commit>.json
+(akhiran "-kotor" jika working tree berisi perubahan). Setelah berjalan, hasil dibandingkan
+dengan hasil commit dasar (default commit induk) jika tersedia.
+
+Contoh:
+    python benchmark.py                              # semua benchmark, bandingkan dengan HEAD~1
+    python benchmark.py --pilih peramalan grafik     # hanya benchmark yang namanya memuat kata ini
+    python benchmark.py --bandingkan main HEAD       # laporan perbandingan dari hasil tersimpan
+    python benchmark.py --ketat --ambang 0.15        # keluar dengan kode 1 jika ada yang melambat >15%
+"""
+import argparse
+import json
+import os
+import pickle
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import data_cuaca
+import grafik
+import model_cuaca
+import model_tanaman
+import peramalan
+from artefak import BASE_DIR, hash_file, muat_array
+
+BENCHMARK_DIR = os.path.join(BASE_DIR, 'Benchmark')
+
+# Ukuran batch prediksi tanaman dan horizon peramalan (hari)
+UKURAN_BATCH = [1, 1_000, 100_000]
+HORIZON = [7, 30, 100, 365]
+
+# Selisih median relatif yang dianggap perubahan nyata pada laporan perbandingan
+AMBANG = 0.10
+
+# nama -> (fungsi persiapan yang mengembalikan fungsi tanpa argumen, jumlah item per pemanggilan)
+BENCHMARK = {}
+
+
+def _daftar(nama, n_item=None):
+    def daftar(persiapan):
+        BENCHMARK[nama] = (persiapan, n_item)
+        return persiapan
+    return daftar
+
+
+@_daftar('csv.cuaca_baca_bersihkan')
+def _csv_cuaca():
+    path = data_cuaca.path_dataset()
+    return lambda: data_cuaca.bersihkan_data(pd.read_csv(path))
+
+
+@_daftar('csv.tanaman_baca')
+def _csv_tanaman():
+    return lambda: pd.read_csv(model_tanaman.DATASET_PATH)
+
+
+@_daftar('model.pickle_rf_tanaman')
+def _pickle_tanaman():
+    def muat():
+        with open(model_tanaman.MODEL_PATH, 'rb') as file:
+            return pickle.load(file)
+    return muat
+
+
+@_daftar('model.joblib_rf_suhu')
+def _joblib_suhu():
+    import joblib
+
+    path = model_cuaca.path_model('suhu', 'rf')
+    return lambda: joblib.load(path)
+
+
+@_daftar('model.mesin_tanaman_mmap')
+def _mesin_tanaman():
+    model_tanaman.load_mesin()
+    path = model_tanaman.path_mesin(hash_file(model_tanaman.MODEL_PATH))
+    return lambda: muat_array(path)
+
+
+def _data_tanaman(n):
+    df = model_tanaman.load_dataset()
+    # Baris diambil ulang dengan pengembalian agar ukuran batch tidak dibatasi ukuran dataset
+    posisi = np.random.default_rng(0).integers(0, len(df), n)
+    return df[model_tanaman.FITUR_TANAMAN].to_numpy(dtype=float)[posisi]
+
+
+for _n in UKURAN_BATCH:
+    @_daftar(f'tanaman.prediksi[{_n}]', n_item=_n)
+    def _prediksi_tanaman(n=_n):
+        mesin = model_tanaman.load_mesin()
+        X = _data_tanaman(n)
+        return lambda: model_tanaman.prediksi(mesin, X)
+
+
+@_daftar('tanaman.rekomendasi_top3[1]', n_item=1)
+def _top3_tanaman():
+    mesin = model_tanaman.load_mesin()
+    X = _data_tanaman(1)
+    return lambda: model_tanaman.rekomendasi_top_k(mesin, X, k=3)
+
+
+for _hari in HORIZON:
+    @_daftar(f'peramalan.ramalkan_suhu[{_hari}]', n_item=_hari)
+    def _ramalkan(hari=_hari):
+        model = model_cuaca.load_artefak('suhu', 'rf')['model']
+        kondisi = model_cuaca.load_split('suhu')[1].iloc[-1]
+        tanggal_terakhir = data_cuaca.muat_data().index.max()
+        return lambda: peramalan.ramalkan(model, 'suhu', kondisi, tanggal_terakhir, hari)
+
+
+@_daftar('metrik.hitung_metrik_suhu')
+def _metrik_suhu():
+    y_test = model_cuaca.load_split('suhu')[3]
+    y_pred = model_cuaca.load_artefak('suhu', 'rf')['y_pred']
+    return lambda: model_cuaca.hitung_metrik(y_test, y_pred)
+
+
+@_daftar('metrik.hitung_evaluasi_suhu')
+def _evaluasi_suhu():
+    y_test = model_cuaca.load_split('suhu')[3]
+    y_pred = np.vstack([model_cuaca.load_artefak('suhu', kode)['y_pred'] for kode in model_cuaca.ALGORITMA])
+    return lambda: model_cuaca.hitung_evaluasi(y_test, y_pred)
+
+
+@_daftar('metrik.klasifikasi_tanaman')
+def _metrik_tanaman():
+    from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+
+    evaluasi = model_tanaman.load_evaluasi()
+    y_test, y_pred = np.asarray(evaluasi['y_test']), np.asarray(evaluasi['y_pred'])
+
+    def hitung():
+        accuracy_score(y_test, y_pred)
+        classification_report(y_test, y_pred, output_dict=True, zero_division=0)
+        confusion_matrix(y_test, y_pred)
+    return hitung
+
+
+@_daftar('grafik.pola_cuaca')
+def _grafik_pola():
+    import halaman_cuaca
+
+    stasiun = data_cuaca.STASIUN_UTAMA
+    data = data_cuaca.muat_data(stasiun).reset_index()
+    start_date, end_date = halaman_cuaca.rentang_tanggal(data)
+
+    def buat():
+        # Cache dikosongkan agar yang diukur adalah pembuatan figure, bukan cache hit
+        grafik.kosongkan_cache()
+        for pola in halaman_cuaca.POLA_CUACA:
+            halaman_cuaca.figur_pola_cuaca(data, stasiun, pola, start_date, end_date)
+    return buat
+
+
+@_daftar('grafik.evaluasi_suhu')
+def _grafik_evaluasi():
+    import halaman_cuaca
+
+    halaman_cuaca.figur_evaluasi('suhu', data_cuaca.STASIUN_UTAMA)
+
+    def buat():
+        grafik.kosongkan_cache()
+        halaman_cuaca.figur_evaluasi('suhu', data_cuaca.STASIUN_UTAMA)
+    return buat
+
+
+@_daftar('grafik.splom_tanaman')
+def _grafik_splom():
+    df = model_tanaman.load_dataset()
+    return lambda: grafik.splom(df, model_tanaman.FITUR_SEBARAN_DEFAULT, 'label').to_json()
+
+
+def ukur(fungsi, ulang=5):
+    """
+    Mengukur durasi per pemanggilan `fungsi`.
+
+    Returns:
+        Dictionary berisi median_s, min_s, mean_s, stdev_s, jumlah (pemanggilan per sampel) dan ulang
+    """
+    # Pemanggilan pertama (import, cache dingin) tidak ikut menentukan jumlah pemanggilan per sampel
+    fungsi()
+    timer = timeit.Timer(fungsi)
+    jumlah, _ = timer.autorange()
+    sampel = [t / jumlah for t in timer.repeat(ulang, jumlah)]
+    return {
+        'median_s': statistics.median(sampel),
+        'min_s': min(sampel),
+        'mean_s': statistics.fmean(sampel),
+        'stdev_s': statistics.stdev(sampel) if len(sampel) > 1 else 0.0,
+        'jumlah': jumlah,
+        'ulang': ulang,
+    }
+
+
+def jalankan(nama_benchmark=None, ulang=5, progres=None):
+    """
+    Menjalankan benchmark.
+
+    Args:
+        nama_benchmark: Daftar nama benchmark; default semua
+        ulang: Jumlah sampel per benchmark
+        progres: Fungsi opsional yang dipanggil dengan (nama, hasil) setelah setiap benchmark
+    Returns:
+        Dictionary nama -> hasil `ukur` ditambah n_item dan throughput_per_s; benchmark yang
+        gagal berisi 'galat'
+    """
+    hasil = {}
+    for nama in nama_benchmark or BENCHMARK:
+        persiapan, n_item = BENCHMARK[nama]
+        try:
+            hasil[nama] = ukur(persiapan(), ulang)
+        except Exception as e:
+            hasil[nama] = {'galat': repr(e)}
+        else:
+            hasil[nama]['n_item'] = n_item
+            hasil[nama]['throughput_per_s'] = n_item / hasil[nama]['median_s'] if n_item else None
+        if progres:
+            progres(nama, hasil[nama])
+    return hasil
+
+
+def _git(*args):
+    return subprocess.run(['git', *args], cwd=BASE_DIR, capture_output=True, text=True, check=True).stdout.strip()
+
+
+def id_commit(ref='HEAD', working_tree=False):
+    """
+    Hash commit untuk `ref`. Dengan `working_tree=True`, hash HEAD diberi akhiran "-kotor" jika
+    working tree berisi perubahan, sehingga hasilnya tidak menimpa hasil commit yang bersih.
+    """
+    commit = _git('rev-parse', ref)
+    if working_tree and _git('status', '--porcelain', '--untracked-files=no'):
+        commit += '-kotor'
+    return commit
+
+
+def path_hasil(commit):
+    return os.path.join(BENCHMARK_DIR, f'{commit}.json')
+
+
+def _lingkungan():
+    import sklearn
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'sklearn': sklearn.__version__,
+    }
+
+
+def simpan(hasil, commit):
+    """
+    Menyimpan hasil ke file commit; hasil benchmark lain yang sudah tersimpan untuk commit yang sama dipertahankan.
+
+    Returns:
+        Path file hasil
+    """
+    path = path_hasil(commit)
+    lama = muat(path) if os.path.exists(path) else {'hasil': {}}
+    os.makedirs(BENCHMARK_DIR, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump({
+            'commit': commit,
+            'waktu': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'lingkungan': _lingkungan(),
+            'hasil': {**lama['hasil'], **hasil},
+        }, file, indent=2)
+    return path
+
+
+def muat(ref):
+    """
+    Memuat hasil tersimpan dari path file JSON atau referensi git (commit, branch, HEAD~1).
+
+    Raises:
+        FileNotFoundError: Jika belum ada hasil untuk referensi tersebut
+    """
+    path = ref if ref.endswith('.json') else path_hasil(id_commit(ref))
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def bandingkan(dasar, baru, ambang=AMBANG):
+    """
+    Membandingkan median dua hasil benchmark, untuk setiap benchmark yang ada di `baru`.
+
+    Returns:
+        List dictionary per benchmark berisi nama, median dasar dan baru (detik), rasio baru/dasar
+        dan status: 'lebih lambat', 'lebih cepat', 'sama', 'baru' (tidak ada di dasar) atau 'gagal'
+    """
+    baris = []
+    for nama, hasil in baru['hasil'].items():
+        a = dasar['hasil'].get(nama, {}).get('median_s')
+        b = hasil.get('median_s')
+        if b is None:
+            status, rasio = 'gagal', None
+        elif a is None:
+            status, rasio = 'baru', None
+        else:
+            rasio = b / a
+            status = 'lebih lambat' if rasio > 1 + ambang else 'lebih cepat' if rasio < 1 - ambang else 'sama'
+        baris.append({'nama': nama, 'dasar_s': a, 'baru_s': b, 'rasio': rasio, 'status': status})
+    return baris
+
+
+def _format_durasi(detik):
+    if detik is None:
+        return '-'
+    for satuan, skala in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+        if detik >= skala:
+            return f'{detik / skala:.3g} {satuan}'
+    return f'{detik / 1e-9:.3g} ns'
+
+
+def laporan(baris, dasar, baru):
+    """
+    Laporan perbandingan dalam format tabel Markdown.
+    """
+    isi = [
+        f"Dasar: {dasar['commit']} ({dasar['waktu']})",
+        f"Baru:  {baru['commit']} ({baru['waktu']})",
+        '',
+        '| Benchmark | Dasar | Baru | Rasio | Status |',
+        '|---|---:|---:|---:|---|',
+    ]
+    for b in baris:
+        rasio = '-' if b['rasio'] is None else f"{b['rasio']:.2f}x"
+        isi.append(f"| {b['nama']} | {_format_durasi(b['dasar_s'])} | {_format_durasi(b['baru_s'])} | {rasio} | {b['status']} |")
+    return '\n'.join(isi)
+
+
+def _cetak_hasil(nama, hasil):
+    if 'galat' in hasil:
+        print(f"{nama:<34} GAGAL {hasil['galat']}", file=sys.stderr)
+        return
+    throughput = f"  {hasil['throughput_per_s']:,.0f} item/s" if hasil['throughput_per_s'] else ''
+    print(
+        f"{nama:<34} {_format_durasi(hasil['median_s']):>10} ± {_format_durasi(hasil['stdev_s']):<10}"
+        f" ({hasil['ulang']}x{hasil['jumlah']}){throughput}",
+        file=sys.stderr
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark jalur panas aplikasi dan perbandingan antar commit.")
+    parser.add_argument('--pilih', nargs='+', help="Hanya benchmark yang namanya memuat salah satu kata ini")
+    parser.add_argument('--ulang', type=int, default=5, help="Jumlah sampel per benchmark (default 5)")
+    parser.add_argument('--dasar', default='HEAD~1', help="Referensi git atau file JSON pembanding (default HEAD~1)")
+    parser.add_argument('--bandingkan', nargs='+', metavar='REF', help="Hanya membandingkan hasil tersimpan: DASAR [BARU]")
+    parser.add_argument('--ambang', type=float, default=AMBANG, help="Selisih relatif median yang dilaporkan (default 0.10)")
+    parser.add_argument('--laporan', help="Tulis laporan perbandingan Markdown ke file ini")
+    parser.add_argument('--ketat', action='store_true', help="Keluar dengan kode 1 jika ada benchmark yang melambat")
+    parser.add_argument('--daftar', action='store_true', help="Tampilkan nama semua benchmark lalu keluar")
+    args = parser.parse_args()
+
+    if args.daftar:
+        print('\n'.join(BENCHMARK))
+        return 0
+
+    if args.bandingkan:
+        dasar, baru = muat(args.bandingkan[0]), muat(args.bandingkan[1] if len(args.bandingkan) > 1 else 'HEAD')
+    else:
+        nama = [n for n in BENCHMARK if not args.pilih or any(kata in n for kata in args.pilih)]
+        commit = id_commit(working_tree=True)
+        print(f"Menjalankan {len(nama)} benchmark untuk {commit}", file=sys.stderr)
+        path = simpan(jalankan(nama, args.ulang, _cetak_hasil), commit)
+        print(f"Hasil disimpan di {path}", file=sys.stderr)
+        baru = muat(path)
+        try:
+            dasar = muat(args.dasar)
+        except (FileNotFoundError, subprocess.CalledProcessError):
+            print(f"Belum ada hasil untuk {args.dasar}; perbandingan dilewati.", file=sys.stderr)
+            return 0
+
+    baris = bandingkan(dasar, baru, args.ambang)
+    isi = laporan(baris, dasar, baru)
+    print(isi)
+    if args.laporan:
+        with open(args.laporan, 'w', encoding='utf-8') as file:
+            file.write(isi + '\n')
+    if args.ketat and any(b['status'] == 'lebih lambat' for b in baris):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
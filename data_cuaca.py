@@ -0,0 +1,437 @@
+"""
+Lapisan data bersama untuk data time series cuaca harian per stasiun.
+
+Pembersihan (konversi TN/RR, parsing TANGGAL, penggantian 8888/9999 dan interpolasi)
+dilakukan sekali. Hasilnya disimpan per kolom sebagai `.npy` float32 di partisi cache
+stasiun lalu dibuka memory-mapped, sehingga perpindahan halaman tidak mem-parsing CSV lagi dan
+semua halaman melihat data bersih yang sama.
+
+Stasiun menambahkan satu baris per hari di akhir file. Jika file hanya bertambah di
+belakang (dicek lewat offset byte, hash isi yang sudah dibaca dan TANGGAL terakhir),
+hanya baris baru yang di-parse, dibersihkan dan ditulis ke cache bersama fitur
+lag/rolling turunannya. Perubahan lain pada file memicu pembersihan ulang penuh.
+
+Setiap stasiun memiliki file CSV sendiri (stasiun utama di Dataset/dataset time series.csv,
+stasiun lain di Dataset/stasiun/<ID>.csv) dan partisi cache sendiri di Cache/stasiun/<ID>/.
+Membuka satu stasiun hanya menyentuh file dan partisi stasiun tersebut, dan cache per proses
+dibatasi (LRU) sehingga memori tidak bertambah dengan jumlah stasiun.
+
+Membuat cache secara offline (semua stasiun, atau ID tertentu):
+    python data_cuaca.py [ID_STASIUN ...]
+"""
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from artefak import (
+    BASE_DIR, STASIUN_UTAMA, ambil_cache_lru, folder_stasiun, hash_file, hash_isi, kunci_file, muat_array,
+    simpan_array, simpan_meta, tulis_baris_array, validasi_stasiun
+)
+import fitur_cuaca
+from fitur_cuaca import FITUR_WAKTU, JENDELA_ROLLING, VARIABEL_CUACA
+import instrumentasi
+
+PATH_DATASET = os.path.join(BASE_DIR, 'Dataset', 'dataset time series.csv')
+
+# Stasiun lain: satu file CSV per stasiun dengan format kolom yang sama, Dataset/stasiun/<ID>.csv
+DIR_STASIUN = os.path.join(BASE_DIR, 'Dataset', 'stasiun')
+
+# Kolom arah angin bertipe kategori dan tidak dipakai halaman mana pun
+KOLOM_DIBUANG = ['DDD_CAR', 'DDD_X']
+
+# Kolom yang di beberapa baris berisi teks dan perlu dikonversi ke numerik
+KOLOM_NUMERIK_PAKSA = ['TN', 'RR']
+
+# Kode BMKG untuk data tidak terukur (8888) dan tidak ada data (9999)
+NILAI_KOSONG = [8888, 9999]
+
+# Nama kolom yang lebih deskriptif
+NAMA_KOLOM = {
+    'TANGGAL': 'Tanggal',
+    'TN': 'Suhu_Minimum',
+    'TX': 'Suhu_Maksimum',
+    'RH_AVG': 'Kelembaban_Rata_Rata',
+    'RR': 'Curah_Hujan',
+    'SS': 'Sinar_Matahari',
+    'FF_X': 'Kecepatan_Angin_Max',
+    'FF_AVG': 'Kecepatan_Angin_Rata_Rata',
+    'TAVG': 'Suhu_Rata_Rata',
+}
+
+# Kolom data bersih -> nama variabel pada fitur model (Split_Data)
+KOLOM_MODEL = {
+    'Suhu_Rata_Rata': 'Suhu_Rata-Rata',
+    'Kelembaban_Rata_Rata': 'Kelembapan_Rata-Rata',
+    'Curah_Hujan': 'Curah_Hujan',
+    'Sinar_Matahari': 'Sinar_Matahari',
+}
+
+_cache = OrderedDict()
+_lock = threading.RLock()
+
+
+def _ambil_cache(kunci, pembuat):
+    with _lock:
+        return ambil_cache_lru(_cache, kunci, pembuat)
+
+
+def path_dataset(stasiun=STASIUN_UTAMA):
+    if stasiun == STASIUN_UTAMA:
+        return PATH_DATASET
+    return os.path.join(DIR_STASIUN, f'{validasi_stasiun(stasiun)}.csv')
+
+
+def folder_data(stasiun=STASIUN_UTAMA):
+    return os.path.join(folder_stasiun(stasiun), 'data_cuaca')
+
+
+def daftar_stasiun():
+    """
+    Daftar ID stasiun yang memiliki file data. Hanya nama file yang dibaca,
+    bukan isinya, sehingga tetap cepat untuk ribuan stasiun.
+    """
+    stasiun = [STASIUN_UTAMA] if os.path.exists(PATH_DATASET) else []
+    if os.path.isdir(DIR_STASIUN):
+        with os.scandir(DIR_STASIUN) as isi:
+            stasiun += sorted(
+                nama[:-4] for nama in (entri.name for entri in isi)
+                if nama.endswith('.csv') and nama[:-4] != STASIUN_UTAMA
+            )
+    return stasiun
+
+
+def _bersihkan_mentah(data):
+    """
+    Tahap pembersihan sebelum interpolasi: nilai kosong masih NaN, dtype float64.
+    """
+    data = data.drop(columns=KOLOM_DIBUANG, errors='ignore')
+    for kolom in KOLOM_NUMERIK_PAKSA:
+        data[kolom] = pd.to_numeric(data[kolom], errors='coerce')
+    data['TANGGAL'] = pd.to_datetime(data['TANGGAL'], format='%d-%m-%Y')
+    data = data.rename(columns=NAMA_KOLOM).set_index('Tanggal')
+    return data.astype(float).replace({nilai: np.nan for nilai in NILAI_KOSONG})
+
+
+def bersihkan_data(data):
+    """
+    Membersihkan DataFrame mentah dari file CSV.
+
+    Args:
+        data: DataFrame hasil pd.read_csv dengan kolom asli (TANGGAL, TN, TX, ...)
+    Returns:
+        DataFrame ber-index 'Tanggal' (datetime) dengan kolom numerik float32
+    """
+    # Interpolasi dihitung dalam float64, baru disimpan sebagai float32
+    return _bersihkan_mentah(data).interpolate(method='linear').astype(np.float32)
+
+
+def hitung_fitur_turunan(nilai):
+    """
+    Menghitung fitur lag 1 hari dan rata-rata bergulir 3 hari seperti pada Split_Data.
+
+    Args:
+        nilai: Dictionary nama variabel model -> array nilai harian berurutan
+    Returns:
+        Dictionary nama fitur -> array float32 sepanjang input (baris awal tanpa histori berisi NaN)
+    """
+    matriks = np.column_stack(list(nilai.values()))
+    fitur = fitur_cuaca.kolom_fitur(matriks, list(nilai))
+    return {nama: kolom.astype(np.float32) for nama, kolom in fitur.items()}
+
+
+def _valid_terakhir(mentah, offset_baris=0, sebelumnya=None):
+    """
+    Posisi dan nilai (float64, sebelum interpolasi) pengamatan valid terakhir per kolom,
+    dipakai sebagai jangkar interpolasi untuk baris yang ditambahkan kemudian.
+    """
+    hasil = dict(sebelumnya or {})
+    for kolom in mentah.columns:
+        nilai = mentah[kolom].to_numpy()
+        valid = np.flatnonzero(~np.isnan(nilai))
+        if valid.size:
+            hasil[kolom] = [int(offset_baris + valid[-1]), float(nilai[valid[-1]])]
+        else:
+            hasil.setdefault(kolom, None)
+    return hasil
+
+
+@instrumentasi.terukur
+def ekspor_data(stasiun=STASIUN_UTAMA):
+    """
+    Membaca dan membersihkan seluruh file CSV satu stasiun lalu menyimpannya ke partisi stasiun tersebut.
+    Folder data tidak berversi dan diganti di tempat, sehingga pemanggil memegang `kunci_file` folder tersebut.
+
+    Returns:
+        Path folder data
+    """
+    with open(path_dataset(stasiun), 'rb') as file:
+        isi = file.read()
+    mentah = _bersihkan_mentah(pd.read_csv(io.BytesIO(isi)))
+    data = mentah.interpolate(method='linear').astype(np.float32)
+
+    arrays = {'Tanggal': data.index.to_numpy(dtype='datetime64[ns]')}
+    arrays.update({kolom: data[kolom].to_numpy() for kolom in data.columns})
+    fitur = hitung_fitur_turunan({KOLOM_MODEL[kolom]: data[kolom].to_numpy() for kolom in KOLOM_MODEL})
+    arrays.update(fitur)
+
+    folder = folder_data(stasiun)
+    simpan_array(folder, arrays, ganti=True, meta={
+        'versi': hash_isi(isi),
+        'kolom': list(data.columns),
+        'kolom_fitur': list(fitur),
+        'kolom_csv': list(pd.read_csv(io.BytesIO(isi), nrows=0).columns),
+        'n_baris': len(data),
+        'offset_byte': len(isi),
+        'akhir_baris_baru': isi.endswith(b'\n'),
+        'hash_awal': hash_isi(isi),
+        'tanggal_terakhir': str(data.index[-1]) if len(data) else None,
+        'valid_terakhir': _valid_terakhir(mentah),
+    })
+    return folder
+
+
+def perbarui_data(meta, stasiun=STASIUN_UTAMA):
+    """
+    Menambahkan baris baru di akhir file CSV ke cache tanpa membaca ulang isi lama.
+    Biaya parsing, pembersihan dan penulisan sebanding dengan jumlah baris baru
+    (ditambah celah nilai kosong di ujung data lama yang perlu diinterpolasi ulang).
+
+    Args:
+        meta: Isi meta.json cache saat ini
+        stasiun: ID stasiun
+    Returns:
+        True jika cache berhasil diperbarui, False jika file berubah selain penambahan
+        baris di akhir sehingga perlu pembersihan ulang penuh
+    """
+    # Isi lama dicocokkan lewat hash (tanpa parsing) untuk mendeteksi perubahan selain penambahan
+    folder = folder_data(stasiun)
+    with open(path_dataset(stasiun), 'rb') as file:
+        isi = file.read()
+    offset = meta['offset_byte']
+    if len(isi) < offset or hash_isi(isi[:offset]) != meta['hash_awal']:
+        return False
+    ekor = isi[offset:]
+
+    # Hanya baris lengkap (diakhiri newline) yang dibaca; sisa baris yang sedang ditulis menunggu pembaruan berikutnya
+    if not meta['akhir_baris_baru'] and ekor and not ekor.startswith(b'\n'):
+        return False
+    ekor = ekor[:ekor.rfind(b'\n') + 1]
+    meta = dict(meta, versi=hash_isi(isi))
+    if not ekor.strip():
+        simpan_meta(folder, meta)
+        return True
+
+    mentah_baru = _bersihkan_mentah(pd.read_csv(io.BytesIO(ekor), header=None, names=meta['kolom_csv']))
+    tanggal_baru = mentah_baru.index
+    if (
+        meta['tanggal_terakhir'] is not None and tanggal_baru[0] <= pd.Timestamp(meta['tanggal_terakhir'])
+    ) or not tanggal_baru.is_monotonic_increasing:
+        return False
+
+    arrays, _ = muat_array(folder)
+    n_lama = meta['n_baris']
+
+    # Interpolasi ulang dari pengamatan valid terakhir setiap kolom: baris di ujung data lama
+    # yang sebelumnya kosong mungkin kini diapit nilai valid baru
+    kolom_baru, awal_ubah = {}, n_lama
+    for kolom in meta['kolom']:
+        jangkar = meta['valid_terakhir'][kolom]
+        awal_kolom = 0 if jangkar is None else jangkar[0]
+        segmen = np.full(n_lama - awal_kolom, np.nan)
+        if jangkar is not None:
+            segmen[0] = jangkar[1]
+        segmen = np.concatenate([segmen, mentah_baru[kolom].to_numpy()])
+        terisi = pd.Series(segmen).interpolate(method='linear').to_numpy().astype(np.float32)
+        if jangkar is not None:
+            terisi, awal_kolom = terisi[1:], awal_kolom + 1
+        kolom_baru[kolom] = (awal_kolom, terisi)
+        awal_ubah = min(awal_ubah, awal_kolom)
+
+    tulis = {}
+    for kolom, (awal_kolom, terisi) in kolom_baru.items():
+        tulis[kolom] = np.concatenate([arrays[kolom][awal_ubah:awal_kolom], terisi])
+
+    # Fitur turunan baris yang berubah membutuhkan histori beberapa hari sebelumnya
+    awal_histori = max(0, awal_ubah - (JENDELA_ROLLING - 1))
+    fitur = hitung_fitur_turunan({
+        KOLOM_MODEL[kolom]: np.concatenate([arrays[kolom][awal_histori:awal_ubah], tulis[kolom]])
+        for kolom in KOLOM_MODEL
+    })
+    tulis.update({nama: nilai[awal_ubah - awal_histori:] for nama, nilai in fitur.items()})
+    del arrays
+
+    if tulis_baris_array(folder, tulis, awal_ubah) is None:
+        return False
+    if tulis_baris_array(folder, {'Tanggal': tanggal_baru.to_numpy(dtype='datetime64[ns]')}, n_lama) is None:
+        return False
+
+    offset += len(ekor)
+    meta.update({
+        'n_baris': n_lama + len(mentah_baru),
+        'offset_byte': offset,
+        'akhir_baris_baru': True,
+        'hash_awal': hash_isi(isi[:offset]),
+        'tanggal_terakhir': str(tanggal_baru[-1]),
+        'valid_terakhir': _valid_terakhir(mentah_baru, n_lama, meta['valid_terakhir']),
+    })
+    simpan_meta(folder, meta)
+    return True
+
+
+def _buka_cache(stasiun, versi):
+    """
+    Membuka cache data untuk versi file CSV saat ini; memperbarui secara inkremental
+    atau membuat ulang cache jika perlu.
+    """
+    folder = folder_data(stasiun)
+    bundel = muat_array(folder)
+    if bundel is not None and bundel[1]['versi'] == versi:
+        return bundel
+
+    with kunci_file(folder + '.lock'):
+        # Proses lain mungkin sudah memperbarui cache selagi menunggu kunci
+        bundel = muat_array(folder)
+        if bundel is not None and bundel[1]['versi'] == versi:
+            return bundel
+        if bundel is None or not perbarui_data(bundel[1], stasiun):
+            ekspor_data(stasiun)
+        # Dibuka selagi memegang kunci agar tidak bertepatan dengan penggantian folder oleh proses lain
+        return muat_array(folder)
+
+
+def _muat_arrays(stasiun):
+    versi = hash_file(path_dataset(stasiun))
+
+    def muat():
+        arrays, meta = _buka_cache(stasiun, versi)
+        if any(len(array) != meta['n_baris'] for array in arrays.values()):
+            # Pembaruan sebelumnya terhenti di tengah jalan
+            with kunci_file(folder_data(stasiun) + '.lock'):
+                ekspor_data(stasiun)
+                arrays, meta = muat_array(folder_data(stasiun))
+        return {nama: np.asarray(array) for nama, array in arrays.items()}, meta
+    return _ambil_cache(('arrays', stasiun, versi), muat)
+
+
+def versi_data(stasiun=STASIUN_UTAMA):
+    """
+    Versi data bersih stasiun saat ini (hash isi file CSV), untuk kunci cache turunan.
+    """
+    return _muat_arrays(stasiun)[1]['versi']
+
+
+@instrumentasi.terukur
+def muat_data(stasiun=STASIUN_UTAMA):
+    """
+    Memuat data cuaca bersih satu stasiun, sekali per versi file CSV. Hanya partisi
+    stasiun tersebut yang dibuka.
+
+    DataFrame yang dikembalikan dipakai bersama; halaman yang ingin menambah kolom
+    sebaiknya bekerja pada salinan (misalnya hasil `reset_index()`).
+
+    Returns:
+        DataFrame ber-index 'Tanggal' dengan kolom float32 yang menunjuk ke halaman memmap
+    """
+    arrays, meta = _muat_arrays(stasiun)
+
+    def muat():
+        index = pd.DatetimeIndex(arrays['Tanggal'], name='Tanggal')
+        # copy=False agar setiap kolom tetap berupa view atas file .npy
+        return pd.DataFrame({kolom: arrays[kolom] for kolom in meta['kolom']}, index=index, copy=False)
+    return _ambil_cache(('data', stasiun, meta['versi']), muat)
+
+
+@instrumentasi.terukur
+def muat_fitur(stasiun=STASIUN_UTAMA):
+    """
+    Memuat matriks fitur model (variabel dasar, lag, rolling dan fitur waktu) untuk
+    seluruh histori, dengan nama kolom seperti pada Split_Data.
+
+    Returns:
+        DataFrame ber-index 'Tanggal'; dua baris pertama tidak memiliki fitur rolling (NaN)
+    """
+    arrays, meta = _muat_arrays(stasiun)
+
+    def muat():
+        index = pd.DatetimeIndex(arrays['Tanggal'], name='Tanggal')
+        kolom_data = {model: kolom for kolom, model in KOLOM_MODEL.items()}
+        data = {variabel: arrays[kolom_data[variabel]] for variabel in VARIABEL_CUACA}
+        data.update({nama: arrays[nama] for nama in meta['kolom_fitur']})
+        data.update(zip(FITUR_WAKTU, (index.dayofweek, index.month, index.year)))
+        return pd.DataFrame(data, index=index, copy=False)
+    return _ambil_cache(('fitur', stasiun, meta['versi']), muat)
+
+
+def data_latih(target, stasiun=STASIUN_UTAMA):
+    """
+    Menyusun data latih (X, y) untuk target dari seluruh histori data bersih, dengan kolom
+    fitur sama seperti Split_Data. Baris tanpa histori lag/rolling lengkap dibuang.
+
+    Args:
+        target: Kunci target pada TARGET_CUACA
+        stasiun: ID stasiun
+    Returns:
+        Tuple (X DataFrame, y Series) ber-index tanggal
+    """
+    fitur = muat_fitur(stasiun)
+    kolom = fitur_cuaca.fitur_target(target)
+    lengkap = fitur[kolom].notna().all(axis=1).to_numpy()
+    kolom_target = fitur_cuaca.TARGET_CUACA[target]['kolom']
+    return fitur.loc[lengkap, kolom], fitur.loc[lengkap, kolom_target]
+
+
+def pecah_per_stasiun(path_gabungan, kolom_stasiun='ID_STASIUN', ukuran_chunk=100_000):
+    """
+    Memecah file CSV gabungan banyak stasiun menjadi Dataset/stasiun/<ID>.csv. File dibaca
+    per chunk sehingga memori tidak bergantung pada ukuran file. Setiap file stasiun ditulis
+    ulang utuh (ke file sementara lalu `os.replace`), sehingga menjalankan pemecahan dua kali
+    tidak menggandakan baris; file baru yang diawali isi lama tetap dapat diperbarui
+    inkremental oleh cache data.
+
+    Args:
+        path_gabungan: File CSV berkolom `kolom_stasiun` ditambah kolom asli (TANGGAL, TN, ...)
+        kolom_stasiun: Nama kolom ID stasiun
+        ukuran_chunk: Jumlah baris per chunk
+    Returns:
+        Daftar ID stasiun yang ditulis
+    Raises:
+        ValueError: Jika ada ID stasiun tidak valid atau sama dengan STASIUN_UTAMA, yang datanya
+            adalah Dataset/dataset time series.csv dan tidak ditulis oleh fungsi ini. Tidak ada
+            file stasiun yang diganti jika terjadi galat
+    """
+    os.makedirs(DIR_STASIUN, exist_ok=True)
+    sementara = {}
+    try:
+        for chunk in pd.read_csv(path_gabungan, chunksize=ukuran_chunk, dtype={kolom_stasiun: str}):
+            for stasiun, baris in chunk.groupby(kolom_stasiun, sort=False):
+                stasiun = validasi_stasiun(str(stasiun))
+                if stasiun == STASIUN_UTAMA:
+                    raise ValueError(
+                        f"ID stasiun {STASIUN_UTAMA!r} dipakai oleh dataset utama dan tidak dapat dipecah dari {path_gabungan}"
+                    )
+                baru = stasiun not in sementara
+                if baru:
+                    sementara[stasiun] = f"{path_dataset(stasiun)}.tmp-{os.getpid()}"
+                baris.drop(columns=kolom_stasiun).to_csv(
+                    sementara[stasiun], mode='w' if baru else 'a', header=baru, index=False
+                )
+        for stasiun, path in sementara.items():
+            os.replace(path, path_dataset(stasiun))
+    finally:
+        for path in sementara.values():
+            if os.path.exists(path):
+                os.remove(path)
+    return sorted(sementara)
+
+
+if __name__ == '__main__':
+    import sys
+
+    for stasiun in sys.argv[1:] or daftar_stasiun():
+        with kunci_file(folder_data(stasiun) + '.lock'):
+            folder = ekspor_data(stasiun)
+        print(f"Data cuaca bersih stasiun {stasiun} disimpan di {folder}")
@@ -0,0 +1,66 @@
+import time
+
+import pandas as pd
+import streamlit as st
+
+import instrumentasi
+import pemanasan
+
+# Halaman tersembunyi (tidak ada di menu navigasi); dibuka lewat URL /diagnostik
+st.markdown("<h1 style='text-align: center;'>🩺 Diagnostik Latensi</h1>", unsafe_allow_html=True)
+st.markdown(
+    f"<p style='text-align: center;'>Persentil per bagian dari {instrumentasi.KAPASITAS:,} catatan terakhir "
+    "proses ini (lihat instrumentasi.py)</p>",
+    unsafe_allow_html=True
+)
+
+lacak_memori = st.toggle(
+    "Lacak puncak memori",
+    value=instrumentasi.pelacakan_memori(),
+    help="Memakai tracemalloc; rerun semua halaman menjadi beberapa kali lebih lambat selama aktif"
+)
+if lacak_memori != instrumentasi.pelacakan_memori():
+    instrumentasi.atur_pelacakan_memori(lacak_memori)
+
+# Bagian di luar rerun halaman (misalnya pemanasan.py) tidak memiliki halaman
+LATAR_BELAKANG = '(latar belakang)'
+catatan = [{**c, 'halaman': c['halaman'] or LATAR_BELAKANG} for c in instrumentasi.catatan()]
+kol_halaman, kol_metrik = st.columns(2)
+with kol_halaman:
+    daftar_halaman = sorted({c['halaman'] for c in catatan})
+    pilihan = st.multiselect("Halaman", daftar_halaman, default=daftar_halaman)
+with kol_metrik:
+    metrik = st.radio("Metrik", ['wall_ms', 'cpu_ms', 'puncak_kb'], horizontal=True)
+
+catatan = [c for c in catatan if c['halaman'] in pilihan]
+if catatan:
+    ringkasan = pd.DataFrame(instrumentasi.ringkasan(catatan))
+    kolom = ['halaman', 'bagian', 'n'] + [f'{metrik}_p{p}' for p in instrumentasi.PERSENTIL]
+    if metrik == 'wall_ms':
+        kolom.append('wall_ms_total')
+    st.dataframe(ringkasan[kolom].round(2), use_container_width=True, height=500)
+
+    with st.expander("Catatan terbaru"):
+        st.dataframe(pd.DataFrame(catatan[-500:][::-1]).round(2), use_container_width=True)
+else:
+    st.info("Belum ada catatan untuk halaman yang dipilih. Buka halaman lain terlebih dahulu.")
+
+kol_unduh, kol_hapus = st.columns(2)
+with kol_unduh:
+    st.download_button(
+        "⬇️ Ekspor JSON",
+        instrumentasi.ekspor_json(),
+        file_name=f"latensi_{time.strftime('%Y%m%d_%H%M%S')}.json",
+        mime='application/json'
+    )
+with kol_hapus:
+    if st.button("🗑️ Kosongkan Catatan"):
+        instrumentasi.kosongkan()
+        st.rerun()
+
+st.subheader("Status Pemanasan Cache")
+status = pemanasan.status()
+if status:
+    st.dataframe(pd.DataFrame.from_dict(status, orient='index').rename_axis('tugas'), use_container_width=True)
+else:
+    st.info("Pemanasan belum dimulai di proses ini.")
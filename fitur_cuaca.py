@@ -0,0 +1,161 @@
+"""
+Rekayasa fitur lag dan rata-rata bergulir untuk variabel cuaca harian.
+
+Modul yang sama dipakai untuk menyusun data latih (`buat_fitur` atas seluruh histori)
+dan untuk pembaruan state peramalan rekursif (`riwayat_awal` / `geser_riwayat`). Keduanya
+memakai jendela yang sama: lag-1 adalah nilai hari sebelumnya dan rolling-w adalah rata-rata
+w hari yang berakhir pada hari itu sendiri (seperti Split_Data). Satu-satunya perbedaan
+ada pada rolling variabel target saat peramalan: nilai target hari yang diramalkan belum
+diketahui, sehingga posisi itu diisi nilai target hari sebelumnya (persistensi).
+
+Semua operasi bekerja pada matriks (..., n_hari, n_variabel) sekaligus: dimensi depan dapat
+berupa stasiun, dan jendela bergulir diambil lewat view strided tanpa menyalin data.
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from model_cuaca import TARGET_CUACA
+
+# Variabel cuaca harian yang dipakai sebagai fitur dasar (selain target)
+VARIABEL_CUACA = ['Suhu_Rata-Rata', 'Kelembapan_Rata-Rata', 'Curah_Hujan', 'Sinar_Matahari']
+
+# Awalan nama fitur turunan setiap variabel
+AWALAN_FITUR = {
+    'Suhu_Rata-Rata': 'Suhu_Rata-Rata',
+    'Kelembapan_Rata-Rata': 'Kelembapan',
+    'Curah_Hujan': 'Hujan',
+    'Sinar_Matahari': 'Matahari',
+}
+
+FITUR_WAKTU = ['Hari', 'Bulan', 'Tahun']
+
+# Lag dan jendela yang dipakai model saat ini
+LAG = 1
+JENDELA_ROLLING = 3
+
+
+def nama_lag(variabel, k=LAG):
+    return f'{AWALAN_FITUR[variabel]}_{k}HariSebelum'
+
+
+def nama_rolling(variabel, w=JENDELA_ROLLING):
+    return f'{AWALAN_FITUR[variabel]}_Rolling{w}Hari'
+
+
+FITUR_LAG = {variabel: nama_lag(variabel) for variabel in VARIABEL_CUACA}
+FITUR_ROLLING = {variabel: nama_rolling(variabel) for variabel in VARIABEL_CUACA}
+
+
+def fitur_target(target):
+    """
+    Urutan kolom fitur model untuk target tertentu, sama dengan urutan pada Split_Data.
+    """
+    kolom_target = TARGET_CUACA[target]['kolom']
+    fitur_dasar = [kolom for kolom in VARIABEL_CUACA if kolom != kolom_target]
+    return (
+        fitur_dasar
+        + list(FITUR_LAG.values())
+        + list(FITUR_ROLLING.values())
+        + FITUR_WAKTU
+    )
+
+
+def rata_bergulir(jendela):
+    """
+    Rata-rata sepanjang sumbu terakhir (jendela waktu, urut kronologis). Penjumlahan
+    dilakukan berurutan per posisi jendela sehingga hasilnya identik bit demi bit baik
+    untuk view strided data latih maupun buffer state peramalan.
+    """
+    total = jendela[..., 0].astype(float)
+    for posisi in range(1, jendela.shape[-1]):
+        total += jendela[..., posisi]
+    return total / jendela.shape[-1]
+
+
+def buat_fitur(nilai, lag=(LAG,), jendela=(JENDELA_ROLLING,)):
+    """
+    Membangun semua fitur lag-k dan rata-rata bergulir-w untuk setiap variabel sekaligus.
+
+    Args:
+        nilai: Array (..., n_hari, n_variabel) berurutan menurut tanggal
+        lag: Daftar k untuk fitur nilai k hari sebelumnya
+        jendela: Daftar w untuk rata-rata w hari terakhir (termasuk hari itu sendiri)
+    Returns:
+        Dictionary (k atau w) -> array (..., n_hari, n_variabel); baris tanpa histori cukup berisi NaN
+    """
+    nilai = np.asarray(nilai, dtype=float)
+    n_hari = nilai.shape[-2]
+    hasil_lag, hasil_rolling = {}, {}
+    for k in lag:
+        matriks = np.full(nilai.shape, np.nan)
+        matriks[..., k:, :] = nilai[..., :n_hari - k, :]
+        hasil_lag[k] = matriks
+    for w in jendela:
+        matriks = np.full(nilai.shape, np.nan)
+        if n_hari >= w:
+            # View (..., n_hari - w + 1, n_variabel, w) tanpa salinan
+            matriks[..., w - 1:, :] = rata_bergulir(sliding_window_view(nilai, w, axis=-2))
+        hasil_rolling[w] = matriks
+    return hasil_lag, hasil_rolling
+
+
+def kolom_fitur(nilai, variabel=VARIABEL_CUACA, lag=(LAG,), jendela=(JENDELA_ROLLING,)):
+    """
+    Seperti `buat_fitur`, tetapi dikembalikan per nama kolom fitur (mis. 'Hujan_Rolling3Hari').
+
+    Args:
+        nilai: Array (..., n_hari, len(variabel))
+        variabel: Nama variabel untuk setiap kolom terakhir `nilai`
+    Returns:
+        Dictionary nama fitur -> array (..., n_hari) berupa view atas matriks hasil
+    """
+    hasil_lag, hasil_rolling = buat_fitur(nilai, lag, jendela)
+    hasil = {}
+    for k, matriks in hasil_lag.items():
+        hasil.update({nama_lag(v, k): matriks[..., j] for j, v in enumerate(variabel)})
+    for w, matriks in hasil_rolling.items():
+        hasil.update({nama_rolling(v, w): matriks[..., j] for j, v in enumerate(variabel)})
+    return hasil
+
+
+def riwayat_awal(nilai_lag, nilai_rolling, nilai_hari, w=JENDELA_ROLLING):
+    """
+    Menyusun buffer w hari yang berakhir pada hari pertama peramalan dari fitur kondisi
+    terkini hari itu. Posisi terakhir adalah nilai hari itu, sebelumnya nilai lag (hari
+    sebelumnya); hari-hari yang lebih awal diisi rata-rata yang membuat rata-rata buffer sama
+    dengan nilai rolling masukan.
+
+    Args:
+        nilai_lag: Array (..., n_variabel) nilai hari sebelum hari pertama
+        nilai_rolling: Array (..., n_variabel) rolling-w hari pertama (termasuk hari itu)
+        nilai_hari: Array (..., n_variabel) nilai hari pertama
+        w: Panjang jendela rolling, minimal 2
+    Returns:
+        Array (..., n_variabel, w) urut kronologis
+    """
+    nilai_lag = np.asarray(nilai_lag, dtype=float)
+    nilai_hari = np.asarray(nilai_hari, dtype=float)
+    riwayat = np.empty(nilai_lag.shape + (w,))
+    if w > 2:
+        sebelumnya = (w * np.asarray(nilai_rolling, dtype=float) - nilai_lag - nilai_hari) / (w - 2)
+        riwayat[..., :-2] = sebelumnya[..., np.newaxis]
+    riwayat[..., -2] = nilai_lag
+    riwayat[..., -1] = nilai_hari
+    return riwayat
+
+
+def geser_riwayat(riwayat, nilai_hari):
+    """
+    Memajukan buffer satu hari secara in-place dan mengembalikan fitur lag dan rolling hari
+    baru, sama dengan baris `buat_fitur` untuk hari tersebut.
+
+    Args:
+        riwayat: Array (..., n_variabel, w) dari `riwayat_awal`; posisi terakhir adalah hari
+            yang baru selesai diramalkan
+        nilai_hari: Array (..., n_variabel) nilai hari baru (untuk target: perkiraannya)
+    Returns:
+        Tuple (lag, rolling), masing-masing array (..., n_variabel)
+    """
+    riwayat[..., :-1] = riwayat[..., 1:]
+    riwayat[..., -1] = nilai_hari
+    return riwayat[..., -2], rata_bergulir(riwayat)
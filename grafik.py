@@ -0,0 +1,422 @@
+"""
+Penurunan jumlah titik (decimation) time series sebelum dikirim ke Plotly.
+
+Grafik garis hanya dapat menampilkan sekitar satu titik per piksel, sehingga data yang jauh
+lebih panjang dari lebar grafik diturunkan ke anggaran titik tetap: Largest-Triangle-Three-
+Buckets (LTTB) untuk mempertahankan bentuk kurva, atau min/max per bucket untuk
+mempertahankan puncak dan lembah. Ukuran payload grafik bergantung pada lebar grafik,
+bukan jumlah baris. Rentang tanggal yang lebih sempit menghasilkan bucket yang lebih kecil;
+begitu jumlah baris tidak melebihi anggaran, data dikirim dengan resolusi penuh.
+
+Figure yang sudah jadi disimpan dalam cache per proses dengan kunci (versi data, jenis
+grafik, parameter filter): Plotly sebagai dictionary spesifikasi (hasil parse JSON sekali saat
+dibangun) dan Matplotlib sebagai PNG. Rerun yang hanya mengubah widget lain memakai hasil
+tersebut tanpa membangun ulang figure. Cache dibatasi total ukuran byte (panjang JSON atau
+PNG) dan membuang entri yang paling lama tidak dipakai.
+"""
+import io
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+import instrumentasi
+from artefak import ambil_cache_lru
+
+# Perkiraan lebar area plot dalam piksel untuk grafik selebar kontainer
+LEBAR_GRAFIK = 1200
+
+# Batas total ukuran figure terserialisasi di cache per proses
+BATAS_MEMORI_FIGUR = 64 * 1024 * 1024
+
+# Jumlah titik maksimum scatter matrix WebGL; di atasnya baris diambil acak
+BATAS_TITIK_SPLOM = 100_000
+
+# Opsi savefig yang sama dengan st.pyplot
+_OPSI_PNG = {'format': 'png', 'dpi': 200, 'bbox_inches': 'tight'}
+
+# Jumlah titik grid biner untuk KDE berbasis FFT
+N_BIN_KDE = 2048
+
+_cache_figur = OrderedDict()
+_ukuran_cache = 0
+_cache_sebaran = OrderedDict()
+_lock = threading.Lock()
+
+
+def _indeks_lttb(x, y, n_titik):
+    n = len(y)
+    # Bucket bagian tengah; titik pertama dan terakhir selalu dipertahankan
+    tepi = np.linspace(1, n - 1, n_titik - 1).astype(np.int64)
+    # Rata-rata setiap bucket dihitung sekali lewat jumlah kumulatif
+    kumulatif_x = np.concatenate([[0.0], np.cumsum(x)])
+    kumulatif_y = np.concatenate([[0.0], np.cumsum(y)])
+    panjang = np.diff(tepi)
+    rata_x = (kumulatif_x[tepi[1:]] - kumulatif_x[tepi[:-1]]) / panjang
+    rata_y = (kumulatif_y[tepi[1:]] - kumulatif_y[tepi[:-1]]) / panjang
+    rata_x = np.append(rata_x[1:], x[-1])
+    rata_y = np.append(rata_y[1:], y[-1])
+
+    terpilih = np.empty(n_titik, dtype=np.int64)
+    terpilih[0], terpilih[-1] = 0, n - 1
+    a = 0
+    for i in range(n_titik - 2):
+        awal, akhir = tepi[i], tepi[i + 1]
+        # Luas segitiga (titik terpilih sebelumnya, kandidat, rata-rata bucket berikutnya)
+        luas = np.abs(
+            (x[a] - rata_x[i]) * (y[awal:akhir] - y[a])
+            - (x[a] - x[awal:akhir]) * (rata_y[i] - y[a])
+        )
+        a = awal + int(np.argmax(luas))
+        terpilih[i + 1] = a
+    return terpilih
+
+
+def _indeks_minmax(y, n_bucket):
+    n = len(y)
+    ukuran = -(-n // n_bucket)
+    n_bucket = -(-n // ukuran)
+    isi = np.full(n_bucket * ukuran, np.nan)
+    isi[:n] = y
+    matriks = isi.reshape(n_bucket, ukuran)
+    awal = np.arange(n_bucket) * ukuran
+    indeks_min = awal + np.argmin(np.where(np.isnan(matriks), np.inf, matriks), axis=1)
+    indeks_max = awal + np.argmax(np.where(np.isnan(matriks), -np.inf, matriks), axis=1)
+    # Pasangan min/max disusun kronologis agar garis tidak bolak-balik
+    return np.unique(np.concatenate([indeks_min, indeks_max]))
+
+
+def indeks_sampel(x, y, n_titik=LEBAR_GRAFIK, metode='lttb'):
+    """
+    Memilih indeks baris yang dipertahankan untuk digambar.
+
+    Args:
+        x: Nilai sumbu x berurutan (angka atau datetime64)
+        y: Nilai sumbu y
+        n_titik: Anggaran titik, biasanya sebanding dengan lebar grafik dalam piksel
+        metode: 'lttb' atau 'minmax' (dua titik per bucket, n_titik // 2 bucket)
+    Returns:
+        Array indeks terurut; seluruh indeks jika jumlah baris tidak melebihi anggaran
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= n_titik or n_titik < 3:
+        return np.arange(n)
+    if metode == 'minmax':
+        return _indeks_minmax(y, max(1, n_titik // 2))
+    if metode != 'lttb':
+        raise ValueError(f"Metode penurunan titik tidak dikenal: {metode!r}")
+
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype(np.int64)
+    # Digeser ke nol agar jumlah kumulatif timestamp nanodetik tetap presisi
+    x = (x - x[0]).astype(float)
+    # Titik kosong tidak ikut dinilai; indeks dikembalikan ke posisi baris asli
+    valid = np.flatnonzero(~np.isnan(y))
+    if len(valid) <= n_titik:
+        return valid
+    return valid[_indeks_lttb(x[valid], y[valid], n_titik)]
+
+
+@instrumentasi.terukur
+def sampel(data, kolom_x, kolom_y, n_titik=LEBAR_GRAFIK, metode='lttb'):
+    """
+    Baris DataFrame yang dipertahankan untuk grafik garis satu kolom y.
+
+    Args:
+        data: DataFrame terurut menurut `kolom_x`
+        kolom_x: Kolom sumbu x (mis. 'Tanggal')
+        kolom_y: Kolom yang digambar
+    Returns:
+        DataFrame berisi paling banyak sekitar `n_titik` baris
+    """
+    if len(data) <= n_titik:
+        return data
+    return data.iloc[indeks_sampel(data[kolom_x].to_numpy(), data[kolom_y].to_numpy(), n_titik, metode)]
+
+
+def kde_fft(nilai, n_grid=200, n_bin=N_BIN_KDE):
+    """
+    Kurva KDE Gaussian dengan bandwidth Scott (sama seperti seaborn/scipy), dihitung lewat
+    binning linear ke `n_bin` titik lalu konvolusi FFT dengan kernel Gaussian. Biayanya
+    O(n + n_bin log n_bin), tidak bergantung pada perkalian n x grid.
+
+    Args:
+        nilai: Array data 1D (NaN diabaikan)
+        n_grid: Jumlah titik kurva pada rentang [min, max] data
+        n_bin: Jumlah titik grid biner
+    Returns:
+        Tuple (x, densitas) atau None jika data kurang dari dua nilai berbeda
+    """
+    x = np.asarray(nilai, dtype=float)
+    x = x[np.isfinite(x)]
+    n = len(x)
+    if n < 2:
+        return None
+    h = x.std(ddof=1) * n ** (-1 / 5)
+    bawah, atas = x.min(), x.max()
+    if not h > 0 or not atas > bawah:
+        return None
+
+    # Grid diperlebar 4 bandwidth di kedua sisi agar ekor kernel tidak terpotong
+    awal = bawah - 4 * h
+    delta = (atas - bawah + 8 * h) / (n_bin - 1)
+    posisi = (x - awal) / delta
+    kiri = np.floor(posisi).astype(np.int64)
+    bobot = posisi - kiri
+    jumlah = (
+        np.bincount(kiri, weights=1 - bobot, minlength=n_bin + 1)
+        + np.bincount(kiri + 1, weights=bobot, minlength=n_bin + 1)
+    )[:n_bin]
+
+    radius = int(np.ceil(4 * h / delta))
+    offset = np.arange(-radius, radius + 1) * delta
+    kernel = np.exp(-0.5 * (offset / h) ** 2) / (h * np.sqrt(2 * np.pi))
+    panjang = 1 << int(np.ceil(np.log2(n_bin + 2 * radius + 1)))
+    konvolusi = np.fft.irfft(np.fft.rfft(jumlah, panjang) * np.fft.rfft(kernel, panjang), panjang)
+    densitas = konvolusi[radius:radius + n_bin] / n
+
+    grid = awal + np.arange(n_bin) * delta
+    dukungan = np.linspace(bawah, atas, n_grid)
+    return dukungan, np.maximum(np.interp(dukungan, grid, densitas), 0)
+
+
+def sebaran(nilai, bins=20, n_grid=200):
+    """
+    Histogram dan kurva KDE satu kolom, dalam satuan frekuensi seperti `sns.histplot(kde=True)`.
+
+    Returns:
+        Dictionary berisi 'frekuensi' (bins,), 'tepi' (bins + 1,), 'kde_x' dan 'kde_y'
+        (kosong jika KDE tidak terdefinisi)
+    """
+    x = np.asarray(nilai, dtype=float)
+    x = x[np.isfinite(x)]
+    frekuensi, tepi = np.histogram(x, bins=bins)
+    kde = kde_fft(x, n_grid)
+    if kde is None:
+        kde_x = kde_y = np.empty(0)
+    else:
+        # Densitas diskalakan ke frekuensi per bin
+        kde_x, kde_y = kde[0], kde[1] * len(x) * (tepi[1] - tepi[0])
+    return {'frekuensi': frekuensi, 'tepi': tepi, 'kde_x': kde_x, 'kde_y': kde_y}
+
+
+@instrumentasi.terukur
+def sebaran_tersimpan(kunci, nilai, bins=20):
+    """
+    Seperti `sebaran`, tetapi dihitung sekali per kunci (versi data, filter, kolom).
+    """
+    kunci = (tuple(kunci), bins)
+    with _lock:
+        if kunci in _cache_sebaran:
+            _cache_sebaran.move_to_end(kunci)
+            return _cache_sebaran[kunci]
+
+    # KDE dihitung di luar lock figure agar sesi lain tidak menunggu; jika dua sesi menghitung
+    # kunci yang sama bersamaan, hasil yang pertama disimpan yang dipakai keduanya
+    hasil = sebaran(nilai, bins)
+    with _lock:
+        return ambil_cache_lru(_cache_sebaran, kunci, lambda: hasil, batas=256)
+
+
+@instrumentasi.terukur
+def splom(data, variabel, kolom_warna, tinggi=None, batas_titik=BATAS_TITIK_SPLOM):
+    """
+    Scatter matrix segitiga bawah (seperti `sns.pairplot(corner=True)`) memakai trace
+    Plotly Splom yang dirender dengan WebGL, satu trace per nilai `kolom_warna`.
+
+    Args:
+        data: DataFrame sumber
+        variabel: Kolom numerik yang dibandingkan
+        kolom_warna: Kolom kategori untuk warna dan legenda (mis. 'label')
+        tinggi: Tinggi figure dalam piksel
+        batas_titik: Jumlah baris maksimum; data yang lebih besar diambil acak sebanyak ini
+    Returns:
+        plotly Figure
+    """
+    import plotly.graph_objects as go
+    from plotly.colors import qualitative
+
+    if len(data) > batas_titik:
+        # Sampel acak seragam mempertahankan proporsi setiap kategori
+        data = data.iloc[np.sort(np.random.default_rng(42).choice(len(data), batas_titik, replace=False))]
+
+    kategori, kode = np.unique(data[kolom_warna].to_numpy(dtype=str), return_inverse=True)
+    # Baris dikelompokkan per kategori sekali; setiap trace memakai potongan bersebelahan
+    urutan = np.argsort(kode, kind='stable')
+    batas = np.searchsorted(kode[urutan], np.arange(len(kategori) + 1))
+    # float32 memperkecil payload biner Plotly tanpa mengubah tampilan
+    nilai = {v: data[v].to_numpy(dtype=np.float32)[urutan] for v in variabel}
+    warna = qualitative.Alphabet
+
+    figur = go.Figure()
+    for i, nama in enumerate(kategori):
+        potongan = slice(batas[i], batas[i + 1])
+        figur.add_trace(go.Splom(
+            dimensions=[dict(label=v, values=nilai[v][potongan]) for v in variabel],
+            name=str(nama),
+            showupperhalf=False,
+            # Diagonal Splom hanya berisi titik x = x; disembunyikan kecuali satu variabel
+            diagonal_visible=len(variabel) == 1,
+            marker=dict(size=4, opacity=0.6, color=warna[i % len(warna)], line_width=0),
+        ))
+    figur.update_layout(
+        height=tinggi,
+        dragmode='select',
+        hovermode='closest',
+        legend_title_text=kolom_warna,
+        plot_bgcolor='white',
+    )
+    return figur
+
+
+def _ambil_figur(kunci, pembuat):
+    """
+    Entri cache figure; `pembuat()` mengembalikan (nilai, ukuran byte) dan hanya dipanggil jika
+    kunci belum ada. Jika dua sesi membangun kunci yang sama bersamaan, hasil yang pertama
+    disimpan yang dipakai keduanya.
+    """
+    global _ukuran_cache
+    with _lock:
+        if kunci in _cache_figur:
+            _cache_figur.move_to_end(kunci)
+            return _cache_figur[kunci][0]
+
+    # Figure dibangun di luar lock agar sesi lain tidak menunggu grafik yang tidak terkait
+    with instrumentasi.ukur('grafik.bangun_figur'):
+        nilai, ukuran = pembuat()
+    with _lock:
+        if kunci in _cache_figur:
+            return _cache_figur[kunci][0]
+        if ukuran <= BATAS_MEMORI_FIGUR:
+            _cache_figur[kunci] = (nilai, ukuran)
+            _ukuran_cache += ukuran
+            while _ukuran_cache > BATAS_MEMORI_FIGUR:
+                _, (_, ukuran_lama) = _cache_figur.popitem(last=False)
+                _ukuran_cache -= ukuran_lama
+    return nilai
+
+
+def kosongkan_cache():
+    """
+    Membuang semua figure dan hasil sebaran tersimpan, misalnya agar benchmark mengukur pembuatan figure.
+    """
+    global _ukuran_cache
+    with _lock:
+        _cache_figur.clear()
+        _cache_sebaran.clear()
+        _ukuran_cache = 0
+
+
+@instrumentasi.terukur
+def figur_plotly(kunci, pembuat):
+    """
+    Figure Plotly dari cache, dibangun lewat `pembuat()` hanya jika kunci belum ada.
+
+    Args:
+        kunci: Tuple hashable berisi versi data, jenis grafik dan parameter filter
+        pembuat: Fungsi tanpa argumen yang mengembalikan plotly Figure
+    Returns:
+        Dictionary spesifikasi figure yang dapat diberikan ke st.plotly_chart. Dictionary yang
+        sama dibagikan ke semua sesi (st.plotly_chart hanya membacanya), sehingga tidak boleh diubah
+    """
+    def bangun():
+        teks = pembuat().to_json()
+        return json.loads(teks), len(teks)
+    return _ambil_figur(('plotly',) + tuple(kunci), bangun)
+
+
+@instrumentasi.terukur
+def gambar_matplotlib(kunci, pembuat):
+    """
+    Gambar PNG figure Matplotlib/seaborn dari cache, dirender hanya jika kunci belum ada.
+
+    Args:
+        kunci: Tuple hashable berisi versi data, jenis grafik dan parameter filter
+        pembuat: Fungsi tanpa argumen yang mengembalikan Figure (atau objek seaborn dengan atribut `figure`)
+    Returns:
+        Bytes PNG yang dapat diberikan ke st.image
+    """
+    def render():
+        # Import di sini agar halaman tanpa Matplotlib tidak memuatnya
+        import matplotlib.pyplot as plt
+
+        figur = pembuat()
+        figur = getattr(figur, 'figure', figur)
+        buffer = io.BytesIO()
+        figur.savefig(buffer, **_OPSI_PNG)
+        plt.close(figur)
+        png = buffer.getvalue()
+        return png, len(png)
+    return _ambil_figur(('matplotlib',) + tuple(kunci), render)
+
+
+@instrumentasi.terukur
+def gambar_sebaran(kunci, data, variabel, kolom=3):
+    """
+    Grid histogram + KDE (lihat `sebaran_tersimpan`) untuk beberapa variabel, dari cache gambar.
+
+    Args:
+        kunci: Tuple versi data dan parameter filter; juga dipakai sebagai awalan kunci sebaran per kolom
+        data: DataFrame yang sudah difilter
+        variabel: Daftar kolom numerik yang digambar
+        kolom: Jumlah subplot per baris
+    Returns:
+        Bytes PNG yang dapat diberikan ke st.image
+    """
+    kunci = tuple(kunci)
+
+    def buat():
+        import matplotlib.pyplot as plt
+
+        baris = -(-len(variabel) // kolom)
+        fig, axes = plt.subplots(baris, kolom, figsize=(15, 5 * baris))
+        axes = np.atleast_1d(axes).flatten()
+        for i, var in enumerate(variabel):
+            hasil = sebaran_tersimpan(kunci + (var,), data[var].to_numpy())
+            warna = np.random.rand(3,)
+            axes[i].stairs(hasil['frekuensi'], hasil['tepi'], fill=True, color=warna, alpha=0.6, edgecolor='white')
+            axes[i].plot(hasil['kde_x'], hasil['kde_y'], color=warna, linewidth=2)
+            axes[i].set_title(f"Sebaran {var} ", fontsize=12)
+            axes[i].set_xlabel(var)
+            axes[i].set_ylabel("Frekuensi")
+
+        # Hapus subplot kosong jika ada
+        for ax in axes[len(variabel):]:
+            fig.delaxes(ax)
+        return fig
+    return gambar_matplotlib(kunci + ('sebaran', tuple(variabel)), buat)
+
+
+@instrumentasi.terukur
+def gambar_confusion_matrix(kunci, matriks, nama_label, judul):
+    """
+    Heatmap confusion matrix beranotasi dari cache gambar, digambar dengan Matplotlib saja
+    sehingga halaman tidak perlu memuat seaborn.
+
+    Args:
+        kunci: Tuple hashable, misalnya ('confusion_matrix', versi bundel evaluasi)
+        matriks: Array (n_kelas, n_kelas) jumlah sampel per (label asli, label prediksi)
+        nama_label: Nama kelas sesuai urutan baris/kolom matriks
+        judul: Judul grafik
+    Returns:
+        Bytes PNG yang dapat diberikan ke st.image
+    """
+    def buat():
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots(figsize=(7, 6))
+        gambar = ax.imshow(matriks, cmap="Blues", aspect='auto')
+        fig.colorbar(gambar, ax=ax)
+        batas_warna = matriks.max() / 2
+        for (i, j), nilai in np.ndenumerate(matriks):
+            ax.text(j, i, f"{nilai:d}", ha='center', va='center', fontsize=7, color='white' if nilai > batas_warna else 'black')
+        ax.set_xticks(np.arange(len(nama_label)), nama_label, rotation=45, ha='right')
+        ax.set_yticks(np.arange(len(nama_label)), nama_label, rotation=0)
+        ax.set_xlabel("Predicted Labels", fontsize=12)
+        ax.set_ylabel("True Labels", fontsize=12)
+        ax.set_title(judul, fontsize=14, fontweight='bold')
+        return fig
+    return gambar_matplotlib(tuple(kunci), buat)
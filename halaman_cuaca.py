@@ -0,0 +1,1247 @@
+"""
+Tampilan bersama halaman peramalan suhu, kelembapan dan curah hujan.
+
+Ketiga halaman hanya berbeda pada target dan teks/warnanya (lihat TAMPILAN); semua data,
+split, artefak model, metrik dan peramalan diambil dari lapisan bersama (data_cuaca.py,
+model_cuaca.py, peramalan.py) yang menyimpannya sekali per proses. Berpindah halaman
+memakai ulang state yang sudah hangat, termasuk figure pola cuaca yang sama di ketiga halaman.
+
+Contoh halaman:
+    import halaman_cuaca
+
+    halaman_cuaca.tampilkan('suhu')
+"""
+from datetime import datetime, timedelta
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+import data_cuaca
+import grafik
+import instrumentasi
+import model_cuaca
+import peramalan
+from fitur_cuaca import FITUR_LAG, FITUR_ROLLING, VARIABEL_CUACA
+
+# Teks dan warna setiap halaman target
+TAMPILAN = {
+    'suhu': {
+        'judul': '🌡️ Peramalan Suhu 🌡️',
+        'deskripsi': """
+    Di halaman ini, kita akan menganalisis data time series cuaca untuk memprediksi Suhu rata-rata (<code>Tavg</code>) berdasarkan berbagai parameter cuaca.
+    Tujuan utama adalah mengembangkan model machine learning seperti <b>Random Forest</b> yang dapat memperkirakan suhu dengan berdasarkan fitur-fitur seperti kelembaban, curah hujan, dan sinar matahari.
+""",
+        'nama': 'suhu',
+        'besaran': 'Suhu Rata-Rata',
+        'label': 'Suhu',
+        'satuan': '°C',
+        'akhiran': '°C',
+        'judul_prediksi': '🌡️Prediksi Suhu Udara🌡️',
+        'prediksi': 'Prediksi Suhu Udara',
+        'metrik': ['MAE', 'MSE', 'RMSE', 'R²', 'MAPE'],
+        'warna_aktual': '#E53935',
+        'warna_model': {'rf': '#4321ce', 'gb': '#07bdd6', 'xgb': '#1c39f4'},
+        'warna_kesimpulan': ('#ffebee', '#E53935'),
+        'warna_prediksi': ('orangered', 'darkred'),
+        'contoh': {'rata_rata': 28, 'simpangan': 1, 'warna': 'lightcoral'},
+        'skala_warna': 'Reds',
+    },
+    'kelembapan': {
+        'judul': '💧Peramalan Kelembapan Rata-Rata💧',
+        'deskripsi': """
+    Di halaman ini, kita akan menganalisis data time series cuaca untuk memprediksi kelembapan rata-rata (<code>RH_AVG</code>) berdasarkan berbagai parameter cuaca.
+    Tujuan utama adalah mengembangkan model machine learning seperti <b>Random Forest</b> yang dapat memperkirakan kelembapan dengan berdasarkan fitur-fitur seperti suhu, curah hujan, dan sinar matahari.
+""",
+        'nama': 'kelembapan',
+        'besaran': 'Kelembapan Rata-Rata',
+        'label': 'Kelembapan',
+        'satuan': '%',
+        'akhiran': '%',
+        'judul_prediksi': '💧Prediksi Kelembapan Udara💧',
+        'prediksi': 'Prediksi Kelembapan Udara',
+        'metrik': ['MAE', 'MSE', 'RMSE', 'R²', 'MAPE'],
+        'warna_aktual': '#008000',
+        'warna_model': {'rf': '#4321ce', 'gb': '#f7592f', 'xgb': '#1c39f4'},
+        'warna_kesimpulan': ('#e8f4f8', '#2196F3'),
+        'warna_prediksi': ('royalblue', 'darkblue'),
+        'contoh': {'rata_rata': 82, 'simpangan': 2, 'warna': 'lightgrey'},
+        'skala_warna': 'Blues',
+    },
+    'curah-hujan': {
+        'judul': '🌧️Peramalan Curah Hujan🌧️',
+        'deskripsi': """
+    Pada halaman ini, kita akan melakukan analisis data deret waktu (time series) cuaca untuk memprediksi curah hujan (<code>RR</code>) berdasarkan sejumlah parameter meteorologi.
+    Tujuan utama dari analisis ini adalah membangun model machine learning, seperti <b>Random Forest</b>, yang dapat memperkirakan besaran curah hujan berdasarkan variabel-variabel seperti suhu, kelembapan, dan intensitas sinar matahari.
+""",
+        'nama': 'curah hujan',
+        'besaran': 'Curah Hujan',
+        'label': 'Curah Hujan',
+        'satuan': 'mm',
+        'akhiran': ' mm',
+        'judul_prediksi': '🌧️Prediksi Curah Hujan🌧️',
+        'prediksi': 'Prediksi Curah Hujan',
+        # MAPE tak hingga jika ada hari tanpa hujan (nilai aktual 0); ditampilkan sebagai '–'
+        'metrik': ['MAE', 'MSE', 'RMSE', 'R²', 'MAPE'],
+        'warna_aktual': '#0000ff',
+        'warna_model': {'rf': '#c907d6', 'gb': '#f7592f', 'xgb': '#07c9d6'},
+        'warna_kesimpulan': ('#e8f4f8', '#0000ff'),
+        'warna_prediksi': ('steelblue', 'darkblue'),
+        'contoh': {'rata_rata': 5, 'simpangan': 2, 'warna': 'lightgrey'},
+        'skala_warna': 'Tealgrn',
+    },
+}
+
+# Grafik pola cuaca; sama di ketiga halaman sehingga figure-nya dibagikan lewat cache grafik.py
+POLA_CUACA = [
+    {
+        'kolom': 'Suhu_Rata_Rata', 'tab': '🌡️ Suhu Rata-Rata', 'judul': 'Suhu Rata-Rata', 'label': 'Suhu',
+        'garis': '#E53935', 'warna': '#E53935', 'latar': '#ffebee', 'sumbu_y': 'Suhu (°C)', 'akhiran': '°C',
+        'judul_statistik': 'Statistik Suhu',
+        'statistik': [('Rata-Rata', 'mean'), ('Tertinggi', 'max'), ('Terendah', 'min')],
+    },
+    {
+        'kolom': 'Curah_Hujan', 'tab': '🌧️ Curah Hujan', 'judul': 'Curah Hujan', 'label': 'Curah Hujan',
+        'garis': '#0000ff', 'warna': '#0000ff', 'latar': '#e3f2fd', 'sumbu_y': 'Curah Hujan (mm)', 'akhiran': ' mm',
+        'judul_statistik': 'Statistik Curah Hujan',
+        'statistik': [('Rata-Rata Harian', 'mean'), ('Curah Tertinggi', 'max'), ('Total Periode', 'sum')],
+    },
+    {
+        'kolom': 'Kelembaban_Rata_Rata', 'tab': '💧 Kelembaban Rata-Rata', 'judul': 'Kelembaban Rata-Rata', 'label': 'Kelembaban',
+        'garis': '#008000', 'warna': '#43A047', 'latar': '#e8f5e9', 'sumbu_y': 'Kelembaban (%)', 'akhiran': ' %',
+        'judul_statistik': 'Statistik Kelembaban',
+        'statistik': [('Rata-Rata', 'mean'), ('Tertinggi', 'max'), ('Terendah', 'min')],
+    },
+    {
+        'kolom': 'Sinar_Matahari', 'tab': '☀️ Sinar Matahari', 'judul': 'Sinar Matahari', 'label': 'Sinar Matahari',
+        'garis': '#FB8C00', 'warna': '#FB8C00', 'latar': '#fff3e0', 'sumbu_y': 'Sinar Matahari (Jam)', 'akhiran': ' Jam',
+        'judul_statistik': 'Statistik Sinar Matahari',
+        'statistik': [('Rata-Rata Harian', 'mean'), ('Durasi Terlama', 'max'), ('Durasi Terpendek', 'min')],
+    },
+]
+
+# Kartu metrik evaluasi: (warna, latar, judul, keterangan)
+KARTU_METRIK = {
+    'MAE': ('#F44336', '#FFEBEE', 'MAE', 'Rata-rata selisih absolut'),
+    'MSE': ('#2196F3', '#E3F2FD', 'MSE', 'Rata-rata selisih kuadrat'),
+    'RMSE': ('#4CAF50', '#E8F5E9', 'RMSE', 'Akar kuadrat dari MSE'),
+    'R²': ('#FF9800', '#FFF3E0', 'R² Score', 'Kecocokan model'),
+    'MAPE': ('#9C27B0', '#F3E5F5', 'MAPE', 'Persentase kesalahan'),
+}
+WARNA_BATANG_METRIK = ['#FF6F61', '#6B5B95', '#88B04B', '#F7CAC9', '#92A8D1']
+WARNA_PERBANDINGAN = {'rf': '#3498db', 'gb': '#2ecc71', 'xgb': '#e74c3c'}
+
+# Input kondisi terkini per variabel: nilai awal (hari ini, 1 hari sebelum, rolling 3 hari) dan batas atas
+INPUT_VARIABEL = {
+    'Suhu_Rata-Rata': {
+        'nama': 'Suhu', 'label': 'Suhu Rata-Rata', 'satuan': '°C', 'maks': 50.0,
+        'awal': (28.5, 28.2, 28.3), 'keterangan': 'Suhu rata-rata harian',
+    },
+    'Kelembapan_Rata-Rata': {
+        'nama': 'Kelembapan', 'label': 'Kelembapan Rata-Rata', 'satuan': '%', 'maks': 100.0,
+        'awal': (83.0, 83.0, 82.5), 'keterangan': 'Kelembapan rata-rata harian',
+    },
+    'Curah_Hujan': {
+        'nama': 'Curah Hujan', 'label': 'Curah Hujan', 'satuan': 'mm', 'maks': 500.0,
+        'awal': (0.5, 1.0, 0.8), 'keterangan': 'Curah hujan',
+    },
+    'Sinar_Matahari': {
+        'nama': 'Sinar Matahari', 'label': 'Sinar Matahari', 'satuan': 'jam', 'maks': 12.0,
+        'awal': (7.5, 6.5, 7.0), 'keterangan': 'Lama penyinaran matahari',
+    },
+}
+
+_CSS_HALAMAN = """
+<style>
+    .title {
+        font-size: 36px;
+        font-weight: bold;
+        margin-bottom: 10px;
+    }
+    .header {
+        font-size: 24px;
+        font-weight: bold;
+        margin-top: 10px;
+        margin-bottom: 10px;
+    }
+    .data-container {
+        border-radius: 1px;
+    }
+    .stDataFrame {
+        width: 100%;
+    }
+</style>
+"""
+
+# Style untuk statistik cards dengan angka besar dan teks tengah
+_CSS_STATISTIK = """
+<style>
+    .stat-card {
+        border-radius: 10px;
+        padding: 20px 15px;
+        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        transition: transform 0.2s;
+        height: 100%;
+        text-align: center;
+    }
+    .stat-card:hover {
+        transform: translateY(-5px);
+    }
+    .stat-title {
+        font-size: 16px;
+        font-weight: 600;
+        margin-bottom: 15px;
+        color: #555;
+        text-align: center;
+    }
+    .stat-value {
+        font-size: 32px;
+        font-weight: 700;
+        margin: 15px 0;
+        text-align: center;
+    }
+    .stat-unit {
+        font-size: 16px;
+        color: #666;
+        text-align: center;
+    }
+    .interpretation-box {
+        background-color: #f8f9fa;
+        border-left: 4px solid #1E88E5;
+        padding: 15px;
+        border-radius: 0 5px 5px 0;
+        margin-top: 20px;
+    }
+</style>
+"""
+
+# Definisi CSS untuk kartu dan tampilan visual
+_CSS_SPLIT = """
+<style>
+    .dataset-card {
+        border-radius: 10px;
+        padding: 15px;
+        margin: 10px 0;
+        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        min-height: 100px;
+        display: flex;
+        flex-direction: column;
+        justify-content: center;
+        text-align: center;
+        transition: transform 0.3s ease, box-shadow 0.3s ease;
+    }
+
+    .dataset-card:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 10px 15px rgba(0,0,0,0.2);
+    }
+
+    .training-card {
+        border-left: 4px solid #1e90ff;
+        background-color: #f0f8ff;
+    }
+
+    .testing-card {
+        border-left: 4px solid #ff69b4;
+        background-color: #fff0f5;
+    }
+
+    .summary-card {
+        border-left: 4px solid #2e8b57;
+        background-color: #f0fff0;
+    }
+
+    .feature-title {
+        font-weight: bold;
+        margin-bottom: 10px;
+        font-size: 18px;
+    }
+
+    .dataset-card p {
+        font-size: 16px;
+        margin: 5px 0;
+    }
+
+    .dataset-card strong {
+        font-size: 17px;
+    }
+
+    .card-header {
+        font-size: 20px;
+        font-weight: bold;
+        text-align: center;
+        margin-bottom: 15px;
+    }
+</style>
+"""
+
+
+def _kunci_state(target):
+    return target.replace('-', '_')
+
+
+def _format_metrik(metrik, nilai, desimal=4):
+    if not np.isfinite(nilai):
+        return '–'
+    return f'{nilai:.2f}%' if metrik == 'MAPE' else f'{nilai:.{desimal}f}'
+
+
+def _nilai_batang(nilai):
+    # Batang metrik tak hingga/NaN dikosongkan; labelnya '–' lewat `_format_metrik`
+    return np.where(np.isfinite(nilai), nilai, np.nan)
+
+
+def pilih_stasiun():
+    """
+    Selectbox stasiun di sidebar; pilihan dibagikan antar halaman lewat session_state.
+    """
+    daftar_stasiun = data_cuaca.daftar_stasiun() or [data_cuaca.STASIUN_UTAMA]
+    stasiun_terpilih = st.session_state.get('stasiun_terpilih', daftar_stasiun[0])
+    stasiun = st.sidebar.selectbox(
+        "📍 Stasiun", daftar_stasiun,
+        index=daftar_stasiun.index(stasiun_terpilih) if stasiun_terpilih in daftar_stasiun else 0
+    )
+    st.session_state['stasiun_terpilih'] = stasiun
+    return stasiun
+
+
+@instrumentasi.terukur
+def load_data(stasiun):
+    """
+    Memuat data cuaca bersih stasiun terpilih dari lapisan data bersama (lihat data_cuaca.py).
+    """
+    try:
+        # reset_index menghasilkan objek baru sehingga kolom tambahan di halaman tidak mengubah cache bersama
+        return data_cuaca.muat_data(stasiun).reset_index()
+    except FileNotFoundError:
+        st.error("File CSV tidak ditemukan. Pastikan path file benar.")
+        return None
+
+
+def rentang_tanggal(time_series_data):
+    """
+    Tanggal pertama dan terakhir data, juga nilai default filter tanggal visualisasi.
+    """
+    return time_series_data['Tanggal'].min().date(), time_series_data['Tanggal'].max().date()
+
+
+def filter_tanggal(time_series_data, start_date, end_date):
+    tanggal = time_series_data['Tanggal']
+    return time_series_data[(tanggal >= pd.to_datetime(start_date)) & (tanggal <= pd.to_datetime(end_date))]
+
+
+@instrumentasi.terukur
+def figur_pola_cuaca(filtered_vis_data, stasiun, pola, start_date, end_date):
+    """
+    Figure garis satu pola cuaca dari cache grafik.py. Kunci berisi versi data dan filter tanggal
+    tanpa target, sehingga halaman target lain memakai figure yang sama.
+
+    Args:
+        filtered_vis_data: Data hasil `filter_tanggal` untuk rentang start_date..end_date
+        stasiun: ID stasiun
+        pola: Salah satu konfigurasi POLA_CUACA
+        start_date, end_date: Rentang filter (datetime.date)
+    Returns:
+        Dictionary spesifikasi figure untuk st.plotly_chart
+    """
+    def buat_figur():
+        # go.Scatter langsung; px.line butuh ~40 ms per figure hanya untuk menyusun trace yang sama
+        sampel = grafik.sampel(filtered_vis_data, 'Tanggal', pola['kolom'])
+        fig = go.Figure(go.Scatter(
+            x=sampel['Tanggal'],
+            y=sampel[pola['kolom']],
+            mode='lines',
+            line=dict(color=pola['garis']),
+            hovertemplate=f"Tanggal=%{{x}}<br>{pola['label']}=%{{y}}<extra></extra>"
+        ))
+        fig.update_layout(
+            hovermode="x unified",
+            plot_bgcolor='rgba(240,240,240,0.8)',
+            xaxis_title="Tanggal",
+            yaxis_title=pola['sumbu_y'],
+            margin=dict(t=40, b=40),
+            xaxis=dict(
+                tickformat='%d %b %Y',
+                tickangle=-45
+            )
+        )
+        return fig
+
+    kunci = ('pola_cuaca', (stasiun, data_cuaca.versi_data(stasiun)), pola['kolom'], start_date, end_date)
+    return grafik.figur_plotly(kunci, buat_figur)
+
+
+@instrumentasi.terukur
+def figur_evaluasi(target, stasiun, artefak=None):
+    """
+    Semua figure evaluasi model satu target dari cache grafik.py, dibangun hanya untuk kunci
+    (target, versi artefak, ...) yang belum ada.
+
+    Args:
+        target: Kunci TAMPILAN
+        stasiun: ID stasiun
+        artefak: Artefak per kode algoritma; dimuat dari model_cuaca jika None
+    Returns:
+        Dictionary spesifikasi figure dengan kunci (kode, 'metrik'), (kode, 'aktual_prediksi'),
+        ('perbandingan', 'metrik'), ('perbandingan', 'aktual_prediksi') dan ('perbandingan', 'kesalahan')
+    """
+    tampilan = TAMPILAN[target]
+    algoritma = tuple(model_cuaca.ALGORITMA)
+    if artefak is None:
+        artefak = {kode: model_cuaca.load_artefak(target, kode, stasiun) for kode in algoritma}
+    y_test = model_cuaca.load_split(target, stasiun)[3]
+    evaluasi = model_cuaca.load_evaluasi(target, algoritma, stasiun)
+    versi_model = tuple(artefak[kode]['versi'] for kode in algoritma)
+    metrik = tampilan['metrik']
+    nilai_metrik = evaluasi['metrik'][:, [model_cuaca.METRIK.index(m) for m in metrik]]
+    nama_model = [model_cuaca.ALGORITMA[kode] for kode in algoritma]
+    sumbu_y = f"{tampilan['besaran']} ({tampilan['satuan']})"
+    figur = {}
+
+    def garis_aktual(lebar):
+        return go.Scatter(
+            x=np.arange(len(y_test)),
+            y=y_test.values,
+            name='Aktual',
+            line=dict(color=tampilan['warna_aktual'], width=lebar),
+            mode='lines',
+            hovertemplate='Index: %{x}<br>Nilai Aktual: %{y:.2f}'
+        )
+
+    def tata_letak_garis(fig, judul, ukuran_judul):
+        fig.update_layout(
+            height=600,
+            xaxis_title='Index',
+            yaxis_title=sumbu_y,
+            title={
+                'text': judul,
+                'y': 0.95,
+                'x': 0.5,
+                'xanchor': 'center',
+                'yanchor': 'top',
+                'font': dict(size=ukuran_judul)
+            },
+            xaxis=dict(showgrid=True, gridcolor='rgba(230, 230, 230, 0.8)'),
+            yaxis=dict(showgrid=True, gridcolor='rgba(230, 230, 230, 0.8)'),
+            margin=dict(l=50, r=50, t=100, b=50),
+            plot_bgcolor='white',
+            hovermode='x unified',
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+        )
+        return fig
+
+    for i, kode in enumerate(algoritma):
+        def buat_figur(values=nilai_metrik[i]):
+            metrics_fig = go.Figure(go.Bar(
+                x=metrik,
+                y=_nilai_batang(values),
+                marker_color=WARNA_BATANG_METRIK[:len(metrik)],
+                text=[_format_metrik(m, v) for m, v in zip(metrik, values)],
+                hovertemplate='Metrik=%{x}<br>Nilai=%{y}<extra></extra>'
+            ))
+            metrics_fig.update_layout(
+                hovermode="x",
+                plot_bgcolor='rgba(240,240,240,0.8)',
+                margin=dict(t=40, b=80),
+                xaxis_title='',
+                yaxis_title="Nilai Metrik",
+                showlegend=False
+            )
+            return metrics_fig
+
+        figur[kode, 'metrik'] = grafik.figur_plotly((target, versi_model, kode, 'metrik'), buat_figur)
+
+        def buat_figur(kode=kode, nama=nama_model[i]):
+            fig = go.Figure()
+            fig.add_trace(garis_aktual(2))
+            fig.add_trace(go.Scatter(
+                x=np.arange(len(artefak[kode]['y_pred'])),
+                y=artefak[kode]['y_pred'],
+                name='Prediksi',
+                line=dict(color=tampilan['warna_model'][kode], width=2, dash='solid'),
+                mode='lines',
+                hovertemplate='Index: %{x}<br>Nilai: %{y:.2f}'
+            ))
+            return tata_letak_garis(fig, f"Perbandingan Prediksi dan Aktual {tampilan['besaran']} ({nama})", 20)
+
+        figur[kode, 'aktual_prediksi'] = grafik.figur_plotly((target, versi_model, kode, 'aktual_prediksi'), buat_figur)
+
+    def buat_figur():
+        fig = go.Figure()
+        for i, kode in enumerate(algoritma):
+            fig.add_trace(go.Bar(
+                x=metrik,
+                y=_nilai_batang(nilai_metrik[i]),
+                name=nama_model[i],
+                marker=dict(color=WARNA_PERBANDINGAN[kode]),
+                text=[_format_metrik(m, v, 3) for m, v in zip(metrik, nilai_metrik[i])],
+                textposition='auto',
+                hovertemplate=f'<b>{nama_model[i]}</b><br>%{{x}}: %{{y:.3f}}<extra></extra>'
+            ))
+        fig.update_layout(
+            title={
+                'text': f"Perbandingan Kinerja Model ({tampilan['besaran']})",
+                'y': 0.9,
+                'x': 0.5,
+                'xanchor': 'center',
+                'yanchor': 'top'
+            },
+            xaxis_title="Metrik Evaluasi",
+            yaxis_title="Nilai",
+            legend_title="Model",
+            barmode='group',
+            bargap=0.25,
+            bargroupgap=0.1,
+            height=550,
+            font=dict(size=13),
+            template='none',
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            xaxis=dict(showgrid=False),
+            yaxis=dict(showgrid=True, gridcolor='lightgray')
+        )
+        return fig
+
+    figur['perbandingan', 'metrik'] = grafik.figur_plotly((target, versi_model, 'perbandingan', 'metrik'), buat_figur)
+
+    def buat_figur():
+        fig = go.Figure()
+        fig.add_trace(garis_aktual(2.5))
+        for i, kode in enumerate(algoritma):
+            fig.add_trace(go.Scatter(
+                x=np.arange(len(artefak[kode]['y_pred'])),
+                y=artefak[kode]['y_pred'],
+                name=nama_model[i],
+                line=dict(color=tampilan['warna_model'][kode], width=1.5, dash='solid'),
+                mode='lines',
+                hovertemplate=f'Index: %{{x}}<br>Prediksi {kode.upper()}: %{{y:.2f}}'
+            ))
+        return tata_letak_garis(fig, 'Perbandingan Prediksi Semua Model dengan Nilai Aktual', 18)
+
+    figur['perbandingan', 'aktual_prediksi'] = grafik.figur_plotly((target, versi_model, 'perbandingan', 'aktual_prediksi'), buat_figur)
+
+    # Histogram residual sudah dihitung per bin oleh model_cuaca.load_evaluasi
+    lebar_bin = np.diff(evaluasi['tepi_bin'])
+    tengah_bin = evaluasi['tepi_bin'][:-1] + lebar_bin / 2
+
+    def buat_figur():
+        fig = go.Figure()
+        for i, kode in enumerate(algoritma):
+            fig.add_trace(go.Bar(
+                x=tengah_bin,
+                y=evaluasi['histogram'][i],
+                width=lebar_bin,
+                name=nama_model[i],
+                opacity=0.7,
+                marker=dict(color=tampilan['warna_model'][kode]),
+                hovertemplate=f'Error: %{{x:.2f}}<br>Frekuensi: %{{y}}<extra>{nama_model[i]}</extra>'
+            ))
+        fig.update_layout(
+            barmode='overlay',
+            title={
+                'text': 'Distribusi Kesalahan Prediksi Model',
+                'y': 0.9,
+                'x': 0.5,
+                'xanchor': 'center',
+                'yanchor': 'top'
+            },
+            xaxis_title="Kesalahan Prediksi (Aktual - Prediksi)",
+            yaxis_title="Frekuensi",
+            legend_title="Model",
+            height=500,
+            plot_bgcolor='white',
+            bargap=0.1,
+            bargroupgap=0.2
+        )
+        return fig
+
+    figur['perbandingan', 'kesalahan'] = grafik.figur_plotly((target, versi_model, 'perbandingan', 'kesalahan'), buat_figur)
+    return figur
+
+
+@instrumentasi.terukur
+def tampilkan_dataset(time_series_data):
+    # Membuat container dengan dua kolom yang lebih proporsional
+    col1, col2 = st.columns([1, 2])
+
+    # Menampilkan informasi dasar tentang dataset di kolom pertama
+    with col1:
+        st.markdown("<h3 style='text-align: center;'>🔍 Informasi Dataset</h3>", unsafe_allow_html=True)
+
+        min_date = time_series_data['Tanggal'].min().date()
+        max_date = time_series_data['Tanggal'].max().date()
+
+        # Rentang tanggal dengan default rentang 10 hari dari tanggal minimum
+        default_end_date = min(min_date + timedelta(days=10), max_date)
+        date_range = st.date_input(
+            "Pilih rentang tanggal",
+            [min_date, default_end_date],
+            min_value=min_date,
+            max_value=max_date
+        )
+
+        # Pilih kolom yang ditampilkan
+        all_columns = time_series_data.columns.tolist()
+        default_columns = ['Tanggal', 'Suhu_Minimum', 'Suhu_Maksimum', 'Curah_Hujan', 'Suhu_Rata_Rata', 'Kelembaban_Rata_Rata']
+        selected_columns = st.multiselect(
+            "Pilih kolom:",
+            all_columns,
+            default=default_columns
+        ) or default_columns
+
+        st.markdown(f"""
+        <div class="data-container">
+            <p>Jumlah baris: {time_series_data.shape[0]}</p>
+            <p>Jumlah kolom: {time_series_data.shape[1]}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        col_btn1, col_btn2 = st.columns(2)
+        with col_btn1:
+            search_button = st.button("Cari", use_container_width=True)
+        with col_btn2:
+            reset_button = st.button("Reset", use_container_width=True)
+
+    # Menampilkan preview dataset di kolom kedua
+    with col2:
+        st.markdown("<h3 style='text-align: center;'>📋 Tampilan Dataset</h3>", unsafe_allow_html=True)
+
+        if search_button:
+            filtered_data = time_series_data
+            # Filter berdasarkan rentang tanggal yang dipilih
+            if len(date_range) == 2:
+                start_date, end_date = date_range
+                tanggal = filtered_data['Tanggal'].dt.date
+                filtered_data = filtered_data[(tanggal >= start_date) & (tanggal <= end_date)]
+            if len(filtered_data) > 0:
+                st.success(f"Ditemukan {len(filtered_data)} data yang sesuai kriteria pencarian.")
+                st.dataframe(filtered_data[selected_columns], use_container_width=True)
+            else:
+                st.info("Tidak ada data yang sesuai dengan kriteria pencarian.")
+        elif reset_button:
+            st.dataframe(time_series_data[selected_columns], use_container_width=True)
+        else:
+            st.info("Gunakan fitur pencarian untuk melihat data spesifik.")
+            st.dataframe(time_series_data[selected_columns], use_container_width=True)
+
+
+@instrumentasi.terukur
+def tampilkan_pola_cuaca(time_series_data, stasiun):
+    st.markdown("---")
+    st.markdown("<h2 style='text-align: center; padding: 10px; border-radius: 5px; margin-bottom: 20px;'>📊 Visualisasi Pola Cuaca 📊</h2>", unsafe_allow_html=True)
+
+    # Filter tanggal untuk visualisasi
+    tanggal_min, tanggal_max = rentang_tanggal(time_series_data)
+    col1, col2 = st.columns(2)
+    with col1:
+        start_date_vis = st.date_input("Tanggal Mulai", value=tanggal_min, min_value=tanggal_min, max_value=tanggal_max)
+    with col2:
+        end_date_vis = st.date_input("Tanggal Akhir", value=tanggal_max, min_value=tanggal_min, max_value=tanggal_max)
+
+    filtered_vis_data = filter_tanggal(time_series_data, start_date_vis, end_date_vis)
+
+    days_count = (pd.to_datetime(end_date_vis) - pd.to_datetime(start_date_vis)).days + 1
+    st.info(f"Menampilkan {days_count} data untuk periode {start_date_vis} hingga {end_date_vis}")
+
+    st.markdown(_CSS_STATISTIK, unsafe_allow_html=True)
+
+    for tab, pola in zip(st.tabs([pola['tab'] for pola in POLA_CUACA]), POLA_CUACA):
+        with tab:
+            warna = pola['warna']
+            st.markdown(f"<h3 style='text-align: center; color: {warna};'>Pola {pola['judul']}</h3>", unsafe_allow_html=True)
+
+            st.plotly_chart(figur_pola_cuaca(filtered_vis_data, stasiun, pola, start_date_vis, end_date_vis), use_container_width=True)
+
+            st.markdown(f"<h4 style='text-align: center; color: {warna}; margin-top: 20px;'>{pola['judul_statistik']}</h4>", unsafe_allow_html=True)
+            kolom_data = filtered_vis_data[pola['kolom']]
+            for col, (judul, agregasi) in zip(st.columns(len(pola['statistik'])), pola['statistik']):
+                with col:
+                    st.markdown(f"""
+                    <div class="stat-card" style="background-color: {pola['latar']}; border-top: 3px solid {warna};">
+                        <div class="stat-title">{judul}</div>
+                        <div class="stat-value" style="color: {warna};">{kolom_data.agg(agregasi):.1f}{pola['akhiran']}</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+
+@instrumentasi.terukur
+def tampilkan_split(target, stasiun):
+    st.markdown("---")
+    st.markdown(
+        "<h2 style='text-align: center;'>🔢 Pembagian Dataset Training dan Testing 🔢</h2>",
+        unsafe_allow_html=True
+    )
+
+    X_train, X_test, y_train, y_test = model_cuaca.load_split(target, stasiun)
+    total_samples = X_train.shape[0] + X_test.shape[0]
+    training_ratio = X_train.shape[0] / total_samples * 100
+    testing_ratio = X_test.shape[0] / total_samples * 100
+
+    st.markdown(_CSS_SPLIT, unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+    for col, judul, kelas, warna, X, y in (
+        (col1, 'Training Set', 'training-card', '#1e90ff', X_train, y_train),
+        (col2, 'Testing Set', 'testing-card', '#ff69b4', X_test, y_test),
+    ):
+        with col:
+            st.markdown(f"<div class='card-header'>{judul}</div>", unsafe_allow_html=True)
+            st.markdown(f"""
+            <div class="dataset-card {kelas}">
+                <div class="feature-title" style="color: {warna};">Fitur (X)</div>
+                <p style="color: {warna};">Jumlah sampel: <strong>{X.shape[0]:,}</strong></p>
+                <p style="color: {warna};">Jumlah fitur: <strong>{X.shape[1]}</strong></p>
+            </div>
+            """, unsafe_allow_html=True)
+            st.markdown(f"""
+            <div class="dataset-card {kelas}">
+                <div class="feature-title" style="color: {warna};">Target (y)</div>
+                <p style="color: {warna};">Jumlah sampel: <strong>{y.shape[0]:,}</strong></p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("<div class='card-header'>Ringkasan Pembagian Data</div>", unsafe_allow_html=True)
+        st.markdown(f"""
+        <div class="dataset-card summary-card">
+            <p style="color: #2e8b57;">Total dataset: <strong>{total_samples:,}</strong> sampel</p>
+            <p style="color: #2e8b57;">Rasio training: <strong>{training_ratio:.1f}%</strong></p>
+            <p style="color: #2e8b57;">Rasio testing: <strong>{testing_ratio:.1f}%</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+@instrumentasi.terukur
+def tampilkan_evaluasi(target, stasiun):
+    tampilan = TAMPILAN[target]
+    algoritma = tuple(model_cuaca.ALGORITMA)
+
+    st.markdown("---")
+    st.markdown(f"<h1 style='text-align: center; padding-top: 20px; padding-bottom: 40px;'>Evaluasi Model Prediksi {tampilan['label']}</h1>", unsafe_allow_html=True)
+
+    # Load artefak model (model terlatih, prediksi data uji dan metrik) sekali per proses
+    try:
+        artefak = {kode: model_cuaca.load_artefak(target, kode, stasiun) for kode in algoritma}
+    except FileNotFoundError as e:
+        nama_file = os.path.basename(e.filename or '')
+        st.error(f"Model file tidak ditemukan. Pastikan file '{nama_file}' ada di direktori yang sama.")
+        return
+
+    # Model hanya dilatih ulang lewat aksi eksplisit pengguna
+    if st.button("🔄 Latih Ulang Model", help="Latih ulang Random Forest dan Gradient Boosting pada data training"):
+        with st.spinner("Melatih ulang model..."):
+            for kode in ('rf', 'gb'):
+                artefak[kode] = model_cuaca.latih_ulang_model(target, kode, stasiun)
+        st.success("Model berhasil dilatih ulang.")
+
+    # Metrik, statistik kesalahan dan histogram residual semua model dihitung sekali per versi artefak
+    evaluasi = model_cuaca.load_evaluasi(target, algoritma, stasiun)
+    metrik = tampilan['metrik']
+    nilai_metrik = evaluasi['metrik'][:, [model_cuaca.METRIK.index(m) for m in metrik]]
+    nama_model = [model_cuaca.ALGORITMA[kode] for kode in algoritma]
+    figur = figur_evaluasi(target, stasiun, artefak)
+
+    tabs = st.tabs(nama_model + ["Perbandingan Semua Model"])
+
+    for i, (kode, tab) in enumerate(zip(algoritma, tabs)):
+        with tab:
+            st.markdown(f"<h2 style='text-align: center;'>Model {nama_model[i]}</h2>", unsafe_allow_html=True)
+            values = nilai_metrik[i]
+
+            st.markdown("<h3 style='text-align: center;'>📈 Visualisasi Metrik Evaluasi </h3>", unsafe_allow_html=True)
+
+            st.plotly_chart(figur[kode, 'metrik'], use_container_width=True)
+
+            # Kartu metrik dalam kolom
+            for col, m, v in zip(st.columns(len(metrik)), metrik, values):
+                warna, latar, judul, keterangan = KARTU_METRIK[m]
+                with col:
+                    st.markdown(f"""
+                        <div class="metric-card" style="min-height: 120px;border-left: 4px solid {warna}; background-color: {latar}; padding: 5px; border-radius: 8px;">
+                            <div class="metric-title" style="text-align: center; color: {warna};">{judul}</div>
+                            <div class="metric-value" style="color: {warna}; text-align: center; font-weight: bold; font-size: 24px">{_format_metrik(m, v)}</div>
+                            <div class="metric-unit" style="text-align: center; color: {warna};">{keterangan}</div>
+                        </div>
+                    """, unsafe_allow_html=True)
+
+            st.markdown("<h3 style='text-align: center; padding-top: 50px'>🔮 Perbandingan Nilai Aktual dan Prediksi</h3>", unsafe_allow_html=True)
+
+            st.plotly_chart(figur[kode, 'aktual_prediksi'], use_container_width=True)
+
+    with tabs[-1]:
+        st.markdown(f"<h2 style='text-align: center;'>Perbandingan Semua Kinerja Model ({tampilan['besaran']})</h2>", unsafe_allow_html=True)
+
+        st.plotly_chart(figur['perbandingan', 'metrik'], use_container_width=True)
+
+        st.markdown("<h3 style='text-align: center; padding-top: 20px'>📊 Tabel Perbandingan Metrik</h3>", unsafe_allow_html=True)
+        comparison_df = pd.DataFrame({'Metrik': metrik})
+        for i, nama in enumerate(nama_model):
+            comparison_df[nama] = [_format_metrik(m, v) for m, v in zip(metrik, nilai_metrik[i])]
+        st.dataframe(comparison_df, use_container_width=True)
+
+        st.markdown("<h3 style='text-align: center; padding-top: 30px'>🔄 Perbandingan Prediksi Semua Model</h3>", unsafe_allow_html=True)
+
+        st.plotly_chart(figur['perbandingan', 'aktual_prediksi'], use_container_width=True)
+
+        st.markdown("<h3 style='text-align: center; padding-top: 30px'>📉 Analisis Kesalahan Model</h3>", unsafe_allow_html=True)
+
+        st.plotly_chart(figur['perbandingan', 'kesalahan'], use_container_width=True)
+
+        error_stats = pd.DataFrame({'Statistik': model_cuaca.STATISTIK_ERROR})
+        for i, nama in enumerate(nama_model):
+            error_stats[nama] = [f"{nilai:.4f}" for nilai in evaluasi['statistik_error'][i]]
+
+        st.markdown("<h4 style='text-align: center; padding-top: 10px'>Statistik Kesalahan Prediksi</h4>", unsafe_allow_html=True)
+        st.dataframe(error_stats, use_container_width=True)
+
+        st.markdown("<h3 style='text-align: center; padding-top: 30px'>🏆 Kesimpulan dan Rekomendasi</h3>", unsafe_allow_html=True)
+        r2_scores = evaluasi['metrik'][:, model_cuaca.METRIK.index('R²')]
+        rmse_scores = evaluasi['metrik'][:, model_cuaca.METRIK.index('RMSE')]
+        best_r2_idx = int(np.argmax(r2_scores))
+        best_rmse_idx = int(np.argmin(rmse_scores))
+        latar, warna = tampilan['warna_kesimpulan']
+
+        if best_r2_idx == best_rmse_idx:
+            best_model = nama_model[best_r2_idx]
+            st.markdown(f"""
+            <div style="background-color: {latar}; padding: 20px; border-radius: 10px; border-left: 5px solid {warna}; text-align: center">
+                <h4 style="color: {warna}; margin-top: 0;">Model Terbaik: {best_model}</h4>
+                <p style="color: {warna}; margin-top: 0;">Berdasarkan evaluasi metrik, model <b style="color: {warna}; font-weight: bold">{best_model}</b> menunjukkan performa terbaik dengan nilai:</p>
+                <ul style="color: {warna}; margin-top: 0;">
+                    <li >R² Score: <b>{r2_scores[best_r2_idx]:.4f}</b> (semakin tinggi semakin baik)</li>
+                    <li>RMSE: <b>{rmse_scores[best_rmse_idx]:.4f}</b> (semakin rendah semakin baik)</li>
+                </ul>
+                <p style="color: {warna}; margin-top: 0;">Model ini memiliki keseimbangan terbaik dalam akurasi prediksi {tampilan['nama']} dan konsistensi performa.</p>
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            st.markdown(f"""
+            <div style="background-color: #e8f4f8; padding: 20px; border-radius: 10px; border-left: 5px solid {warna};">
+                <h4 style="color: {warna}; margin-top: 0;">Rekomendasi Model</h4>
+                <p>Berdasarkan evaluasi metrik yang berbeda:</p>
+                <ul>
+                    <li><b>{nama_model[best_r2_idx]}</b> memberikan R² Score terbaik: <b>{r2_scores[best_r2_idx]:.4f}</b></li>
+                    <li><b>{nama_model[best_rmse_idx]}</b> memberikan RMSE terendah: <b>{rmse_scores[best_rmse_idx]:.4f}</b></li>
+                </ul>
+                <p>Pilihan model tergantung pada prioritas:</p>
+                <ul>
+                    <li>Jika prioritas adalah kecocokan model secara keseluruhan, pilih <b>{nama_model[best_r2_idx]}</b></li>
+                    <li>Jika prioritas adalah akurasi prediksi dengan kesalahan minimum, pilih <b>{nama_model[best_rmse_idx]}</b></li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+
+
+@instrumentasi.terukur
+def load_model(target, stasiun):
+    try:
+        return model_cuaca.load_artefak(target, 'rf', stasiun)['model']
+    except FileNotFoundError:
+        nama_file = os.path.basename(model_cuaca.path_model(target, 'rf', stasiun))
+        st.error(f"Model file tidak ditemukan. Pastikan file '{nama_file}' ada di direktori yang sama.")
+        return None
+
+
+@instrumentasi.terukur
+def prediksi_masa_depan(target, data_terakhir, hari_untuk_diprediksi, model):
+    """
+    Memprediksi target untuk beberapa hari ke depan.
+
+    Args:
+        target: Kunci target pada model_cuaca.TARGET_CUACA
+        data_terakhir: DataFrame dengan data terbaru yang digunakan sebagai dasar prediksi
+        hari_untuk_diprediksi: Jumlah hari yang akan diprediksi
+        model: Model Random Forest yang telah dilatih
+    Returns:
+        DataFrame berisi tanggal dan prediksi target
+    """
+    # Lag dan rolling disimpan dalam buffer NumPy, hasil dikumpulkan sekaligus di akhir
+    tanggal_prediksi, hasil = peramalan.ramalkan(
+        model, target, data_terakhir.iloc[0], data_terakhir['TANGGAL'].iloc[0], hari_untuk_diprediksi
+    )
+    return pd.DataFrame({'TANGGAL': tanggal_prediksi, model_cuaca.TARGET_CUACA[target]['kolom']: hasil})
+
+
+def _input_angka(variabel, judul, nilai):
+    spesifikasi = INPUT_VARIABEL[variabel]
+    return st.number_input(
+        f"{judul} ({spesifikasi['satuan']})", value=nilai, min_value=0.0, max_value=spesifikasi['maks'], step=0.1
+    )
+
+
+def form_kondisi(target):
+    """
+    Form kondisi terkini: nilai hari ini untuk variabel selain target, serta nilai 1 hari
+    sebelum dan rata-rata 3 hari terakhir untuk semua variabel.
+
+    Returns:
+        Tuple (DataFrame satu baris kondisi terkini, jumlah hari prediksi, form dikirim)
+    """
+    kolom_target = model_cuaca.TARGET_CUACA[target]['kolom']
+    kondisi = {}
+    with st.expander("🔽 Input Data Kondisi Terkini 🔽", expanded=False):
+        with st.form("input_form"):
+            st.subheader("Data Kondisi Terkini")
+            tanggal = pd.Timestamp(st.date_input("Tanggal Data Terkini", datetime.now().date()))
+
+            col1, col2 = st.columns(2)
+            with col1:
+                # Fitur dasar untuk hari ini
+                for variabel in VARIABEL_CUACA:
+                    if variabel != kolom_target:
+                        spesifikasi = INPUT_VARIABEL[variabel]
+                        kondisi[variabel] = _input_angka(variabel, spesifikasi['label'], spesifikasi['awal'][0])
+            with col2:
+                # Fitur lag (1 hari sebelumnya)
+                for variabel in VARIABEL_CUACA:
+                    spesifikasi = INPUT_VARIABEL[variabel]
+                    kondisi[FITUR_LAG[variabel]] = _input_angka(variabel, f"{spesifikasi['nama']} 1 Hari Sebelum", spesifikasi['awal'][1])
+
+            st.markdown("---")
+
+            # Fitur rolling (rata-rata 3 hari)
+            st.subheader("Data Rata-rata 3 Hari Terakhir")
+            paruh = len(VARIABEL_CUACA) // 2
+            for col, daftar in zip(st.columns(2), (VARIABEL_CUACA[:paruh], VARIABEL_CUACA[paruh:])):
+                with col:
+                    for variabel in daftar:
+                        spesifikasi = INPUT_VARIABEL[variabel]
+                        kondisi[FITUR_ROLLING[variabel]] = _input_angka(variabel, f"{spesifikasi['nama']} Rolling 3 Hari", spesifikasi['awal'][2])
+
+            st.markdown("---")
+
+            st.subheader("Parameter Prediksi")
+            hari_prediksi = st.slider("Jumlah Hari untuk Diprediksi", min_value=3, max_value=100, value=30, step=1)
+            submitted = st.form_submit_button("Jalankan Prediksi")
+
+    data_terakhir = pd.DataFrame({
+        'TANGGAL': [tanggal],
+        'Hari': [tanggal.dayofweek],
+        'Bulan': [tanggal.month],
+        'Tahun': [tanggal.year],
+        **{nama: [nilai] for nama, nilai in kondisi.items()},
+    })
+    return data_terakhir, hari_prediksi, submitted
+
+
+@instrumentasi.terukur
+def tampilkan_hasil_prediksi(target, hasil_prediksi):
+    # plotly.express hanya dibutuhkan setelah ada hasil prediksi
+    import plotly.express as px
+
+    tampilan = TAMPILAN[target]
+    kolom = model_cuaca.TARGET_CUACA[target]['kolom']
+    label = f"{tampilan['label']} ({tampilan['satuan']})"
+    akhiran = tampilan['akhiran']
+    garis, penanda = tampilan['warna_prediksi']
+
+    tab1, tab2, tab3 = st.tabs(["📈 Grafik Prediksi", "📊 Statistik", "📋 Data Lengkap"])
+
+    with tab1:
+        st.subheader(f"{tampilan['prediksi']} untuk {len(hasil_prediksi)} Hari ke Depan")
+
+        fig = go.Figure()
+        fig.add_trace(
+            go.Scatter(
+                x=hasil_prediksi['TANGGAL'],
+                y=hasil_prediksi[kolom],
+                mode='lines+markers',
+                name=label,
+                line=dict(color=garis, width=3),
+                marker=dict(size=6, color=penanda)
+            )
+        )
+        fig.update_layout(
+            title={
+                'text': f"{tampilan['prediksi']} ({hasil_prediksi['TANGGAL'].min().strftime('%d %b %Y')} - {hasil_prediksi['TANGGAL'].max().strftime('%d %b %Y')})",
+                'y': 0.95,
+                'x': 0.5,
+                'xanchor': 'center',
+                'yanchor': 'top'
+            },
+            xaxis_title="Tanggal",
+            yaxis_title=f"{tampilan['besaran']} ({tampilan['satuan']})",
+            hovermode="x unified",
+            height=500,
+            yaxis=dict(
+                gridcolor='rgba(230, 230, 230, 0.8)'
+            ),
+            plot_bgcolor='rgb(255, 255, 255)',
+            margin=dict(l=40, r=40, t=80, b=40),
+            xaxis=dict(
+                tickformat="%d %b %Y",
+                rangeselector=dict(
+                    buttons=list([
+                        dict(count=7, label="7D", step="day", stepmode="backward"),
+                        dict(count=14, label="14D", step="day", stepmode="backward"),
+                        dict(count=1, label="1M", step="month", stepmode="backward"),
+                        dict(step="all")
+                    ])
+                ),
+                rangeslider=dict(visible=True),
+                type="date"
+            )
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    with tab2:
+        st.subheader(f"Statistik Prediksi {tampilan['label']}")
+
+        for col, (judul, agregasi) in zip(
+            st.columns(4),
+            [("Rata-rata", 'mean'), ("Minimum", 'min'), ("Maksimum", 'max'), ("Standar Deviasi", 'std')]
+        ):
+            with col:
+                st.metric(judul, f"{hasil_prediksi[kolom].agg(agregasi):.2f}{akhiran}")
+
+        st.subheader(f"Distribusi {tampilan['label']}")
+        hist_fig = px.histogram(
+            hasil_prediksi,
+            x=kolom,
+            nbins=20,
+            labels={kolom: label},
+            title=f"Distribusi Prediksi {tampilan['label']}",
+            color_discrete_sequence=[garis]
+        )
+        hist_fig.update_layout(
+            xaxis_title=label,
+            yaxis_title="Frekuensi",
+            bargap=0.1,
+            height=400,
+            plot_bgcolor='rgb(255, 255, 255)'
+        )
+        st.plotly_chart(hist_fig, use_container_width=True)
+
+        # Menampilkan rangkuman berdasarkan bulan
+        if len(hasil_prediksi) > 14:  # Hanya jika ada cukup data
+            st.subheader("Rangkuman Berdasarkan Bulan")
+
+            monthly_avg = (
+                hasil_prediksi.groupby(hasil_prediksi['TANGGAL'].dt.strftime('%B %Y'), sort=False)[kolom]
+                .agg(['mean', 'min', 'max']).reset_index()
+            )
+            monthly_avg.columns = ['Bulan', 'Rata-rata', 'Minimum', 'Maksimum']
+
+            monthly_fig = px.bar(
+                monthly_avg,
+                x='Bulan',
+                y='Rata-rata',
+                error_y=monthly_avg['Maksimum'] - monthly_avg['Rata-rata'],
+                error_y_minus=monthly_avg['Rata-rata'] - monthly_avg['Minimum'],
+                title=f"Rata-rata {tampilan['label']} Bulanan",
+                color_discrete_sequence=[garis]
+            )
+            monthly_fig.update_layout(
+                xaxis_title="Bulan",
+                yaxis_title=f"{tampilan['label']} Rata-rata ({tampilan['satuan']})",
+                height=400,
+                plot_bgcolor='rgb(255, 255, 255)'
+            )
+            st.plotly_chart(monthly_fig, use_container_width=True)
+
+    with tab3:
+        st.subheader(f"Data Lengkap Prediksi {tampilan['label']}")
+
+        prediksi_display = pd.DataFrame({
+            'Tanggal': hasil_prediksi['TANGGAL'].dt.strftime('%Y-%m-%d'),
+            f"{tampilan['besaran']} ({tampilan['satuan']})": hasil_prediksi[kolom].round(2),
+        })
+        st.dataframe(prediksi_display, use_container_width=True)
+
+        tanggal_awal = hasil_prediksi['TANGGAL'].min().strftime('%Y%m%d')
+        tanggal_akhir = hasil_prediksi['TANGGAL'].max().strftime('%Y%m%d')
+        st.download_button(
+            label="📥 Download Data Prediksi (CSV)",
+            data=prediksi_display.to_csv(index=False),
+            file_name=f"prediksi_{_kunci_state(target)}_{tanggal_awal}_s.d_{tanggal_akhir}.csv",
+            mime="text/csv",
+        )
+
+
+def tampilkan_contoh(target):
+    tampilan = TAMPILAN[target]
+    kolom = model_cuaca.TARGET_CUACA[target]['kolom']
+    contoh = tampilan['contoh']
+
+    st.info(f"☝️ Masukkan parameter input di panel sebelah atas, lalu klik 'Jalankan Prediksi' untuk menghasilkan {tampilan['prediksi'].lower()}.")
+    st.subheader("Contoh Visualisasi")
+
+    tanggal_contoh = pd.date_range(start=datetime.now().date(), periods=30)
+    # Nilai simulasi tidak boleh negatif (misalnya curah hujan)
+    nilai_contoh = np.maximum(np.random.normal(loc=contoh['rata_rata'], scale=contoh['simpangan'], size=30).round(2), 0)
+
+    fig_contoh = go.Figure()
+    fig_contoh.add_trace(
+        go.Scatter(
+            x=tanggal_contoh,
+            y=nilai_contoh,
+            mode='lines+markers',
+            name=f"{tampilan['label']} ({tampilan['satuan']})",
+            line=dict(color=contoh['warna'], width=2, dash='dash'),
+            marker=dict(size=5, color='darkgrey')
+        )
+    )
+    fig_contoh.update_layout(
+        title=f"Contoh Visualisasi Prediksi {tampilan['label']} (Data Simulasi)",
+        xaxis_title="Tanggal",
+        yaxis_title=f"{tampilan['besaran']} ({tampilan['satuan']})",
+        height=400,
+        plot_bgcolor='rgb(255, 255, 255)',
+    )
+    st.plotly_chart(fig_contoh, use_container_width=True)
+    st.caption("Catatan: Visualisasi di atas menggunakan data simulasi. Masukkan parameter input untuk melihat prediksi yang sebenarnya.")
+
+
+@instrumentasi.terukur
+def tampilkan_skenario(target, model_rf, hari_prediksi):
+    tampilan = TAMPILAN[target]
+    kunci_kondisi = f'kondisi_terakhir_{_kunci_state(target)}'
+
+    st.markdown("---")
+    st.markdown("<h2 style='text-align: center; padding: 20px;'>🧪 Analisis Skenario 🧪</h2>", unsafe_allow_html=True)
+    st.markdown("""
+    <div style='text-align: justify; font-size: 16px; text-indent: 40px; padding-bottom: 20px;'>
+        Jalankan banyak skenario <i>what-if</i> sekaligus dengan menyapu satu variabel kondisi terkini dalam rentang tertentu.
+        Semua skenario dimajukan bersama setiap hari sehingga ratusan skenario diproses hampir secepat satu prediksi.
+    </div>
+    """, unsafe_allow_html=True)
+
+    if model_rf is None or kunci_kondisi not in st.session_state:
+        st.info("☝️ Jalankan prediksi terlebih dahulu untuk menggunakan kondisi terkini sebagai dasar skenario.")
+        return
+
+    kondisi_dasar = st.session_state[kunci_kondisi]
+    kolom_kondisi = peramalan.fitur_kondisi(target)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        kolom_sapuan = st.selectbox("Variabel yang Disapu", kolom_kondisi)
+    nilai_dasar = float(kondisi_dasar[kolom_sapuan])
+    with col2:
+        nilai_awal = st.number_input("Nilai Awal", value=round(nilai_dasar * 0.9, 2), step=0.1)
+    with col3:
+        nilai_akhir = st.number_input("Nilai Akhir", value=round(nilai_dasar * 1.1, 2), step=0.1)
+    with col4:
+        jumlah_skenario = st.number_input("Jumlah Skenario", min_value=2, max_value=1000, value=50, step=1)
+
+    if not st.button("Jalankan Skenario"):
+        return
+
+    with st.spinner("Memproses skenario..."):
+        nilai_sapuan = np.linspace(nilai_awal, nilai_akhir, int(jumlah_skenario))
+        matriks_kondisi = peramalan.sapuan_skenario(kondisi_dasar, kolom_sapuan, nilai_sapuan, kolom_kondisi)
+        tanggal_skenario, hasil_skenario = peramalan.ramalkan_skenario(
+            model_rf, target, matriks_kondisi, kondisi_dasar['TANGGAL'], hari_prediksi
+        )
+
+    skenario_fig = go.Figure(data=go.Heatmap(
+        z=hasil_skenario,
+        x=tanggal_skenario,
+        y=nilai_sapuan,
+        colorscale=tampilan['skala_warna'],
+        colorbar=dict(title=tampilan['satuan']),
+        hovertemplate='Tanggal: %{x|%d %b %Y}<br>' + kolom_sapuan + ': %{y:.2f}<br>Prediksi: %{z:.2f}<extra></extra>'
+    ))
+    skenario_fig.update_layout(
+        title={
+            'text': f"Prediksi {tampilan['label']} untuk {len(nilai_sapuan)} Skenario {kolom_sapuan}",
+            'x': 0.5,
+            'xanchor': 'center'
+        },
+        xaxis_title="Tanggal",
+        yaxis_title=kolom_sapuan,
+        height=500,
+        plot_bgcolor='rgb(255, 255, 255)'
+    )
+    st.plotly_chart(skenario_fig, use_container_width=True)
+
+    ringkasan_skenario = pd.DataFrame({
+        kolom_sapuan: nilai_sapuan.round(2),
+        'Rata-rata': hasil_skenario.mean(axis=1).round(2),
+        'Minimum': hasil_skenario.min(axis=1).round(2),
+        'Maksimum': hasil_skenario.max(axis=1).round(2),
+    })
+    st.dataframe(ringkasan_skenario, use_container_width=True)
+
+
+@instrumentasi.terukur
+def tampilkan_prediksi(target, stasiun):
+    tampilan = TAMPILAN[target]
+    kunci = _kunci_state(target)
+
+    st.markdown("---")
+    st.markdown(f"<h1 style='text-align: center; padding-buttom: 80px;'>{tampilan['judul_prediksi']}</h1>", unsafe_allow_html=True)
+
+    model_rf = load_model(target, stasiun)
+
+    st.markdown('<h2 style="text-align: center; padding: 20px;">🔢 Parameter Prediksi 🔢</h2>', unsafe_allow_html=True)
+    data_terakhir, hari_prediksi, submitted = form_kondisi(target)
+
+    if model_rf is not None:
+        if submitted:
+            with st.spinner("Memproses prediksi..."):
+                # Hasil disimpan per target sehingga halaman lain tidak menampilkan prediksi target ini
+                st.session_state[f'prediksi_{kunci}'] = prediksi_masa_depan(target, data_terakhir, hari_prediksi, model_rf)
+                st.session_state[f'kondisi_terakhir_{kunci}'] = data_terakhir.iloc[0]
+
+        if f'prediksi_{kunci}' in st.session_state:
+            tampilkan_hasil_prediksi(target, st.session_state[f'prediksi_{kunci}'])
+        else:
+            tampilkan_contoh(target)
+
+    tampilkan_skenario(target, model_rf, hari_prediksi)
+
+
+def tampilkan_informasi_model(target):
+    kolom_target = model_cuaca.TARGET_CUACA[target]['kolom']
+    fitur = "\n".join(
+        f"- {INPUT_VARIABEL[variabel]['keterangan']}" for variabel in VARIABEL_CUACA if variabel != kolom_target
+    )
+
+    st.markdown("---")
+    st.markdown("<h3 style='text-align: center;'>📚 Informasi Model</h3>", unsafe_allow_html=True)
+    st.markdown(f"""
+Model prediksi {TAMPILAN[target]['nama']} ini menggunakan algoritma Random Forest yang telah dilatih dengan data historis. Fitur input yang digunakan meliputi:
+{fitur}
+- Data historis 1 hari sebelumnya
+- Rata-rata data 3 hari sebelumnya
+- Informasi waktu (hari, bulan, tahun)
+""")
+
+    st.markdown("-----------")
+    st.markdown("""
+<div style="text-align: center">
+    <p>Visualisasi dan Prediksi Data Cuaca Rangkaian Waktu</p>
+    <p>© 2025 - Mohammad Iqbal Maulana</p>
+</div>
+""", unsafe_allow_html=True)
+
+
+def tampilkan(target):
+    """
+    Menampilkan seluruh halaman peramalan untuk satu target.
+
+    Args:
+        target: Kunci target pada model_cuaca.TARGET_CUACA ('suhu', 'kelembapan' atau 'curah-hujan')
+    """
+    tampilan = TAMPILAN[target]
+    st.markdown(_CSS_HALAMAN, unsafe_allow_html=True)
+    st.markdown(f"<h1 style='text-align: center;'>{tampilan['judul']}</h1>", unsafe_allow_html=True)
+    st.markdown(f"""
+<div style='text-align: justify; font-size: 16px; text-indent: 40px; padding-bottom: 50px;'>
+{tampilan['deskripsi']}
+</div>
+""", unsafe_allow_html=True)
+
+    stasiun = pilih_stasiun()
+    time_series_data = load_data(stasiun)
+    if time_series_data is None:
+        return
+
+    tampilkan_dataset(time_series_data)
+    tampilkan_pola_cuaca(time_series_data, stasiun)
+    tampilkan_split(target, stasiun)
+    tampilkan_evaluasi(target, stasiun)
+    tampilkan_prediksi(target, stasiun)
+    tampilkan_informasi_model(target)
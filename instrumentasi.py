@@ -0,0 +1,221 @@
+"""
+Instrumentasi latensi per bagian halaman.
+
+Setiap bagian yang dibungkus `ukur` (context manager) atau `terukur` (decorator) dicatat ke
+ring buffer per proses: waktu wall, waktu CPU thread dan puncak alokasi memori selama bagian
+berjalan. Catatan diberi tag halaman dan nomor rerun dari `rerun`, yang dibungkuskan app.py
+ke setiap rerun; pemanggilan di luar rerun (misalnya pemanasan.py) bertag halaman None.
+
+Puncak alokasi diukur dengan tracemalloc dan bersifat sepanjang proses: alokasi thread lain
+yang berjalan bersamaan ikut terhitung. tracemalloc memperlambat rerun beberapa kali lipat,
+sehingga pelacakan memori mati secara default dan dinyalakan lewat variabel lingkungan
+INSTRUMENTASI_MEMORI=1 atau `atur_pelacakan_memori`; selama mati, kolom puncak_kb berisi None.
+
+Ringkasan persentil ditampilkan di halaman tersembunyi diagnostik.py dan dapat diekspor
+sebagai JSON lewat `ekspor_json`.
+
+Contoh:
+    with instrumentasi.ukur('rekomendasi.prediksi'):
+        hasil = model_tanaman.rekomendasi_top_k(mesin, X)
+
+    @instrumentasi.terukur
+    def load_split(target, stasiun):
+        ...
+"""
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+# Jumlah catatan maksimum di ring buffer; catatan tertua dibuang lebih dulu
+KAPASITAS = 20_000
+
+# Persentil yang dilaporkan `ringkasan`
+PERSENTIL = (50, 95, 99)
+
+_lacak_memori = os.environ.get('INSTRUMENTASI_MEMORI') == '1'
+
+_catatan = deque(maxlen=KAPASITAS)
+_lock = threading.Lock()
+# Bagian yang sedang berjalan di semua thread (id -> state), untuk melipat puncak memori
+# sebelum tracemalloc.reset_peak dipanggil bagian lain
+_aktif = {}
+_nomor_rerun = itertools.count(1)
+_lokal = threading.local()
+
+
+def atur_pelacakan_memori(aktif):
+    """
+    Menyalakan atau mematikan pengukuran puncak alokasi (tracemalloc) untuk bagian berikutnya.
+    """
+    global _lacak_memori
+    with _lock:
+        _lacak_memori = aktif
+        if not aktif and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def pelacakan_memori():
+    return _lacak_memori
+
+
+def _lipat_puncak():
+    # Pemanggil memegang _lock
+    puncak = tracemalloc.get_traced_memory()[1]
+    for state in _aktif.values():
+        state['puncak'] = max(state['puncak'], puncak - state['memori_awal'])
+
+
+@contextmanager
+def ukur(bagian):
+    """
+    Mencatat waktu wall, waktu CPU thread dan puncak alokasi satu bagian.
+
+    Args:
+        bagian: Nama bagian, misalnya 'model_cuaca.load_split'
+    """
+    state = None
+    with _lock:
+        if _lacak_memori:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            _lipat_puncak()
+            tracemalloc.reset_peak()
+            state = {'memori_awal': tracemalloc.get_traced_memory()[0], 'puncak': 0}
+            _aktif[id(state)] = state
+    waktu = time.time()
+    awal_wall = time.perf_counter()
+    awal_cpu = time.thread_time()
+    galat = None
+    try:
+        yield
+    except BaseException as e:
+        galat = type(e).__name__
+        raise
+    finally:
+        wall = time.perf_counter() - awal_wall
+        cpu = time.thread_time() - awal_cpu
+        with _lock:
+            puncak_kb = None
+            if state is not None:
+                # Pelacakan yang dimatikan di tengah bagian tidak menghasilkan puncak yang sahih
+                if tracemalloc.is_tracing():
+                    _lipat_puncak()
+                    puncak_kb = state['puncak'] / 1024
+                del _aktif[id(state)]
+            _catatan.append({
+                'waktu': waktu,
+                'halaman': getattr(_lokal, 'halaman', None),
+                'rerun': getattr(_lokal, 'rerun', None),
+                'bagian': bagian,
+                'wall_ms': wall * 1000,
+                'cpu_ms': cpu * 1000,
+                'puncak_kb': puncak_kb,
+                'galat': galat,
+            })
+
+
+def terukur(fungsi=None, *, bagian=None):
+    """
+    Decorator `ukur` untuk satu fungsi. Tanpa argumen, nama bagian adalah 'modul.fungsi'.
+
+    Contoh: `@terukur` atau `@terukur(bagian='rekomendasi.load_model')`
+    """
+    def bungkus(fungsi):
+        nama = bagian or f'{fungsi.__module__}.{fungsi.__qualname__}'
+
+        @functools.wraps(fungsi)
+        def terbungkus(*args, **kwargs):
+            with ukur(nama):
+                return fungsi(*args, **kwargs)
+        return terbungkus
+    return bungkus(fungsi) if fungsi is not None else bungkus
+
+
+@contextmanager
+def rerun(halaman):
+    """
+    Menandai satu rerun halaman: bagian yang diukur di thread ini diberi tag halaman dan nomor
+    rerun yang sama, dan total rerun dicatat sebagai bagian 'rerun'.
+    """
+    _lokal.halaman, _lokal.rerun = halaman, next(_nomor_rerun)
+    try:
+        with ukur('rerun'):
+            yield
+    finally:
+        _lokal.halaman = _lokal.rerun = None
+
+
+def catatan():
+    """
+    Salinan isi ring buffer, dari yang terlama.
+
+    Returns:
+        List dictionary berisi waktu, halaman, rerun, bagian, wall_ms, cpu_ms, puncak_kb dan galat
+    """
+    with _lock:
+        return list(_catatan)
+
+
+def kosongkan():
+    with _lock:
+        _catatan.clear()
+
+
+def ringkasan(data=None):
+    """
+    Persentil waktu wall, waktu CPU dan puncak alokasi per (halaman, bagian).
+
+    Args:
+        data: List catatan; default isi ring buffer saat ini
+    Returns:
+        List dictionary per (halaman, bagian) berisi jumlah catatan dan kolom
+        '<metrik>_p<persentil>' untuk setiap metrik dan persentil PERSENTIL, diurutkan dari
+        total waktu wall terbesar
+    """
+    data = catatan() if data is None else data
+    kelompok = {}
+    for c in data:
+        kelompok.setdefault((c['halaman'], c['bagian']), []).append(c)
+
+    hasil = []
+    for (halaman, bagian), isi in kelompok.items():
+        baris = {'halaman': halaman, 'bagian': bagian, 'n': len(isi)}
+        for metrik in ('wall_ms', 'cpu_ms', 'puncak_kb'):
+            nilai = np.array([c[metrik] for c in isi if c[metrik] is not None], dtype=float)
+            persentil = np.percentile(nilai, PERSENTIL) if len(nilai) else [None] * len(PERSENTIL)
+            for p, v in zip(PERSENTIL, persentil):
+                baris[f'{metrik}_p{p}'] = None if v is None else float(v)
+        baris['wall_ms_total'] = float(sum(c['wall_ms'] for c in isi))
+        hasil.append(baris)
+    return sorted(hasil, key=lambda baris: -baris['wall_ms_total'])
+
+
+def ekspor_json(path=None):
+    """
+    Mengekspor catatan mentah dan ringkasannya sebagai JSON untuk monitoring.
+
+    Args:
+        path: File tujuan; jika None JSON hanya dikembalikan
+    Returns:
+        String JSON berisi 'dibuat', 'pid', 'kapasitas', 'catatan' dan 'ringkasan'
+    """
+    data = catatan()
+    isi = json.dumps({
+        'dibuat': time.time(),
+        'pid': os.getpid(),
+        'kapasitas': KAPASITAS,
+        'catatan': data,
+        'ringkasan': ringkasan(data),
+    }, ensure_ascii=False)
+    if path is not None:
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(isi)
+    return isi
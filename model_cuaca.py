@@ -0,0 +1,365 @@
+"""
+Lapisan artefak model untuk halaman peramalan cuaca (suhu, kelembapan, curah hujan).
+
+Model yang sudah dilatih, prediksi data uji, dan metrik evaluasinya dimuat sekali per
+proses dan disimpan dalam cache dengan kunci hash file split dan file model. Pelatihan
+ulang hanya terjadi lewat pemanggilan eksplisit `latih_ulang_model` atau pipeline
+headless `pelatihan.py`.
+
+Setiap stasiun dapat memiliki model dan split sendiri di Model/<ID>/ dan Split_Data/<ID>/;
+stasiun tanpa file sendiri memakai model stasiun utama (Model/ dan Split_Data/). Artefak
+turunan disimpan di partisi cache stasiun pemilik file, Cache/stasiun/<ID>/.
+
+File pickle/joblib hanya dibaca sekali per versi: split data dan pohon model diekspor ke
+folder `.npy` di Cache/ yang dibuka memory-mapped, sehingga beberapa worker Streamlit
+berbagi halaman memori fisik yang sama dan start dingin tidak perlu unpickle.
+
+Mengekspor semua artefak secara offline:
+    python model_cuaca.py
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import joblib
+import numpy as np
+import pandas as pd
+
+import instrumentasi
+import pohon
+from artefak import (
+    BASE_DIR, STASIUN_UTAMA, ambil_cache_lru, buka_artefak, folder_stasiun, hash_file, hash_gabungan, simpan_array,
+    validasi_stasiun
+)
+
+MODEL_DIR = os.path.join(BASE_DIR, 'Model')
+SPLIT_DIR = os.path.join(BASE_DIR, 'Split_Data')
+
+# Konfigurasi setiap target peramalan
+TARGET_CUACA = {
+    'suhu': {'kolom': 'Suhu_Rata-Rata', 'judul': 'Suhu'},
+    'kelembapan': {'kolom': 'Kelembapan_Rata-Rata', 'judul': 'Kelembapan'},
+    'curah-hujan': {'kolom': 'Curah_Hujan', 'judul': 'Curah Hujan'},
+}
+
+# Kode algoritma sesuai akhiran nama file model
+ALGORITMA = {
+    'rf': 'Random Forest',
+    'gb': 'Gradient Boosting',
+    'xgb': 'XGBoost',
+}
+
+METRIK = ['MAE', 'MSE', 'RMSE', 'R²', 'MAPE']
+STATISTIK_ERROR = ['Min', 'Max', 'Mean', 'Median', 'Std Dev']
+
+_cache = OrderedDict()
+_lock = threading.RLock()
+
+
+def _path_stasiun(folder, nama_file, stasiun, cadangan):
+    if stasiun != STASIUN_UTAMA:
+        path = os.path.join(folder, validasi_stasiun(stasiun), nama_file)
+        if not cadangan or os.path.exists(path):
+            return path
+    return os.path.join(folder, nama_file)
+
+
+def path_split(target, stasiun=STASIUN_UTAMA, cadangan=True):
+    """
+    Path file split stasiun. Dengan `cadangan=True`, stasiun tanpa split sendiri
+    memakai split stasiun utama.
+    """
+    return _path_stasiun(SPLIT_DIR, f'split_data_{target}.pkl', stasiun, cadangan)
+
+
+def path_model(target, algoritma, stasiun=STASIUN_UTAMA, cadangan=True):
+    """
+    Path file model stasiun. Dengan `cadangan=True`, stasiun tanpa model sendiri
+    memakai model stasiun utama.
+    """
+    return _path_stasiun(MODEL_DIR, f'model_{target}_{algoritma}.joblib', stasiun, cadangan)
+
+
+def _stasiun_pemilik(path):
+    """
+    ID stasiun pemilik file model/split, dipakai untuk memilih partisi cache.
+    """
+    folder = os.path.dirname(path)
+    return STASIUN_UTAMA if folder in (MODEL_DIR, SPLIT_DIR) else os.path.basename(folder)
+
+
+def _ambil_cache(kunci, pembuat):
+    with _lock:
+        return ambil_cache_lru(_cache, kunci, pembuat)
+
+
+def _ndarray(arrays):
+    # View ndarray biasa atas memmap menghindari overhead subclass memmap pada setiap indexing
+    return {nama: np.asarray(array) for nama, array in arrays.items()}
+
+
+def path_cache_split(target, versi, stasiun=STASIUN_UTAMA):
+    return os.path.join(folder_stasiun(_stasiun_pemilik(path_split(target, stasiun))), f'split_{target}_{versi}')
+
+
+def ekspor_split(target, versi=None, stasiun=STASIUN_UTAMA):
+    """
+    Mengekspor split data pickle ke array `.npy`. Kolom dengan dtype yang sama disimpan
+    sebagai satu matriks (kolom x baris) sehingga setiap kolom bersebelahan di memori.
+
+    Returns:
+        Path folder split
+    """
+    path = path_split(target, stasiun)
+    versi = versi or hash_file(path)
+    arrays, meta = {}, {'versi': versi}
+    for nama, objek in zip(('X_train', 'X_test', 'y_train', 'y_test'), joblib.load(path)):
+        arrays[f'{nama}_index'] = objek.index.to_numpy()
+        if isinstance(objek, pd.Series):
+            arrays[nama] = objek.to_numpy()
+            meta[nama] = {'nama': objek.name}
+            continue
+        grup = {}
+        for kolom, dtype in objek.dtypes.items():
+            grup.setdefault(str(dtype), []).append(kolom)
+        for dtype, kolom_grup in grup.items():
+            arrays[f'{nama}_{dtype}'] = objek[kolom_grup].to_numpy(dtype=dtype).T
+        meta[nama] = {'kolom': list(objek.columns), 'grup': grup}
+    folder = path_cache_split(target, versi, stasiun)
+    simpan_array(folder, arrays, meta)
+    return folder
+
+
+def _split_dari_array(arrays, meta):
+    hasil = []
+    for nama in ('X_train', 'X_test', 'y_train', 'y_test'):
+        index = pd.Index(arrays[f'{nama}_index'])
+        if 'kolom' not in meta[nama]:
+            hasil.append(pd.Series(arrays[nama], index=index, name=meta[nama]['nama'], copy=False))
+            continue
+        data = {}
+        for dtype, kolom_grup in meta[nama]['grup'].items():
+            matriks = arrays[f'{nama}_{dtype}']
+            data.update({kolom: matriks[i] for i, kolom in enumerate(kolom_grup)})
+        # copy=False agar kolom DataFrame tetap menunjuk ke halaman memmap
+        hasil.append(pd.DataFrame({kolom: data[kolom] for kolom in meta[nama]['kolom']}, index=index, copy=False))
+    return tuple(hasil)
+
+
+@instrumentasi.terukur
+def load_split(target, stasiun=STASIUN_UTAMA):
+    """
+    Memuat (X_train, X_test, y_train, y_test) untuk target dan stasiun tertentu, sekali per versi file.
+    """
+    path = path_split(target, stasiun)
+    versi = hash_file(path)
+
+    def muat():
+        arrays, meta = buka_artefak(
+            path_cache_split(target, versi, stasiun), lambda: ekspor_split(target, versi, stasiun)
+        )
+        return _split_dari_array(_ndarray(arrays), meta)
+    return _ambil_cache(('split', path, versi), muat)
+
+
+@instrumentasi.terukur
+def hitung_evaluasi(y_test, y_pred, bins=30):
+    """
+    Menghitung semua metrik, statistik kesalahan dan histogram residual untuk banyak model
+    sekaligus. Matriks kesalahan dihitung sekali lalu setiap besaran diturunkan lewat
+    reduksi per baris, tanpa perulangan per model.
+
+    Args:
+        y_test: Nilai aktual data uji (n_sampel,)
+        y_pred: Matriks prediksi (n_model, n_sampel) atau satu vektor prediksi
+        bins: Jumlah bin histogram residual; semua model memakai tepi bin yang sama
+    Returns:
+        Dictionary berisi 'metrik' (n_model, len(METRIK)), 'statistik_error'
+        (n_model, len(STATISTIK_ERROR)), 'histogram' (n_model, bins) dan 'tepi_bin' (bins + 1,)
+    """
+    y_true = np.asarray(y_test, dtype=float)
+    y_pred = np.atleast_2d(np.asarray(y_pred, dtype=float))
+    error = y_true - y_pred
+    abs_error = np.abs(error)
+    sse = np.einsum('ij,ij->i', error, error)
+    mse = sse / error.shape[1]
+    ss_tot = np.sum((y_true - y_true.mean()) ** 2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mape = np.mean(abs_error / np.abs(y_true), axis=1) * 100
+    metrik = np.column_stack([abs_error.mean(axis=1), mse, np.sqrt(mse), 1 - sse / ss_tot, mape])
+
+    rata = error.mean(axis=1)
+    statistik = np.column_stack([
+        error.min(axis=1), error.max(axis=1), rata, np.median(error, axis=1),
+        np.sqrt(np.mean((error - rata[:, np.newaxis]) ** 2, axis=1)),
+    ])
+
+    # Histogram semua model dalam satu bincount atas indeks (model, bin)
+    bawah, atas = statistik[:, 0].min(), statistik[:, 1].max()
+    if not atas > bawah:
+        atas = bawah + 1.0
+    tepi = np.linspace(bawah, atas, bins + 1)
+    indeks = np.clip(((error - bawah) / (atas - bawah) * bins).astype(np.int64), 0, bins - 1)
+    indeks += np.arange(error.shape[0])[:, np.newaxis] * bins
+    histogram = np.bincount(indeks.ravel(), minlength=error.shape[0] * bins).reshape(error.shape[0], bins)
+
+    return {'metrik': metrik, 'statistik_error': statistik, 'histogram': histogram, 'tepi_bin': tepi}
+
+
+def hitung_metrik(y_test, y_pred):
+    """
+    Menghitung metrik evaluasi regresi untuk satu model.
+
+    Args:
+        y_test: Nilai aktual data uji
+        y_pred: Nilai prediksi model
+    Returns:
+        Dictionary berisi MAE, MSE, RMSE, R² dan MAPE
+    """
+    return dict(zip(METRIK, hitung_evaluasi(y_test, y_pred)['metrik'][0]))
+
+
+def path_cache_artefak(target, algoritma, versi, stasiun=STASIUN_UTAMA):
+    pemilik = _stasiun_pemilik(path_model(target, algoritma, stasiun))
+    return os.path.join(folder_stasiun(pemilik), f'model_{target}_{algoritma}_{versi}')
+
+
+def ekspor_artefak(target, algoritma, versi=None, stasiun=STASIUN_UTAMA):
+    """
+    Mengekspor model joblib ke folder artefak: prediksi data uji, metrik dan, untuk model
+    berbasis pohon, array node hasil `pohon.ratakan_regresor`.
+
+    Returns:
+        Path folder artefak
+    """
+    versi = versi or hash_gabungan(path_split(target, stasiun), path_model(target, algoritma, stasiun))
+    X_train, X_test, y_train, y_test = load_split(target, stasiun)
+    objek = joblib.load(path_model(target, algoritma, stasiun))
+
+    # File XGBoost hanya berisi array prediksi data uji, bukan model
+    if isinstance(objek, np.ndarray):
+        jenis, hutan, y_pred = 'prediksi', None, objek
+    else:
+        hutan = pohon.ratakan_regresor(objek)
+        jenis = 'sklearn' if hutan is None else 'pohon'
+        y_pred = objek.predict(X_test)
+
+    arrays = {'y_pred': np.asarray(y_pred, dtype=float)}
+    meta = {
+        'versi': versi,
+        'jenis': jenis,
+        'metrik': {nama: float(nilai) for nama, nilai in hitung_metrik(y_test, y_pred).items()},
+    }
+    if hutan is not None:
+        arrays.update({nama: hutan[nama] for nama in ('fitur', 'threshold', 'anak', 'daun', 'nilai', 'akar')})
+        meta.update({nama: hutan[nama] for nama in ('kedalaman', 'skala', 'bias', 'n_fitur')})
+        meta = {nama: nilai.item() if isinstance(nilai, np.generic) else nilai for nama, nilai in meta.items()}
+    folder = path_cache_artefak(target, algoritma, versi, stasiun)
+    simpan_array(folder, arrays, meta)
+    return folder
+
+
+@instrumentasi.terukur
+def _buat_artefak(target, algoritma, versi, stasiun):
+    arrays, meta = buka_artefak(
+        path_cache_artefak(target, algoritma, versi, stasiun), lambda: ekspor_artefak(target, algoritma, versi, stasiun)
+    )
+    arrays = _ndarray(arrays)
+
+    if meta['jenis'] == 'pohon':
+        # Model berbasis pohon dipakai langsung dalam bentuk array datar (lihat peramalan.py)
+        model = {**{nama: array for nama, array in arrays.items() if nama != 'y_pred'}, **meta}
+    elif meta['jenis'] == 'sklearn':
+        model = joblib.load(path_model(target, algoritma, stasiun))
+    else:
+        model = None
+
+    return {
+        'target': target,
+        'algoritma': algoritma,
+        'versi': versi,
+        'model': model,
+        'y_pred': arrays['y_pred'],
+        'metrik': meta['metrik'],
+    }
+
+
+@instrumentasi.terukur
+def load_artefak(target, algoritma, stasiun=STASIUN_UTAMA):
+    """
+    Memuat model yang sudah dilatih beserta prediksi data uji dan metriknya.
+
+    Args:
+        target: Kunci target pada TARGET_CUACA ('suhu', 'kelembapan', 'curah-hujan')
+        algoritma: Kunci algoritma pada ALGORITMA ('rf', 'gb', 'xgb')
+        stasiun: ID stasiun; stasiun tanpa model sendiri memakai model stasiun utama
+    Returns:
+        Dictionary berisi model (array pohon datar, model sklearn, atau None untuk file
+        prediksi), y_pred, metrik dan versi artefak
+    """
+    path = path_model(target, algoritma, stasiun)
+    versi = hash_gabungan(path_split(target, stasiun), path)
+    kunci = ('artefak', target, algoritma, _stasiun_pemilik(path), versi)
+    return _ambil_cache(kunci, lambda: _buat_artefak(target, algoritma, versi, stasiun))
+
+
+@instrumentasi.terukur
+def load_evaluasi(target, algoritma=tuple(ALGORITMA), stasiun=STASIUN_UTAMA, bins=30):
+    """
+    Evaluasi gabungan beberapa model satu target (lihat `hitung_evaluasi`), dihitung
+    sekali per kombinasi versi artefak.
+
+    Args:
+        target: Kunci target pada TARGET_CUACA
+        algoritma: Urutan algoritma; baris hasil mengikuti urutan ini
+        stasiun: ID stasiun
+        bins: Jumlah bin histogram residual
+    Returns:
+        Dictionary hasil `hitung_evaluasi` ditambah 'algoritma'
+    """
+    daftar_artefak = [load_artefak(target, a, stasiun) for a in algoritma]
+    kunci = ('evaluasi', target, tuple(algoritma), tuple(a['versi'] for a in daftar_artefak), bins)
+
+    def hitung():
+        y_test = load_split(target, stasiun)[3]
+        hasil = hitung_evaluasi(y_test, np.vstack([a['y_pred'] for a in daftar_artefak]), bins)
+        return {'algoritma': list(algoritma), **hasil}
+    return _ambil_cache(kunci, hitung)
+
+
+@instrumentasi.terukur
+def latih_ulang_model(target, algoritma, stasiun=STASIUN_UTAMA):
+    """
+    Melatih ulang model pada data training stasiun lalu menyimpannya ke file model
+    milik stasiun tersebut (Model/<ID>/ untuk selain stasiun utama). Hash file model berubah sehingga pemanggilan `load_artefak` berikutnya
+    otomatis menghitung ulang prediksi dan metrik.
+    """
+    # Import di sini agar start halaman tidak perlu memuat sklearn
+    from sklearn.base import clone
+
+    # Artefak di Cache/ hanya berisi array; hyperparameter diambil dari file model asli
+    objek = joblib.load(path_model(target, algoritma, stasiun))
+    if isinstance(objek, np.ndarray):
+        raise ValueError(f"Artefak '{algoritma}' untuk '{target}' tidak berisi model yang dapat dilatih ulang.")
+
+    model = clone(objek)
+    X_train, X_test, y_train, y_test = load_split(target, stasiun)
+    model.fit(X_train, y_train)
+    path = path_model(target, algoritma, stasiun, cadangan=False)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    joblib.dump(model, path)
+
+    # Buang entri lama agar memori tidak menyimpan versi yang sudah usang; kuncinya memakai
+    # stasiun pemilik file model seperti `load_artefak`
+    with _lock:
+        for kunci in [k for k in _cache if k[:4] == ('artefak', target, algoritma, _stasiun_pemilik(path))]:
+            del _cache[kunci]
+    return load_artefak(target, algoritma, stasiun)
+
+
+if __name__ == '__main__':
+    for target in TARGET_CUACA:
+        print(f"Split {target} -> {ekspor_split(target)}")
+        for algoritma in ALGORITMA:
+            if os.path.exists(path_model(target, algoritma)):
+                print(f"Model {target}/{algoritma} -> {ekspor_artefak(target, algoritma)}")
@@ -0,0 +1,313 @@
+"""
+Model klasifikasi rekomendasi tanaman (Random Forest) dan bundel evaluasinya.
+
+Untuk inferensi, hutan pohon diekspor sekali ke array NumPy datar (lihat `pohon.py`) yang
+dibuka memory-mapped; prediksinya identik bit demi bit dengan model pickle.
+
+Bundel evaluasi berisi y_pred, confusion matrix, classification report per kelas dan
+akurasi pada Dataset/X_test.csv. Bundel dibuat sekali per versi model dan data uji,
+lalu dibuka memory-mapped sehingga halaman tidak menjalankan inferensi setiap rerun.
+
+Membuat bundel secara offline:
+    python model_tanaman.py
+"""
+import os
+import pickle
+import threading
+
+import numpy as np
+import pandas as pd
+
+import instrumentasi
+import pohon
+from artefak import BASE_DIR, CACHE_DIR, buka_artefak, hash_file, hash_gabungan, simpan_array
+
+MODEL_PATH = os.path.join(BASE_DIR, 'Model', 'model_RandomForest copy.pkl')
+X_TEST_PATH = os.path.join(BASE_DIR, 'Dataset', 'X_test.csv')
+Y_TEST_PATH = os.path.join(BASE_DIR, 'Dataset', 'y_test.csv')
+DATASET_PATH = os.path.join(BASE_DIR, 'Dataset', 'Crop_recommendation_ID.csv')
+
+FITUR_TANAMAN = ['N', 'P', 'K', 'temperature', 'humidity', 'ph', 'rainfall']
+# Variabel yang digambar secara default pada grafik sebaran halaman rekomendasi
+FITUR_SEBARAN_DEFAULT = ['N', 'P', 'K']
+# Nilai awal ukuran plot dan jumlah label pada pairplot halaman rekomendasi
+TINGGI_PAIRPLOT_DEFAULT = 3
+JUMLAH_LABEL_DEFAULT = 3
+# Judul heatmap confusion matrix; tidak termasuk kunci cache gambarnya
+JUDUL_CONFUSION_MATRIX = "Confusion Matrix - Random Forest"
+
+# Mapping Label Encoding ke Nama Tanaman
+LABEL_TANAMAN = {
+    'padi': 0,
+    'jagung': 1,
+    'buncis': 2,
+    'kacang merah': 3,
+    'kacang polong': 4,
+    'kacang panjang': 5,
+    'kacang hijau': 6,
+    'kacang hitam': 7,
+    'lentil': 8,
+    'delima': 9,
+    'pisang': 10,
+    'mangga': 11,
+    'anggur': 12,
+    'semangka': 13,
+    'melon': 14,
+    'apel': 15,
+    'jeruk': 16,
+    'pepaya': 17,
+    'kelapa': 18,
+    'kapas': 19,
+    'goni': 20,
+    'kopi': 21
+}
+
+NAMA_TANAMAN = {v: k for k, v in LABEL_TANAMAN.items()}
+
+_cache = {}
+_lock = threading.RLock()
+
+
+def _ambil_cache(kunci, pembuat):
+    with _lock:
+        if kunci not in _cache:
+            _cache[kunci] = pembuat()
+        return _cache[kunci]
+
+
+def kunci_sebaran(versi_dataset, kolom, kolom_cari, kueri):
+    """
+    Kunci cache grafik sebaran halaman rekomendasi: versi dataset dan filter tabel.
+    Dipakai bersama oleh rekomendasi.py dan pemanasan.py.
+    """
+    return (versi_dataset, tuple(kolom), kolom_cari, kueri)
+
+
+def kunci_pairplot(versi_dataset, variabel, tinggi, label, sampel_per_label, mode):
+    """
+    Kunci cache pairplot halaman rekomendasi.
+
+    Args:
+        versi_dataset: Hash file dataset
+        variabel: Variabel yang dibandingkan
+        tinggi: Ukuran plot
+        label: Label tanaman yang dipilih
+        sampel_per_label: Mapping label -> jumlah sampel (kosong berarti semua baris)
+        mode: 'splom' (WebGL) atau 'pairplot' (seaborn)
+    """
+    return (versi_dataset, tuple(variabel), tinggi, tuple(label), tuple(sampel_per_label.items()), mode)
+
+
+def kunci_confusion_matrix(versi_evaluasi):
+    return ('confusion_matrix', versi_evaluasi)
+
+
+def tinggi_splom(tinggi, n_variabel):
+    """
+    Tinggi figure scatter matrix dalam piksel untuk ukuran plot pairplot `tinggi`.
+    """
+    return 80 * tinggi * n_variabel + 100
+
+
+@instrumentasi.terukur
+def load_dataset():
+    """
+    Membaca dataset rekomendasi tanaman, sekali per versi file. DataFrame hasil dibagikan
+    antar sesi sehingga pemanggil tidak boleh mengubahnya.
+    """
+    return _ambil_cache(('dataset', hash_file(DATASET_PATH)), lambda: pd.read_csv(DATASET_PATH))
+
+
+@instrumentasi.terukur
+def load_model():
+    """
+    Memuat model Random Forest dari file .pkl, sekali per versi file.
+    """
+    def muat():
+        with open(MODEL_PATH, 'rb') as file:
+            return pickle.load(file)
+    return _ambil_cache(('model', hash_file(MODEL_PATH)), muat)
+
+
+def path_mesin(versi):
+    return os.path.join(CACHE_DIR, f'pohon_tanaman_{versi}')
+
+
+def ekspor_mesin(versi=None):
+    """
+    Meratakan seluruh pohon model pickle ke array bersebelahan dan menyimpannya ke disk.
+
+    Returns:
+        Path folder mesin inferensi
+    """
+    versi = versi or hash_file(MODEL_PATH)
+    hutan = pohon.ratakan_klasifikasi(load_model())
+    if hutan is None:
+        raise TypeError("Model tanaman tidak dapat diratakan; hanya RandomForestClassifier satu output yang didukung.")
+    folder = path_mesin(versi)
+    simpan_array(
+        folder,
+        {nama: hutan[nama] for nama in ('fitur', 'threshold', 'anak', 'daun', 'nilai', 'akar', 'classes')},
+        meta={'versi': versi, 'kedalaman': int(hutan['kedalaman']), 'n_fitur': int(hutan['n_fitur'])}
+    )
+    return folder
+
+
+@instrumentasi.terukur
+def load_mesin():
+    """
+    Membuka mesin inferensi datar untuk versi model saat ini, mengekspornya jika belum ada.
+
+    Returns:
+        Dictionary array node (memory-mapped) yang dapat dipakai `pohon.prediksi_proba`
+    """
+    versi = hash_file(MODEL_PATH)
+
+    def muat():
+        arrays, meta = buka_artefak(path_mesin(versi), lambda: ekspor_mesin(versi))
+        # View ndarray biasa atas memmap menghindari overhead subclass memmap pada setiap indexing
+        return {**{nama: np.asarray(array) for nama, array in arrays.items()}, **meta}
+    return _ambil_cache(('mesin', versi), muat)
+
+
+def _matriks_fitur(X):
+    if isinstance(X, pd.DataFrame):
+        X = X[FITUR_TANAMAN]
+    return np.atleast_2d(np.asarray(X, dtype=float))
+
+
+@instrumentasi.terukur
+def prediksi_proba(mesin, X):
+    """
+    Probabilitas setiap tanaman (urutan kolom mengikuti classes_).
+
+    Args:
+        mesin: Hasil `load_mesin()` atau model sklearn dengan predict_proba
+        X: DataFrame/array (n_baris, FITUR_TANAMAN) atau satu baris 1D
+    """
+    if isinstance(mesin, dict):
+        return pohon.prediksi_proba(mesin, _matriks_fitur(X))
+    if not isinstance(X, pd.DataFrame):
+        X = pd.DataFrame(_matriks_fitur(X), columns=FITUR_TANAMAN)
+    return mesin.predict_proba(X)
+
+
+def prediksi(mesin, X):
+    """
+    Kode label tanaman hasil prediksi, sama dengan `model.predict`.
+    """
+    if isinstance(mesin, dict):
+        return pohon.prediksi_kelas(mesin, _matriks_fitur(X))
+    if not isinstance(X, pd.DataFrame):
+        X = pd.DataFrame(_matriks_fitur(X), columns=FITUR_TANAMAN)
+    return mesin.predict(X)
+
+
+@instrumentasi.terukur
+def rekomendasi_top_k(model, X, k=3, ambang=0.0):
+    """
+    Mengambil k tanaman paling sesuai beserta probabilitasnya untuk setiap baris.
+
+    Probabilitas dihitung sekali lewat `prediksi_proba`; k kandidat teratas dipilih dengan
+    `argpartition` lalu hanya k kolom tersebut yang diurutkan per baris.
+
+    Args:
+        model: Hasil `load_mesin()` atau model klasifikasi dengan predict_proba dan classes_
+        X: DataFrame/array (n_baris, FITUR_TANAMAN) atau satu baris 1D
+        k: Jumlah rekomendasi per baris
+        ambang: Probabilitas minimum; kandidat di bawahnya diberi kode -1 dan probabilitas NaN
+    Returns:
+        Tuple (kode (n_baris, k), probabilitas (n_baris, k)) terurut dari yang paling sesuai
+    """
+    proba = prediksi_proba(model, X)
+    n_kelas = proba.shape[1]
+    k = max(1, min(int(k), n_kelas))
+
+    if k < n_kelas:
+        kandidat = np.argpartition(-proba, k - 1, axis=1)[:, :k]
+    else:
+        kandidat = np.broadcast_to(np.arange(n_kelas), proba.shape)
+    proba_kandidat = np.take_along_axis(proba, kandidat, axis=1)
+    # Urutan stabil agar kelas dengan probabilitas sama mengikuti urutan classes_ seperti argmax
+    urutan = np.lexsort((kandidat, -proba_kandidat), axis=1)
+    indeks = np.take_along_axis(kandidat, urutan, axis=1)
+    proba_top = np.take_along_axis(proba_kandidat, urutan, axis=1)
+    # Jika beberapa kelas seri di posisi teratas, argpartition bisa memilih kelas mana saja;
+    # kolom pertama disamakan dengan argmax agar konsisten dengan model.predict
+    indeks[:, 0] = proba.argmax(axis=1)
+
+    classes = model['classes'] if isinstance(model, dict) else model.classes_
+    kode = np.asarray(classes)[indeks].astype(np.int64)
+    di_bawah_ambang = proba_top < ambang
+    kode[di_bawah_ambang] = -1
+    proba_top = np.where(di_bawah_ambang, np.nan, proba_top)
+    return kode, proba_top
+
+
+def versi_evaluasi():
+    return hash_gabungan(MODEL_PATH, X_TEST_PATH, Y_TEST_PATH)
+
+
+def path_evaluasi(versi):
+    return os.path.join(CACHE_DIR, f'evaluasi_tanaman_{versi}')
+
+
+@instrumentasi.terukur
+def buat_evaluasi(versi=None):
+    """
+    Menjalankan inferensi pada data uji lalu menyimpan bundel evaluasi ke disk.
+
+    Returns:
+        Path folder bundel evaluasi
+    """
+    # Import di sini agar pemuatan bundel tidak perlu memuat sklearn.metrics
+    from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+
+    versi = versi or versi_evaluasi()
+    model = load_model()
+    X_test = pd.read_csv(X_TEST_PATH)
+    y_test = pd.read_csv(Y_TEST_PATH).values.ravel()
+    y_pred = model.predict(X_test)
+
+    y_test_labels = [NAMA_TANAMAN[label] for label in y_test]
+    y_pred_labels = [NAMA_TANAMAN[label] for label in y_pred]
+
+    folder = path_evaluasi(versi)
+    simpan_array(
+        folder,
+        {
+            'y_test': y_test,
+            'y_pred': y_pred,
+            'confusion_matrix': confusion_matrix(y_test, y_pred),
+        },
+        meta={
+            'versi': versi,
+            'accuracy': accuracy_score(y_test, y_pred),
+            'report': classification_report(y_test_labels, y_pred_labels, output_dict=True),
+        }
+    )
+    return folder
+
+
+@instrumentasi.terukur
+def load_evaluasi():
+    """
+    Membuka bundel evaluasi untuk versi model saat ini, membuatnya jika belum ada.
+
+    Returns:
+        Dictionary berisi y_test, y_pred, confusion_matrix (memory-mapped), accuracy dan report
+    """
+    versi = versi_evaluasi()
+
+    def muat():
+        arrays, meta = buka_artefak(path_evaluasi(versi), lambda: buat_evaluasi(versi))
+        return {**arrays, **meta}
+    return _ambil_cache(('evaluasi', versi), muat)
+
+
+if __name__ == '__main__':
+    print(f"Mesin inferensi disimpan di {ekspor_mesin()}")
+    folder = buat_evaluasi()
+    evaluasi = load_evaluasi()
+    print(f"Bundel evaluasi disimpan di {folder}")
+    print(f"Akurasi: {evaluasi['accuracy'] * 100:.2f}%")
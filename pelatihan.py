@@ -0,0 +1,273 @@
+"""
+Pipeline pelatihan headless untuk semua model peramalan cuaca.
+
+Setiap kombinasi (target, algoritma, stasiun) adalah satu tugas yang dijalankan paralel
+di process pool. Setiap tugas melatih ulang model pada split stasiun dengan hyperparameter
+dari file model yang sudah ada, menyimpannya ke Model/ (atau Model/<ID>/), lalu mengekspor
+artefak berversi berisi prediksi data uji, metrik dan array pohon datar ke partisi cache
+stasiun (lihat model_cuaca.py). Model XGBoost disimpan sebagai model utuh, bukan array
+prediksi beku.
+
+Split dibuat sekali per (target, stasiun) sebelum tugas dibagikan: split yang sudah ada
+dipakai ulang agar metrik tetap sebanding, kecuali diminta `split_baru`. Cache `.npy` split
+juga diekspor di proses utama, sehingga pekerja hanya membaca artefak bersama dan hanya
+menulis model serta artefak miliknya sendiri.
+
+Contoh:
+    python pelatihan.py --n-jobs -1
+    python pelatihan.py --target suhu --algoritma rf gb --stasiun utama B01 --batas-waktu 600
+"""
+import argparse
+import importlib.util
+import multiprocessing
+import os
+import sys
+import time
+
+import joblib
+import numpy as np
+
+import data_cuaca
+import model_cuaca
+from artefak import STASIUN_UTAMA, hash_file
+
+# Porsi data uji, sama dengan split bawaan di Split_Data/
+UKURAN_UJI = 0.2
+RANDOM_STATE = 42
+
+# Parameter untuk algoritma yang belum memiliki file model sama sekali: default library
+# dengan random_state tetap, seperti model bawaan di Model/. Model yang sudah ada dilatih
+# ulang dengan hyperparameter dari filenya sendiri (lihat `buat_model`)
+PARAMETER_BAWAAN = {
+    'rf': {'random_state': 0},
+    'gb': {'random_state': 0},
+    'xgb': {'random_state': 0},
+}
+
+
+def xgboost_tersedia():
+    return importlib.util.find_spec('xgboost') is not None
+
+
+def _import_xgboost():
+    try:
+        import xgboost
+    except ImportError as e:
+        raise ImportError("Melatih model 'xgb' membutuhkan paket 'xgboost' (pip install xgboost).") from e
+    return xgboost
+
+
+def _model_bawaan(algoritma):
+    parameter = PARAMETER_BAWAAN[algoritma]
+    if algoritma == 'rf':
+        from sklearn.ensemble import RandomForestRegressor
+        return RandomForestRegressor(**parameter)
+    if algoritma == 'gb':
+        from sklearn.ensemble import GradientBoostingRegressor
+        return GradientBoostingRegressor(**parameter)
+    if algoritma == 'xgb':
+        return _import_xgboost().XGBRegressor(**parameter)
+    raise ValueError(f"Algoritma tidak dikenal: {algoritma!r}")
+
+
+def buat_model(target, algoritma, stasiun=STASIUN_UTAMA, n_thread=1):
+    """
+    Membuat estimator baru (belum dilatih) untuk satu model. Hyperparameter disalin dari
+    file model stasiun (atau model stasiun utama sebagai cadangan), seperti
+    `model_cuaca.latih_ulang_model`; PARAMETER_BAWAAN hanya dipakai jika belum ada file
+    model yang dapat di-clone.
+
+    Args:
+        target: Kunci target pada model_cuaca.TARGET_CUACA
+        algoritma: 'rf', 'gb' atau 'xgb'
+        stasiun: ID stasiun
+        n_thread: Jumlah thread untuk algoritma yang mendukung pelatihan paralel
+    """
+    if algoritma not in PARAMETER_BAWAAN:
+        raise ValueError(f"Algoritma tidak dikenal: {algoritma!r}")
+    path = model_cuaca.path_model(target, algoritma, stasiun)
+    objek = joblib.load(path) if os.path.exists(path) else None
+    if objek is None or isinstance(objek, np.ndarray):
+        # Artefak lama berupa array prediksi beku tidak memiliki hyperparameter
+        model = _model_bawaan(algoritma)
+    else:
+        from sklearn.base import clone
+        model = clone(objek)
+    if 'n_jobs' in model.get_params():
+        model.set_params(n_jobs=n_thread)
+    return model
+
+
+def jumlah_pekerja(n_jobs):
+    """
+    Mengubah n_jobs menjadi jumlah proses dengan konvensi scikit-learn: None berarti 1,
+    -1 semua core, -2 semua core kecuali satu, dan seterusnya.
+
+    Raises:
+        ValueError: Jika n_jobs bernilai 0
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError("n_jobs tidak boleh 0; gunakan bilangan positif atau -1 untuk semua core.")
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def _dump_atomik(objek, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    sementara = f"{path}.tmp-{os.getpid()}"
+    joblib.dump(objek, sementara)
+    # Halaman yang sedang membaca file lama tidak pernah melihat file setengah jadi
+    os.replace(sementara, path)
+
+
+def siapkan_split(target, stasiun=STASIUN_UTAMA, split_baru=False):
+    """
+    Memastikan stasiun memiliki file split untuk target beserta cache `.npy`-nya. Split baru
+    disusun dari `data_cuaca.data_latih` dengan pembagian acak UKURAN_UJI.
+
+    Returns:
+        Path file split yang dipakai
+    """
+    path = model_cuaca.path_split(target, stasiun, cadangan=False)
+    if split_baru or not os.path.exists(path):
+        from sklearn.model_selection import train_test_split
+
+        X, y = data_cuaca.data_latih(target, stasiun)
+        _dump_atomik(tuple(train_test_split(X, y, test_size=UKURAN_UJI, random_state=RANDOM_STATE)), path)
+
+    versi = hash_file(path)
+    if not os.path.isdir(model_cuaca.path_cache_split(target, versi, stasiun)):
+        model_cuaca.ekspor_split(target, versi, stasiun)
+    return path
+
+
+def latih_satu(target, algoritma, stasiun=STASIUN_UTAMA, n_thread=1):
+    """
+    Melatih satu model, menyimpannya, lalu mengekspor artefaknya. Dijalankan di proses pekerja.
+
+    Returns:
+        Dictionary ringkasan tugas: target, algoritma, stasiun, path model, versi artefak, metrik dan durasi
+    """
+    mulai = time.perf_counter()
+    X_train, X_test, y_train, y_test = model_cuaca.load_split(target, stasiun)
+    model = buat_model(target, algoritma, stasiun, n_thread).fit(X_train, y_train)
+    path = model_cuaca.path_model(target, algoritma, stasiun, cadangan=False)
+    _dump_atomik(model, path)
+
+    hasil = model_cuaca.load_artefak(target, algoritma, stasiun)
+    return {
+        'target': target,
+        'algoritma': algoritma,
+        'stasiun': stasiun,
+        'path': path,
+        'versi': hasil['versi'],
+        'metrik': hasil['metrik'],
+        'durasi': time.perf_counter() - mulai,
+    }
+
+
+def _latih_tugas(tugas):
+    return latih_satu(*tugas)
+
+
+def latih_semua(target=None, algoritma=None, stasiun=None, n_jobs=-1, batas_waktu=None, split_baru=False, progres=None):
+    """
+    Melatih semua kombinasi (target, algoritma, stasiun) secara paralel.
+
+    Args:
+        target: Daftar target (default semua TARGET_CUACA)
+        algoritma: Daftar algoritma (default 'rf', 'gb', dan 'xgb' jika xgboost terpasang)
+        stasiun: Daftar ID stasiun (default semua stasiun yang memiliki data)
+        n_jobs: Jumlah proses pekerja dengan konvensi scikit-learn (lihat `jumlah_pekerja`)
+        batas_waktu: Batas waktu total dalam detik; tugas yang belum selesai dibatalkan
+        split_baru: Susun ulang split meskipun file split sudah ada
+        progres: Callback opsional progres(ringkasan_tugas) setiap kali satu tugas selesai
+    Returns:
+        List ringkasan tugas yang selesai (lihat `latih_satu`)
+    Raises:
+        TimeoutError: Jika batas waktu habis sebelum semua tugas selesai
+    """
+    target = list(target or model_cuaca.TARGET_CUACA)
+    algoritma = list(algoritma or (['rf', 'gb'] + (['xgb'] if xgboost_tersedia() else [])))
+    stasiun = list(stasiun or data_cuaca.daftar_stasiun())
+    if 'xgb' in algoritma:
+        _import_xgboost()
+
+    # Split dan cache split disiapkan di proses utama agar tugas paralel tidak menulis file yang sama
+    for s in stasiun:
+        for t in target:
+            siapkan_split(t, s, split_baru)
+
+    n_jobs = jumlah_pekerja(n_jobs)
+    daftar_tugas = [(t, a, s) for s in stasiun for t in target for a in algoritma]
+    n_pekerja = max(1, min(n_jobs, len(daftar_tugas)))
+    # Core yang tidak kebagian proses dipakai sebagai thread oleh algoritma yang mendukungnya
+    n_thread = max(1, n_jobs // n_pekerja)
+    daftar_tugas = [tugas + (n_thread,) for tugas in daftar_tugas]
+
+    hasil = []
+    tenggat = None if batas_waktu is None else time.monotonic() + batas_waktu
+
+    def sisa_waktu():
+        if tenggat is None:
+            return None
+        sisa = tenggat - time.monotonic()
+        if sisa <= 0:
+            raise TimeoutError(f"Batas waktu {batas_waktu} detik habis; {len(hasil)} dari {len(daftar_tugas)} tugas selesai.")
+        return sisa
+
+    def kumpulkan(ringkasan):
+        hasil.append(ringkasan)
+        if progres is not None:
+            progres(ringkasan)
+
+    if n_pekerja == 1:
+        for tugas in daftar_tugas:
+            sisa_waktu()
+            kumpulkan(_latih_tugas(tugas))
+        return hasil
+
+    pool = multiprocessing.Pool(n_pekerja)
+    try:
+        iterator = pool.imap_unordered(_latih_tugas, daftar_tugas)
+        while len(hasil) < len(daftar_tugas):
+            try:
+                kumpulkan(iterator.next(timeout=sisa_waktu()))
+            except multiprocessing.TimeoutError:
+                continue
+        pool.close()
+    finally:
+        # Jika batas waktu habis atau tugas gagal, pekerja yang masih berjalan dihentikan
+        pool.terminate()
+        pool.join()
+    return hasil
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Melatih ulang model peramalan cuaca secara paralel.")
+    parser.add_argument('--target', nargs='+', choices=list(model_cuaca.TARGET_CUACA), help="Target (default semua)")
+    parser.add_argument('--algoritma', nargs='+', choices=list(model_cuaca.ALGORITMA), help="Algoritma (default rf, gb, xgb jika terpasang)")
+    parser.add_argument('--stasiun', nargs='+', help="ID stasiun (default semua stasiun)")
+    parser.add_argument('--n-jobs', type=int, default=-1, help="Jumlah proses pekerja, -1 untuk semua core, -2 semua kecuali satu (default -1)")
+    parser.add_argument('--batas-waktu', type=float, default=None, help="Batas waktu total dalam detik")
+    parser.add_argument('--split-baru', action='store_true', help="Susun ulang split data latih/uji")
+    args = parser.parse_args(argv)
+
+    def cetak(ringkasan):
+        metrik = ringkasan['metrik']
+        print(
+            f"{ringkasan['stasiun']}/{ringkasan['target']}/{ringkasan['algoritma']}: "
+            f"RMSE {metrik['RMSE']:.3f}, R² {metrik['R²']:.3f} ({ringkasan['durasi']:.1f} detik)",
+            file=sys.stderr
+        )
+
+    mulai = time.perf_counter()
+    hasil = latih_semua(args.target, args.algoritma, args.stasiun, args.n_jobs, args.batas_waktu, args.split_baru, cetak)
+    print(f"Selesai: {len(hasil)} model dalam {time.perf_counter() - mulai:.1f} detik", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
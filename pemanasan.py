@@ -0,0 +1,155 @@
+"""
+Pemanasan cache proses di latar belakang.
+
+Saat app.py dimulai, sekumpulan tugas dijalankan di thread pool: membaca dataset, membuka
+artefak model, menghitung bundel evaluasi dan merender figure dengan filter default ke cache
+bersama (data_cuaca.py, model_cuaca.py, model_tanaman.py, grafik.py). Kunci cache yang dipakai
+sama dengan kunci halaman, sehingga permintaan pertama langsung memakai hasil yang sudah jadi.
+Permintaan yang datang saat tugas masih berjalan menunggu lock cache yang sama alih-alih
+menghitung ulang (kecuali figure, yang dibangun di luar lock; lihat grafik.py).
+
+Streamlit tidak menyediakan hook saat server mulai, sehingga pemanasan dimulai oleh rerun
+pertama app.py dan berjalan paling banyak sekali per proses. Status kesiapan setiap tugas
+tersedia lewat `status()` dan `siap()`.
+"""
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import data_cuaca
+import model_cuaca
+import model_tanaman
+from artefak import hash_file
+
+# Jumlah thread pemanasan; sebagian besar pekerjaan adalah I/O dan NumPy yang melepas GIL
+JUMLAH_WORKER = min(4, os.cpu_count() or 1)
+
+_lock = threading.Lock()
+_pool = None
+_status = {}
+
+
+def stasiun_default():
+    """
+    Stasiun yang dipilih halaman cuaca jika sesi belum memilih (lihat halaman_cuaca.pilih_stasiun).
+    """
+    return (data_cuaca.daftar_stasiun() or [data_cuaca.STASIUN_UTAMA])[0]
+
+
+def _panaskan_data_cuaca(stasiun):
+    # Import di sini agar app.py tidak menunggu modul halaman saat boot
+    import halaman_cuaca
+
+    data = data_cuaca.muat_data(stasiun).reset_index()
+    start_date, end_date = halaman_cuaca.rentang_tanggal(data)
+    data_terfilter = halaman_cuaca.filter_tanggal(data, start_date, end_date)
+    for pola in halaman_cuaca.POLA_CUACA:
+        halaman_cuaca.figur_pola_cuaca(data_terfilter, stasiun, pola, start_date, end_date)
+
+
+def _panaskan_evaluasi_cuaca(target, stasiun):
+    import halaman_cuaca
+
+    # Memuat split, artefak semua algoritma dan bundel evaluasi sekaligus merender figurenya
+    halaman_cuaca.figur_evaluasi(target, stasiun)
+
+
+def _panaskan_tanaman():
+    import grafik
+
+    df = model_tanaman.load_dataset()
+    versi_dataset = hash_file(model_tanaman.DATASET_PATH)
+    variabel = model_tanaman.FITUR_SEBARAN_DEFAULT
+    # Filter default halaman rekomendasi: semua kolom, kolom pencarian pertama, tanpa kueri
+    grafik.gambar_sebaran(model_tanaman.kunci_sebaran(versi_dataset, df.columns, df.columns[0], ''), df, variabel)
+
+    # Scatter matrix default (mode WebGL): label pertama, ukuran plot default, tanpa batas sampel per label
+    label = df['label'].unique().tolist()[:model_tanaman.JUMLAH_LABEL_DEFAULT]
+    tinggi = model_tanaman.TINGGI_PAIRPLOT_DEFAULT
+    grafik.figur_plotly(
+        model_tanaman.kunci_pairplot(versi_dataset, variabel, tinggi, label, {}, 'splom'),
+        lambda: grafik.splom(
+            df[df['label'].isin(label)], variabel, 'label', tinggi=model_tanaman.tinggi_splom(tinggi, len(variabel))
+        )
+    )
+
+    model_tanaman.load_mesin()
+    evaluasi = model_tanaman.load_evaluasi()
+    grafik.gambar_confusion_matrix(
+        model_tanaman.kunci_confusion_matrix(evaluasi['versi']), evaluasi['confusion_matrix'],
+        list(model_tanaman.LABEL_TANAMAN.values()), model_tanaman.JUDUL_CONFUSION_MATRIX
+    )
+
+
+def daftar_tugas(stasiun=None):
+    """
+    Daftar (nama, fungsi) pemanasan, berurutan dari halaman yang paling mungkin dibuka lebih dulu.
+    """
+    stasiun = stasiun or stasiun_default()
+    tugas = [(f'data cuaca {stasiun}', lambda: _panaskan_data_cuaca(stasiun))]
+    for target in model_cuaca.TARGET_CUACA:
+        tugas.append((f'evaluasi {target} {stasiun}', lambda t=target: _panaskan_evaluasi_cuaca(t, stasiun)))
+    tugas.append(('rekomendasi tanaman', _panaskan_tanaman))
+    return tugas
+
+
+def _jalankan(nama, fungsi):
+    with _lock:
+        _status[nama].update(status='berjalan')
+    awal = time.perf_counter()
+    try:
+        fungsi()
+    except Exception as e:
+        # Kegagalan pemanasan tidak fatal: halaman akan memuat ulang dan menampilkan errornya sendiri
+        print(f"Pemanasan {nama} gagal: {e!r}", file=sys.stderr)
+        hasil = {'status': 'gagal', 'galat': repr(e)}
+    else:
+        hasil = {'status': 'siap'}
+    with _lock:
+        _status[nama].update(hasil, detik=time.perf_counter() - awal)
+
+
+def mulai(tugas=None):
+    """
+    Menjalankan semua tugas pemanasan di thread pool, paling banyak sekali per proses.
+
+    Args:
+        tugas: Daftar (nama, fungsi); default `daftar_tugas()`
+    Returns:
+        True jika pemanasan baru dimulai, False jika sudah pernah dimulai
+    """
+    global _pool
+    with _lock:
+        if _pool is not None:
+            return False
+        tugas = tugas if tugas is not None else daftar_tugas()
+        _pool = ThreadPoolExecutor(max_workers=JUMLAH_WORKER, thread_name_prefix='pemanasan')
+        for nama, _ in tugas:
+            _status[nama] = {'status': 'menunggu', 'detik': None, 'galat': None}
+    for nama, fungsi in tugas:
+        _pool.submit(_jalankan, nama, fungsi)
+    # Thread berhenti sendiri setelah antrean habis
+    _pool.shutdown(wait=False)
+    return True
+
+
+def status():
+    """
+    Status kesiapan per tugas.
+
+    Returns:
+        Dictionary nama tugas -> {'status': 'menunggu' | 'berjalan' | 'siap' | 'gagal',
+        'detik': durasi atau None, 'galat': repr exception atau None}
+    """
+    with _lock:
+        return {nama: dict(info) for nama, info in _status.items()}
+
+
+def siap():
+    """
+    True jika pemanasan sudah dimulai dan semua tugasnya selesai (berhasil maupun gagal).
+    """
+    with _lock:
+        return bool(_status) and all(info['status'] in ('siap', 'gagal') for info in _status.values())
@@ -0,0 +1,156 @@
+"""
+Mesin peramalan rekursif bersama untuk halaman suhu, kelembapan dan curah hujan.
+
+State w hari terakhir setiap variabel disimpan dalam buffer NumPy yang dialokasikan sekali
+dan dimajukan dengan `fitur_cuaca.geser_riwayat` (jendela lag/rolling yang sama dengan data latih),
+fitur waktu untuk seluruh horizon dihitung sekaligus, dan model berbasis pohon dievaluasi lewat
+traversal array datar (lihat `pohon.py`) tanpa membangun DataFrame di setiap langkah.
+"""
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+
+import fitur_cuaca
+import instrumentasi
+import pohon
+from fitur_cuaca import FITUR_LAG, FITUR_ROLLING, FITUR_WAKTU, JENDELA_ROLLING, VARIABEL_CUACA, fitur_target
+from model_cuaca import TARGET_CUACA
+
+# Batas jumlah pasangan (pohon, baris) per langkah untuk traversal datar
+BATAS_TRAVERSAL_DATAR = 100_000
+
+_hutan_cache = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _hutan(model):
+    """
+    Representasi datar model, dibuat sekali per objek model. Artefak dari
+    `model_cuaca.load_artefak` sudah berupa array datar dan dipakai langsung.
+    """
+    if isinstance(model, dict):
+        return model
+    with _lock:
+        if model not in _hutan_cache:
+            _hutan_cache[model] = pohon.ratakan_regresor(model)
+        return _hutan_cache[model]
+
+
+def _fungsi_prediksi(model, fitur, n_baris):
+    hutan = _hutan(model)
+    # Traversal datar unggul selama jumlah pasangan (pohon, baris) kecil; untuk batch
+    # skenario yang sangat besar predict sklearn yang terkompilasi lebih cepat. Artefak
+    # datar (dict) tidak memiliki objek sklearn sehingga selalu memakai traversal datar
+    if isinstance(model, dict) or (hutan is not None and n_baris * len(hutan['akar']) <= BATAS_TRAVERSAL_DATAR):
+        return lambda X: pohon.prediksi(hutan, X)
+    return lambda X: model.predict(pd.DataFrame(X, columns=fitur))
+
+
+def fitur_kondisi(target):
+    """
+    Kolom kondisi terkini yang dibutuhkan peramalan (semua fitur kecuali fitur waktu).
+    """
+    return [nama for nama in fitur_target(target) if nama not in FITUR_WAKTU]
+
+
+@instrumentasi.terukur
+def ramalkan_skenario(model, target, kondisi, tanggal_terakhir, hari):
+    """
+    Meramalkan banyak skenario kondisi terkini sekaligus. Semua lintasan dimajukan
+    bersama per hari dengan satu pemanggilan predict pada matriks N baris.
+
+    Args:
+        model: Model regresi (atau array pohon datar dari model_cuaca) yang dilatih pada fitur `fitur_target(target)`
+        target: Kunci target pada TARGET_CUACA
+        kondisi: Array (N, len(fitur_kondisi(target))) atau DataFrame dengan kolom `fitur_kondisi(target)`
+        tanggal_terakhir: Tanggal data terkini
+        hari: Jumlah hari yang akan diprediksi
+    Returns:
+        Tuple (DatetimeIndex tanggal prediksi, array prediksi N x hari)
+    """
+    fitur = fitur_target(target)
+    kolom_kondisi = fitur_kondisi(target)
+    if isinstance(kondisi, pd.DataFrame):
+        kondisi = kondisi[kolom_kondisi].to_numpy(dtype=float)
+    kondisi = np.atleast_2d(np.asarray(kondisi, dtype=float))
+    if kondisi.shape[1] != len(kolom_kondisi):
+        raise ValueError(f"Matriks kondisi harus memiliki {len(kolom_kondisi)} kolom: {kolom_kondisi}")
+    n_skenario = kondisi.shape[0]
+
+    kolom_target = TARGET_CUACA[target]['kolom']
+    idx = {nama: i for i, nama in enumerate(fitur)}
+    idx_lag = [idx[FITUR_LAG[k]] for k in VARIABEL_CUACA]
+    idx_rolling = [idx[FITUR_ROLLING[k]] for k in VARIABEL_CUACA]
+    idx_waktu = [idx[nama] for nama in FITUR_WAKTU]
+    posisi_target = VARIABEL_CUACA.index(kolom_target)
+
+    tanggal = pd.date_range(pd.Timestamp(tanggal_terakhir) + pd.Timedelta(days=1), periods=hari, freq='D')
+
+    # Buffer dialokasikan sekali: matriks fitur, fitur waktu seluruh horizon dan hasil prediksi
+    X = np.empty((n_skenario, len(fitur)))
+    X[:, [idx[nama] for nama in kolom_kondisi]] = kondisi
+    waktu = np.column_stack([tanggal.dayofweek, tanggal.month, tanggal.year]).astype(float)
+    hasil = np.empty((n_skenario, hari))
+
+    # State w hari terakhir setiap variabel (lihat fitur_cuaca.py); variabel selain target
+    # dianggap tetap pada nilai kondisi terkini. Baris kondisi adalah fitur hari pertama; hari
+    # berikutnya memakai lag hari sebelumnya dan rolling w hari yang berakhir pada hari itu,
+    # seperti data latih. Target hari itu belum diketahui sehingga diperkirakan dengan hasil
+    # prediksi hari sebelumnya, lalu diganti hasil prediksinya sendiri setelah diramalkan
+    nilai_hari = np.empty((n_skenario, len(VARIABEL_CUACA)))
+    posisi_dasar = [j for j in range(len(VARIABEL_CUACA)) if j != posisi_target]
+    nilai_hari[:, posisi_dasar] = X[:, [idx[VARIABEL_CUACA[j]] for j in posisi_dasar]]
+    riwayat = None
+
+    predict = _fungsi_prediksi(model, fitur, n_skenario)
+    for i in range(hari):
+        X[:, idx_waktu] = waktu[i]
+        hasil[:, i] = predict(X)
+
+        nilai_hari[:, posisi_target] = hasil[:, i]
+        if riwayat is None:
+            riwayat = fitur_cuaca.riwayat_awal(X[:, idx_lag], X[:, idx_rolling], nilai_hari, JENDELA_ROLLING)
+        else:
+            riwayat[..., -1] = nilai_hari
+        X[:, idx_lag], X[:, idx_rolling] = fitur_cuaca.geser_riwayat(riwayat, nilai_hari)
+
+    return tanggal, hasil
+
+
+@instrumentasi.terukur
+def ramalkan(model, target, kondisi, tanggal_terakhir, hari):
+    """
+    Meramalkan target secara rekursif untuk beberapa hari ke depan.
+
+    Args:
+        model: Model regresi yang sudah dilatih pada fitur `fitur_target(target)`
+        target: Kunci target pada TARGET_CUACA
+        kondisi: Mapping nama fitur -> nilai kondisi terkini (fitur waktu diabaikan)
+        tanggal_terakhir: Tanggal data terkini
+        hari: Jumlah hari yang akan diprediksi
+    Returns:
+        Tuple (DatetimeIndex tanggal prediksi, array prediksi)
+    """
+    baris = [[float(kondisi[nama]) for nama in fitur_kondisi(target)]]
+    tanggal, hasil = ramalkan_skenario(model, target, baris, tanggal_terakhir, hari)
+    return tanggal, hasil[0]
+
+
+def sapuan_skenario(kondisi, kolom, nilai, kolom_kondisi):
+    """
+    Membuat matriks skenario dengan menyapu satu kolom kondisi, kolom lain tetap.
+
+    Args:
+        kondisi: Mapping nama fitur -> nilai kondisi dasar
+        kolom: Nama kolom yang disapu
+        nilai: Array nilai untuk kolom tersebut (satu skenario per nilai)
+        kolom_kondisi: Urutan kolom matriks, biasanya `fitur_kondisi(target)`
+    Returns:
+        Array (len(nilai), len(kolom_kondisi))
+    """
+    dasar = np.array([float(kondisi[nama]) for nama in kolom_kondisi])
+    matriks = np.tile(dasar, (len(nilai), 1))
+    matriks[:, kolom_kondisi.index(kolom)] = nilai
+    return matriks
@@ -0,0 +1,220 @@
+"""
+Representasi datar (flat) untuk ensemble pohon keputusan sklearn.
+
+Seluruh node dari semua pohon digabung ke array NumPy yang bersebelahan (fitur,
+threshold, anak, nilai daun) sehingga prediksi dapat dihitung dengan traversal
+vektor tanpa validasi DataFrame dan dispatch per pohon dari sklearn.
+
+Setiap node menempati dua slot berurutan: node ke-i berada di slot 2i, dan
+`anak[2i]` / `anak[2i + 1]` berisi slot anak kiri / kanan. Dengan begitu satu
+langkah traversal cukup `slot = anak[slot + (x[fitur[slot]] > threshold[slot])]`.
+"""
+import numpy as np
+
+# Penanda daun pada tree_ sklearn (_tree.TREE_LEAF)
+_DAUN = -1
+
+# Pohon yang sudah mencapai daun dibuang dari himpunan aktif setiap beberapa level
+_INTERVAL_KOMPAKSI = 6
+
+# Jumlah baris per blok traversal pada prediksi batch
+_UKURAN_BLOK = 1024
+
+
+def _pohon_dari_model(model):
+    """
+    Mengembalikan (daftar tree_, skala, bias) untuk model regresi yang didukung,
+    atau None jika model tidak dapat diratakan.
+    """
+    nama_kelas = type(model).__name__
+    if nama_kelas in ('DecisionTreeRegressor', 'ExtraTreeRegressor'):
+        return [model.tree_], 1.0, 0.0
+    if nama_kelas in ('RandomForestRegressor', 'ExtraTreesRegressor'):
+        estimators = model.estimators_
+        return [est.tree_ for est in estimators], 1.0 / len(estimators), 0.0
+    if nama_kelas == 'GradientBoostingRegressor':
+        if getattr(model, 'loss', None) not in ('squared_error', 'absolute_error', 'huber', 'quantile'):
+            return None
+        init = model.init_
+        if init == 'zero':
+            bias = 0.0
+        elif type(init).__name__ == 'DummyRegressor':
+            bias = float(np.ravel(init.constant_)[0])
+        else:
+            return None
+        # Nilai daun dikalikan learning rate saat penjumlahan, seperti predict_stages
+        return [est.tree_ for est in model.estimators_[:, 0]], model.learning_rate, bias
+    return None
+
+
+def ratakan_pohon(daftar_pohon, nilai_node):
+    """
+    Menggabungkan beberapa tree_ sklearn ke array datar dengan tata letak dua slot per node.
+
+    Args:
+        daftar_pohon: List objek tree_ sklearn
+        nilai_node: Fungsi tree_ -> array nilai per node (n_node, ...) yang disimpan di daun
+    Returns:
+        Dictionary berisi array node, slot akar setiap pohon dan kedalaman maksimum
+    """
+    offset = np.cumsum([0] + [tree.node_count for tree in daftar_pohon])
+    n_node = int(offset[-1])
+    contoh_nilai = nilai_node(daftar_pohon[0])
+
+    fitur = np.zeros(2 * n_node, dtype=np.intp)
+    threshold = np.full(2 * n_node, np.inf)
+    anak = np.empty(2 * n_node, dtype=np.intp)
+    daun = np.zeros(2 * n_node, dtype=bool)
+    nilai = np.zeros((2 * n_node,) + contoh_nilai.shape[1:], dtype=contoh_nilai.dtype)
+
+    for awal, tree in zip(offset[:-1], daftar_pohon):
+        slot = 2 * np.arange(awal, awal + tree.node_count)
+        is_daun = tree.children_left == _DAUN
+        # Daun menunjuk ke dirinya sendiri sehingga langkah traversal tambahan tidak mengubah posisi
+        anak[slot] = np.where(is_daun, slot, 2 * (tree.children_left + awal))
+        anak[slot + 1] = np.where(is_daun, slot, 2 * (tree.children_right + awal))
+        fitur[slot] = np.where(is_daun, 0, tree.feature)
+        threshold[slot] = np.where(is_daun, np.inf, tree.threshold)
+        daun[slot] = is_daun
+        nilai[slot] = nilai_node(tree)
+
+    return {
+        'fitur': fitur,
+        'threshold': threshold,
+        'anak': anak,
+        'daun': daun,
+        'nilai': nilai,
+        'akar': 2 * offset[:-1].astype(np.intp),
+        'kedalaman': max(tree.max_depth for tree in daftar_pohon),
+    }
+
+
+def ratakan_regresor(model):
+    """
+    Meratakan model regresi berbasis pohon ke array NumPy bersebelahan.
+
+    Args:
+        model: DecisionTree/RandomForest/ExtraTrees/GradientBoosting regressor yang sudah dilatih
+    Returns:
+        Dictionary berisi array node dan parameter agregasi, atau None jika model tidak didukung
+    """
+    hasil = _pohon_dari_model(model)
+    if hasil is None:
+        return None
+    daftar_pohon, skala, bias = hasil
+
+    hutan = ratakan_pohon(daftar_pohon, lambda tree: tree.value[:, 0, 0])
+    hutan.update({'skala': skala, 'bias': bias, 'n_fitur': model.n_features_in_})
+    return hutan
+
+
+def _proba_node(tree):
+    """
+    Distribusi kelas per node, dinormalisasi dengan operasi yang sama seperti
+    DecisionTreeClassifier.predict_proba agar hasilnya identik bit demi bit.
+    """
+    proba = tree.value[:, 0, :]
+    normalizer = proba.sum(axis=1)[:, np.newaxis]
+    normalizer[normalizer == 0.0] = 1.0
+    return proba / normalizer
+
+
+def ratakan_klasifikasi(model):
+    """
+    Meratakan RandomForestClassifier/ExtraTreesClassifier (satu output) ke array NumPy bersebelahan.
+
+    Args:
+        model: Model klasifikasi ensemble pohon yang sudah dilatih
+    Returns:
+        Dictionary berisi array node dan classes_, atau None jika model tidak didukung
+    """
+    if type(model).__name__ not in ('RandomForestClassifier', 'ExtraTreesClassifier') or model.n_outputs_ != 1:
+        return None
+    hutan = ratakan_pohon([est.tree_ for est in model.estimators_], _proba_node)
+    hutan.update({'classes': np.asarray(model.classes_), 'n_fitur': model.n_features_in_})
+    return hutan
+
+
+def daun(hutan, X):
+    """
+    Mencari slot daun setiap baris pada setiap pohon.
+
+    Args:
+        hutan: Hasil `ratakan_pohon` / `ratakan_regresor`
+        X: Array 2D (n_baris, n_fitur)
+    Returns:
+        Array (n_pohon, n_baris) berisi slot daun global
+    """
+    # sklearn membandingkan nilai fitur float32 dengan threshold float64
+    X = np.asarray(X, dtype=np.float32).astype(np.float64)
+    n_baris, n_fitur = X.shape
+    X_datar = X.ravel()
+    fitur, threshold, anak, is_daun = hutan['fitur'], hutan['threshold'], hutan['anak'], hutan['daun']
+
+    # Pasangan (pohon, baris) diratakan; offset menunjuk ke awal baris pada X_datar
+    if n_baris == 1:
+        slot = hutan['akar']
+        offset = None
+    else:
+        slot = np.repeat(hutan['akar'], n_baris)
+        offset = np.arange(slot.size) % n_baris * n_fitur
+    hasil = slot
+    aktif = None
+
+    for level in range(hutan['kedalaman']):
+        kolom = fitur[slot] if offset is None else fitur[slot] + offset
+        slot = anak[slot + (X_datar[kolom] > threshold[slot])]
+        if level % _INTERVAL_KOMPAKSI == _INTERVAL_KOMPAKSI - 1:
+            lanjut = ~is_daun[slot]
+            if aktif is None:
+                hasil = slot.copy()
+                aktif = np.flatnonzero(lanjut)
+            else:
+                hasil[aktif] = slot
+                aktif = aktif[lanjut]
+            slot = slot[lanjut]
+            if offset is not None:
+                offset = offset[lanjut]
+            if not slot.size:
+                break
+
+    if aktif is None:
+        hasil = slot
+    else:
+        hasil[aktif] = slot
+    return hasil.reshape(len(hutan['akar']), n_baris)
+
+
+def prediksi(hutan, X):
+    """
+    Prediksi regresi dari hasil `ratakan_regresor`; sama dengan `model.predict`
+    hingga galat pembulatan floating point.
+    """
+    X = np.asarray(X)
+    if X.shape[0] <= _UKURAN_BLOK:
+        return hutan['bias'] + hutan['skala'] * hutan['nilai'][daun(hutan, X)].sum(axis=0)
+    return np.concatenate([prediksi(hutan, X[awal:awal + _UKURAN_BLOK]) for awal in range(0, X.shape[0], _UKURAN_BLOK)])
+
+
+def prediksi_proba(hutan, X):
+    """
+    Probabilitas kelas dari hasil `ratakan_klasifikasi`; identik bit demi bit dengan
+    `model.predict_proba` karena probabilitas pohon dijumlahkan berurutan lalu dibagi jumlah pohon.
+    """
+    X = np.asarray(X)
+    nilai = hutan['nilai']
+    proba = np.zeros((X.shape[0], nilai.shape[1]))
+    # Baris diproses per blok agar array indeks traversal tetap muat di cache CPU
+    for awal in range(0, X.shape[0], _UKURAN_BLOK):
+        blok = proba[awal:awal + _UKURAN_BLOK]
+        for slot in daun(hutan, X[awal:awal + _UKURAN_BLOK]):
+            blok += nilai[slot]
+    proba /= len(hutan['akar'])
+    return proba
+
+
+def prediksi_kelas(hutan, X):
+    """
+    Kelas hasil prediksi, sama dengan `model.predict` (argmax probabilitas).
+    """
+    return hutan['classes'].take(prediksi_proba(hutan, X).argmax(axis=1), axis=0)
@@ -1,13 +1,12 @@
 import pandas as pd
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pickle
 import math
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import classification_report, confusion_matrix, accuracy_score
-from sklearn.model_selection import train_test_split
+import grafik
+import instrumentasi
+import tabel
+import model_tanaman
+from artefak import hash_file
 
 
 # Header
@@ -24,10 +23,10 @@ Silakan masukkan parameter lingkungan Anda dan dapatkan rekomendasi tanaman yang
 """, unsafe_allow_html=True)
 
 # Ui Dataset
-def load_data():
-    df = pd.read_csv("./Dataset/Crop_recommendation_ID.csv")
-    return df
-df = load_data()
+# Dataset dibaca sekali per versi file dan dibagikan antar sesi (lihat model_tanaman.py)
+df = model_tanaman.load_dataset()
+# Versi dataset untuk kunci cache figure (lihat grafik.py)
+versi_dataset = hash_file(model_tanaman.DATASET_PATH)
 
 # Buat dua kolom utama
 col1, col2 = st.columns([1, 2])
@@ -39,23 +38,40 @@ with col1:
         search_col = st.selectbox("Pilih Kolom untuk Pencarian", selected_columns)
     else:
         search_col = None
-    search_value = st.text_input("Masukkan Nilai yang Dicari")
+    search_value = st.text_input(
+        "Masukkan Nilai yang Dicari",
+        help="Kolom angka: 50 (angka yang diawali 50, misalnya 50, 50.7 atau 505), =50, 20-30, >=6.5 atau <100. "
+        "Kolom teks: potongan kata, misalnya 'jag'."
+    )
 
     # Filter dataset berdasarkan kolom yang dipilih
     filtered_df = df[selected_columns] if selected_columns else df
 
-    # Jika ada pencarian, filter data berdasarkan nilai yang dicari
+    # Jika ada pencarian, filter data lewat indeks kolom yang dibangun sekali per versi dataset
     if search_value and search_col:
-        filtered_df = filtered_df[filtered_df[search_col].astype(str).str.contains(search_value, case=False, na=False)]
+        with instrumentasi.ukur('rekomendasi.cari'):
+            indeks = tabel.indeks_tersimpan((versi_dataset, search_col), df[search_col])
+            try:
+                filtered_df = filtered_df.iloc[tabel.cari(indeks, search_value)]
+            except ValueError as e:
+                st.warning(str(e))
+                filtered_df = filtered_df.iloc[:0]
 
-    # Membulatkan angka ke atas
-    filtered_df = filtered_df.applymap(lambda x: np.ceil(x) if isinstance(x, (int, float)) else x)
     st.write(f"**Jumlah Baris :** {filtered_df.shape[0]}")
     st.write(f"**Jumlah Kolom :** {filtered_df.shape[1]}")
 
 with col2:
     st.markdown("<h3 style='text-align: center;'>📋 Tampilan Dataset</h3>", unsafe_allow_html=True)
-    st.dataframe(filtered_df, height=400, width=1500)
+    # Hanya halaman yang ditampilkan yang dipotong dan dibulatkan ke atas (lihat tabel.py)
+    kol_ukuran, kol_halaman = st.columns(2)
+    with kol_ukuran:
+        ukuran_halaman = st.selectbox("Baris per Halaman", tabel.UKURAN_HALAMAN, index=1)
+    with kol_halaman:
+        halaman = st.number_input(
+            "Halaman", min_value=1, max_value=tabel.jumlah_halaman(len(filtered_df), ukuran_halaman), value=1, step=1
+        )
+    with instrumentasi.ukur('rekomendasi.pratinjau'):
+        st.dataframe(tabel.pratinjau(filtered_df, halaman, ukuran_halaman), height=400, width=1500)
 
 # Visualisasi
 st.markdown(
@@ -68,29 +84,17 @@ st.markdown(
 
 selected_vars = st.multiselect(
     "Pilih Variabel untuk Distribusi",
-    ['N', 'P', 'K', 'temperature', 'humidity', 'ph', 'rainfall'],
-    default=['N', 'P', 'K']
+    model_tanaman.FITUR_TANAMAN,
+    default=model_tanaman.FITUR_SEBARAN_DEFAULT
 )
 
+# Kunci cache figure: versi dataset dan filter tabel di atas
+filter_dataset = model_tanaman.kunci_sebaran(versi_dataset, selected_columns, search_col, search_value)
+
 if selected_vars and not filtered_df.empty:
-    n_vars = len(selected_vars)
-    cols = 3
-    rows = (n_vars // cols) + (n_vars % cols > 0)
-
-    fig, axes = plt.subplots(rows, cols, figsize=(15, 5 * rows))
-    axes = axes.flatten()
-    for i, var in enumerate(selected_vars):
-        sns.histplot(filtered_df[var], bins=20, kde=True, ax=axes[i], color=np.random.rand(3,))
-        axes[i].set_title(f"Sebaran {var} ", fontsize=12)
-        axes[i].set_xlabel(var)
-        axes[i].set_ylabel("Frekuensi")
-
-    # Hapus subplot kosong jika ada
-    for j in range(i + 1, len(axes)):
-        fig.delaxes(axes[j])
-
-    # Tampilkan plot di Streamlit
-    st.pyplot(fig)
+    # Gambar dirender ulang hanya jika variabel atau filter berubah; frekuensi bin dan kurva KDE (FFT)
+    # dihitung sekali per versi dataset, filter dan kolom
+    st.image(grafik.gambar_sebaran(filter_dataset, filtered_df, selected_vars), use_container_width=True)
 else:
     st.warning("Pilih minimal satu variabel dan pastikan dataset tidak kosong untuk menampilkan sebaran data.")
 
@@ -122,8 +126,8 @@ with st.expander("🔍 Filter dan Pengaturan Visualisasi", expanded=True):
         st.subheader("Pemilihan Variabel")
         selected_pairplot = st.multiselect(
             "Pilih Variabel untuk Pairplot",
-            ['N', 'P', 'K', 'temperature', 'humidity', 'ph', 'rainfall'],
-            default=['N', 'P', 'K'],
+            model_tanaman.FITUR_TANAMAN,
+            default=model_tanaman.FITUR_SEBARAN_DEFAULT,
             help="Pilih variabel yang ingin Anda bandingkan dalam visualisasi"
         )
         # Pengaturan ukuran plot
@@ -131,9 +135,16 @@ with st.expander("🔍 Filter dan Pengaturan Visualisasi", expanded=True):
             "Ukuran Plot",
             min_value=1,
             max_value=5,
-            value=3,
+            value=model_tanaman.TINGGI_PAIRPLOT_DEFAULT,
             help="Atur ukuran setiap subplot dalam pairplot"
         )
+        # Mode WebGL menggambar seluruh data dengan cepat; Seaborn menghasilkan gambar statis dengan KDE
+        mode_pairplot = st.radio(
+            "Mode Visualisasi",
+            ["Cepat (WebGL)", "Seaborn"],
+            horizontal=True,
+            help="Mode cepat memakai scatter matrix Plotly yang dirender di browser dan sanggup menampilkan seluruh data"
+        )
     
     with filter_col2:
         st.subheader("Filter Data")
@@ -158,17 +169,26 @@ with st.expander("🔍 Filter dan Pengaturan Visualisasi", expanded=True):
         selected_labels = st.multiselect(
             "Pilih Label Tanaman untuk Ditampilkan",
             options=filtered_labels,
-            default=filtered_labels[:3],
+            default=filtered_labels[:model_tanaman.JUMLAH_LABEL_DEFAULT],
             help="Pilih tanaman yang ingin Anda bandingkan"
         )
+        batasi_sampel = st.checkbox(
+            "Batasi jumlah sampel per label",
+            value=mode_pairplot == "Seaborn",
+            help="Mode Seaborn lambat untuk data besar; mode cepat dapat menampilkan semua baris"
+        )
+
+# Dictionary untuk menyimpan jumlah sampel per label (kosong berarti semua baris)
+samples_per_label = {}
+jumlah_per_label = df['label'].value_counts()
 
-if selected_labels:
+if selected_labels and not batasi_sampel:
+    filtered_df = df[df['label'].isin(selected_labels)]
+    st.metric("Total Data Ditampilkan", f"{len(filtered_df):,} baris")
+elif selected_labels:
     with st.expander("⚙️ Pengaturan Sampel per Label", expanded=True):
         st.subheader("Pengaturan Sampel per Label")
         
-        # Dictionary untuk menyimpan jumlah sampel per label
-        samples_per_label = {}
-        
         # Buat kolom untuk pengaturan sampel
         col_count = 4 
         cols = st.columns(col_count)
@@ -176,7 +196,7 @@ if selected_labels:
         for idx, label in enumerate(selected_labels):
             col_idx = idx % col_count
             with cols[col_idx]:
-                available_samples = len(df[df['label'] == label])
+                available_samples = int(jumlah_per_label[label])
                 st.write(f"**{label}**")
                 
                 # Input untuk mengatur jumlah sampel
@@ -215,99 +235,71 @@ if selected_labels:
 
 # Buat visualisasi jika data tersedia
 total_samples = sum(samples_per_label.values())
-if selected_pairplot and not filtered_df.empty:
+# Data pairplot hanya bergantung pada label dan sampel per label, bukan filter tabel; tanpa label
+# yang dipilih filtered_df masih berisi hasil filter tabel sehingga tidak digambar
+filter_pairplot = (versi_dataset, selected_pairplot, plot_height, selected_labels, samples_per_label)
+if not selected_labels:
+    st.warning("Pilih minimal satu label tanaman untuk menampilkan pengaturan sampel dan visualisasi.")
+elif selected_pairplot and mode_pairplot == "Cepat (WebGL)":
+    st.plotly_chart(
+        grafik.figur_plotly(
+            model_tanaman.kunci_pairplot(*filter_pairplot, 'splom'),
+            lambda: grafik.splom(
+                filtered_df, selected_pairplot, 'label', tinggi=model_tanaman.tinggi_splom(plot_height, len(selected_pairplot))
+            )
+        ),
+        use_container_width=True
+    )
+elif selected_pairplot:
     with st.spinner("Membuat visualisasi..."):
-        sns.set_theme(style="whitegrid")
+        def buat_pairplot():
+            # seaborn hanya dimuat untuk mode pairplot ini
+            import seaborn as sns
+
+            sns.set_theme(style="whitegrid")
         
-        # Buat Pairplot dengan pengaturan yang ditingkatkan
-        pairplot_fig = sns.pairplot(
-            filtered_df,
-            vars=selected_pairplot,
-            hue="label",
-            # diag_kind='hist',
-            corner=True,
-            height=plot_height,
-            plot_kws={'alpha': 0.6},
-            diag_kws={'alpha': 0.6}
-        )
+            # Buat Pairplot dengan pengaturan yang ditingkatkan
+            pairplot_fig = sns.pairplot(
+                filtered_df,
+                vars=selected_pairplot,
+                hue="label",
+                # diag_kind='hist',
+                corner=True,
+                height=plot_height,
+                plot_kws={'alpha': 0.6},
+                diag_kws={'alpha': 0.6}
+            )
         
-        # Atur judul
-        pairplot_fig.fig.suptitle(
-            "Visualisasi Hubungan Antar Variabel",
-            y=1.02,
-            fontsize=16
-        )
+            # Atur judul
+            pairplot_fig.fig.suptitle(
+                "Visualisasi Hubungan Antar Variabel",
+                y=1.02,
+                fontsize=16
+            )
         
-        # Tambahkan label pada setiap subplot
-        for i, var1 in enumerate(selected_pairplot):
-            for j, var2 in enumerate(selected_pairplot):
-                if j < i:
-                    ax = pairplot_fig.axes[i][j]
-                    ax.set_xlabel(f"{var2}")
-                    ax.set_ylabel(f"{var1}")
-                    if i == len(selected_pairplot)-1:
+            # Tambahkan label pada setiap subplot
+            for i, var1 in enumerate(selected_pairplot):
+                for j, var2 in enumerate(selected_pairplot):
+                    if j < i:
+                        ax = pairplot_fig.axes[i][j]
                         ax.set_xlabel(f"{var2}")
-        
-        # Tampilkan plot
-        st.pyplot(pairplot_fig)
-else:
-    st.warning("Pilih minimal satu label tanaman untuk menampilkan pengaturan sampel dan visualisasi.")
-# 🔹 **Memuat Model yang Sudah Disimpan**
-@st.cache_resource
-def load_model():
-    with open("./Model/model_RandomForest copy.pkl", "rb") as file:
-        model = pickle.load(file)
-    return model
-
-model_randomForest = load_model()
-
-# 🔹 **Memuat Data Uji dari File CSV**
-X_test = pd.read_csv("./Dataset/X_test.csv")
-y_test = pd.read_csv("./Dataset/y_test.csv").values.ravel()
+                        ax.set_ylabel(f"{var1}")
+                        if i == len(selected_pairplot)-1:
+                            ax.set_xlabel(f"{var2}")
+            return pairplot_fig
 
-# 🔹 **Melakukan Prediksi dengan Model**
-y_pred = model_randomForest.predict(X_test)
-
-# 🔹 **Evaluasi Model**
-cm = confusion_matrix(y_test, y_pred)
-report = classification_report(y_test, y_pred, output_dict=True)
-accuracy = accuracy_score(y_test, y_pred)
+        # Tampilkan plot
+        st.image(grafik.gambar_matplotlib(model_tanaman.kunci_pairplot(*filter_pairplot, 'pairplot'), buat_pairplot), use_container_width=True)
+# 🔹 **Memuat Bundel Evaluasi Model (dibuat sekali per versi model)**
+evaluasi = model_tanaman.load_evaluasi()
+cm = evaluasi['confusion_matrix']
+accuracy = evaluasi['accuracy']
 
 # 🔹 **Mapping Label Encoding ke Nama Tanaman**
-label_mapping = {
-    'padi': 0,
-    'jagung': 1,
-    'buncis': 2,
-    'kacang merah': 3,
-    'kacang polong': 4,
-    'kacang panjang': 5,
-    'kacang hijau': 6,
-    'kacang hitam': 7,
-    'lentil': 8,
-    'delima': 9,
-    'pisang': 10,
-    'mangga': 11,
-    'anggur': 12,
-    'semangka': 13,
-    'melon': 14,
-    'apel': 15,
-    'jeruk': 16,
-    'pepaya': 17,
-    'kelapa': 18,
-    'kapas': 19,
-    'goni': 20,
-    'kopi': 21
-}
-
-reverse_label_mapping = {v: k for k, v in label_mapping.items()}
-
-# 🔹 **Konversi y_test ke nama label**
-y_test_labels = [reverse_label_mapping[label] for label in y_test]
-y_pred_labels = [reverse_label_mapping[label] for label in y_pred]
+label_mapping = model_tanaman.LABEL_TANAMAN
 
 # 🔹 **Mengonversi Classification Report ke DataFrame**
-def classification_report_to_df(y_test_labels, y_pred_labels):
-    report_dict = classification_report(y_test_labels, y_pred_labels, output_dict=True)
+def classification_report_to_df(report_dict):
     df = pd.DataFrame(report_dict).T
     df = df.drop(index=["accuracy"], errors="ignore")
     df[["precision", "recall", "f1-score"]] = (df[["precision", "recall", "f1-score"]] * 100).round(0).astype(int)
@@ -321,7 +313,7 @@ st.markdown("<h1 style='text-align: center;'> <br><br>🌱 Model Evaluasi Kinerj
 st.markdown(f"<h3 style='text-align: center; color: green;'>✅ Accuracy Score: {accuracy * 100:.2f}%</h3>", unsafe_allow_html=True)
 
 # Konversi classification report ke DataFrame
-report_df = classification_report_to_df(y_test_labels, y_pred_labels)
+report_df = classification_report_to_df(evaluasi['report'])
 
 # Atur ukuran kolom agar lebih seimbang
 col1, col2 = st.columns([1, 1.5])
@@ -334,25 +326,23 @@ with col1:
 with col2:
     st.markdown("<h2 style='text-align: center;'>🔎 Confusion Matrix</h2>", unsafe_allow_html=True)
 
-    fig, ax = plt.subplots(figsize=(7, 6))
-    sns.heatmap(cm, annot=True, fmt='d', cmap="Blues", xticklabels=label_mapping.values(), yticklabels=label_mapping.values())
-    ax.set_xlabel("Predicted Labels", fontsize=12)
-    ax.set_ylabel("True Labels", fontsize=12)
-    ax.set_title("Confusion Matrix - Random Forest", fontsize=14, fontweight='bold')
-    plt.xticks(rotation=45, ha='right')
-    plt.yticks(rotation=0)
-    st.pyplot(fig)
+    # Heatmap hanya dirender sekali per versi bundel evaluasi
+    st.image(
+        grafik.gambar_confusion_matrix(
+            model_tanaman.kunci_confusion_matrix(evaluasi['versi']), cm, list(label_mapping.values()),
+            model_tanaman.JUDUL_CONFUSION_MATRIX
+        ),
+        use_container_width=True
+    )
 
 
-# 🔹 **Memuat Model dari File .pkl**
+# 🔹 **Memuat Model dari File .pkl (diekspor ke mesin inferensi datar)**
 @st.cache_resource
 def load_model():
-    model_path = "./Model/model_RandomForest copy.pkl" 
-    
+    model_path = model_tanaman.MODEL_PATH
+
     try:
-        with open(model_path, "rb") as file:
-            model = pickle.load(file)
-        return model
+        return model_tanaman.load_mesin()
     except FileNotFoundError:
         st.error(f"Model file not found at {model_path}")
         raise FileNotFoundError(f"Model file not found at {model_path}")
@@ -384,31 +374,14 @@ with col3:
     ph = st.number_input("pH Tanah", min_value=0.0, value=6.5)
     rainfall = st.number_input("Curah Hujan (mm)", min_value=0, value=200)
 
+col_k, col_ambang = st.columns(2)
+with col_k:
+    jumlah_rekomendasi = st.number_input("Jumlah Rekomendasi Alternatif", min_value=1, max_value=len(model_tanaman.LABEL_TANAMAN), value=3)
+with col_ambang:
+    ambang_keyakinan = st.slider("Keyakinan Minimum (%)", min_value=0, max_value=100, value=5)
+
 # 🔹 **Dictionary untuk label tanaman**
-label_predict = {
-    'padi': 0,
-    'jagung': 1,
-    'buncis': 2,
-    'kacang merah': 3,
-    'kacang polong': 4,
-    'kacang panjang': 5,
-    'kacang hijau': 6,
-    'kacang hitam': 7,
-    'lentil': 8,
-    'delima': 9,
-    'pisang': 10,
-    'mangga': 11,
-    'anggur': 12,
-    'semangka': 13,
-    'melon': 14,
-    'apel': 15,
-    'jeruk': 16,
-    'pepaya': 17,
-    'kelapa': 18,
-    'kapas': 19,
-    'goni': 20,
-    'kopi': 21
-}
+label_predict = model_tanaman.LABEL_TANAMAN
 
 # 🔹 **Membalik dictionary untuk mempermudah pencarian nama berdasarkan angka**
 label_reverse = {v: k for k, v in label_predict.items()}
@@ -422,8 +395,9 @@ if st.button("🔎 Prediksi Tanaman"):
     if any(val is None or val == 0 for val in input_data[0]):
         st.error("Data yang dimasukkan tidak lengkap atau invalid.")
     else:
-        # Prediksi menggunakan model Random Forest
-        prediksi = model_randomForest.predict(input_data)[0]
+        # Prediksi top-k menggunakan model Random Forest (probabilitas dihitung sekali)
+        kode_top, proba_top = model_tanaman.rekomendasi_top_k(model_randomForest, input_data, k=jumlah_rekomendasi)
+        prediksi = kode_top[0, 0]
 
         # Mendapatkan nama tanaman berdasarkan prediksi
         predicted_label = label_reverse.get(prediksi, "Tanaman Tidak Dikenal")
@@ -431,6 +405,20 @@ if st.button("🔎 Prediksi Tanaman"):
         # 🔹 **Menampilkan Hasil Prediksi**
         st.markdown("<h2 style='text-align: center;'>🌾 Hasil Prediksi Tanaman 🌾</h2>", unsafe_allow_html=True)
         st.markdown(f"<h3 style='text-align: center; color: green;'>🌿 {predicted_label.upper()} 🌿</h3>", unsafe_allow_html=True)
+        st.markdown(f"<p style='text-align: center;'>Keyakinan model: {proba_top[0, 0] * 100:.1f}%</p>", unsafe_allow_html=True)
+
+        # 🔹 **Rekomendasi Alternatif**
+        lolos = proba_top[0] * 100 >= ambang_keyakinan
+        df_rekomendasi = pd.DataFrame({
+            'Peringkat': np.arange(1, kode_top.shape[1] + 1)[lolos],
+            'Tanaman': [label_reverse.get(kode, "Tanaman Tidak Dikenal") for kode in kode_top[0][lolos]],
+            'Probabilitas (%)': (proba_top[0][lolos] * 100).round(1),
+        })
+        st.markdown("<h3 style='text-align: center;'>🌿 Rekomendasi Alternatif 🌿</h3>", unsafe_allow_html=True)
+        if df_rekomendasi.empty:
+            st.info(f"Tidak ada tanaman dengan keyakinan di atas {ambang_keyakinan}%.")
+        else:
+            st.dataframe(df_rekomendasi, hide_index=True, use_container_width=True)
 
 # Add footer
 st.markdown("-----------")
@@ -0,0 +1,198 @@
+"""
+Prediksi rekomendasi tanaman secara batch tanpa Streamlit.
+
+File CSV atau Parquet berkolom N, P, K, temperature, humidity, ph, rainfall dibaca
+per chunk, setiap chunk diprediksi sekaligus oleh mesin inferensi Random Forest datar, lalu hasilnya
+langsung ditulis ke file output sehingga memori tetap terbatas berapa pun ukuran file.
+
+Contoh:
+    python rekomendasi_batch.py survei_tanah.csv hasil_rekomendasi.csv --chunk 50000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import model_tanaman
+
+UKURAN_CHUNK = 50_000
+
+KODE_TIDAK_VALID = -1
+LABEL_TIDAK_DIKENAL = "Tanaman Tidak Dikenal"
+LABEL_TIDAK_LENGKAP = "Data Tidak Lengkap"
+
+
+def _is_parquet(path):
+    return os.path.splitext(path)[1].lower() in ('.parquet', '.pq')
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Membaca/menulis Parquet membutuhkan paket 'pyarrow' (pip install pyarrow).") from e
+    return pyarrow
+
+
+def baca_chunk(path, ukuran_chunk=UKURAN_CHUNK):
+    """
+    Membaca file input CSV/Parquet per chunk.
+
+    Yields:
+        DataFrame berisi paling banyak `ukuran_chunk` baris
+    """
+    if _is_parquet(path):
+        pyarrow = _import_pyarrow()
+        for batch in pyarrow.parquet.ParquetFile(path).iter_batches(batch_size=ukuran_chunk):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=ukuran_chunk)
+
+
+# Tabel kode -> nama untuk pemetaan vektor
+_TABEL_NAMA = np.array(
+    [model_tanaman.NAMA_TANAMAN.get(kode, LABEL_TIDAK_DIKENAL) for kode in range(max(model_tanaman.NAMA_TANAMAN) + 1)],
+    dtype=object
+)
+
+
+def nama_tanaman(kode):
+    """
+    Memetakan array kode label ke nama tanaman memakai LABEL_TANAMAN secara vektor.
+    """
+    kode = np.asarray(kode)
+    dikenal = (kode >= 0) & (kode < len(_TABEL_NAMA))
+    hasil = np.full(kode.shape, LABEL_TIDAK_DIKENAL, dtype=object)
+    hasil[dikenal] = _TABEL_NAMA[kode[dikenal]]
+    return hasil
+
+
+def prediksi_chunk(model, chunk, top_k=0, ambang=0.0):
+    """
+    Memprediksi satu chunk. Baris dengan fitur kosong tidak diprediksi.
+
+    Args:
+        model: Hasil `model_tanaman.load_mesin()` atau model klasifikasi sklearn
+        chunk: DataFrame dengan kolom FITUR_TANAMAN
+        top_k: Jika > 0, tambahkan kolom tanaman_i/proba_i untuk k rekomendasi teratas
+        ambang: Probabilitas minimum untuk rekomendasi top-k
+    Returns:
+        DataFrame chunk ditambah kolom 'kode_tanaman' dan 'tanaman' (serta kolom top-k). Kolom
+        FITUR_TANAMAN diganti nilai numeriknya (float64, sel tidak valid menjadi kosong) sehingga
+        dtype output sama untuk setiap chunk
+    """
+    hilang = [kolom for kolom in model_tanaman.FITUR_TANAMAN if kolom not in chunk.columns]
+    if hilang:
+        raise ValueError(f"Kolom berikut tidak ditemukan pada file input: {hilang}")
+
+    X = chunk[model_tanaman.FITUR_TANAMAN].apply(pd.to_numeric, errors='coerce')
+    valid = X.notna().all(axis=1).to_numpy()
+
+    kode = np.full(len(chunk), KODE_TIDAK_VALID, dtype=np.int64)
+    if top_k > 0:
+        kode_top = np.full((len(chunk), top_k), KODE_TIDAK_VALID, dtype=np.int64)
+        proba_top = np.full((len(chunk), top_k), np.nan)
+        if valid.any():
+            # Probabilitas dihitung sekali; rekomendasi utama adalah peringkat pertama
+            kode_valid, proba_valid = model_tanaman.rekomendasi_top_k(model, X[valid], top_k)
+            kode[valid] = kode_valid[:, 0]
+            di_bawah_ambang = proba_valid < ambang
+            kode_valid[di_bawah_ambang] = KODE_TIDAK_VALID
+            proba_valid[di_bawah_ambang] = np.nan
+            kode_top[valid, :kode_valid.shape[1]] = kode_valid
+            proba_top[valid, :proba_valid.shape[1]] = proba_valid
+    elif valid.any():
+        kode[valid] = model_tanaman.prediksi(model, X[valid])
+
+    tanaman = nama_tanaman(kode)
+    tanaman[~valid] = LABEL_TIDAK_LENGKAP
+
+    hasil = chunk.copy()
+    hasil[model_tanaman.FITUR_TANAMAN] = X.astype(np.float64)
+    hasil['kode_tanaman'] = kode
+    hasil['tanaman'] = tanaman
+    for i in range(top_k):
+        nama = nama_tanaman(kode_top[:, i])
+        nama[kode_top[:, i] == KODE_TIDAK_VALID] = None
+        hasil[f'tanaman_{i + 1}'] = nama
+        hasil[f'proba_{i + 1}'] = proba_top[:, i]
+    return hasil
+
+
+def _skema_parquet(pyarrow, hasil, top_k):
+    """
+    Skema Parquet output: kolom hasil prediksi dan fitur ber-tipe tetap, kolom lain mengikuti
+    chunk pertama. Tipe hasil inferensi per chunk dapat berbeda (misalnya kolom top-k yang
+    seluruhnya kosong terbaca sebagai null), sedangkan ParquetWriter menuntut skema yang sama.
+    """
+    tetap = {kolom: pyarrow.float64() for kolom in model_tanaman.FITUR_TANAMAN}
+    tetap.update({'kode_tanaman': pyarrow.int64(), 'tanaman': pyarrow.string()})
+    for i in range(1, top_k + 1):
+        tetap.update({f'tanaman_{i}': pyarrow.string(), f'proba_{i}': pyarrow.float64()})
+    inferensi = pyarrow.Schema.from_pandas(hasil, preserve_index=False)
+    return pyarrow.schema([pyarrow.field(field.name, tetap.get(field.name, field.type)) for field in inferensi])
+
+
+def prediksi_file(path_input, path_output, ukuran_chunk=UKURAN_CHUNK, progres=None, top_k=0, ambang=0.0):
+    """
+    Memprediksi seluruh file input dan menulis hasilnya secara bertahap.
+
+    Args:
+        path_input: File CSV/Parquet dengan kolom FITUR_TANAMAN
+        path_output: File CSV/Parquet tujuan (format mengikuti ekstensi)
+        ukuran_chunk: Jumlah baris per chunk
+        progres: Callback opsional progres(jumlah_baris_selesai)
+        top_k: Jumlah rekomendasi beserta probabilitas per baris (0 = hanya label)
+        ambang: Probabilitas minimum untuk rekomendasi top-k
+    Returns:
+        Jumlah baris yang diproses
+    """
+    model = model_tanaman.load_mesin()
+    parquet_output = _is_parquet(path_output)
+    penulis = None
+    total = 0
+
+    try:
+        for chunk in baca_chunk(path_input, ukuran_chunk):
+            hasil = prediksi_chunk(model, chunk, top_k, ambang)
+            if parquet_output:
+                pyarrow = _import_pyarrow()
+                if penulis is None:
+                    penulis = pyarrow.parquet.ParquetWriter(path_output, _skema_parquet(pyarrow, hasil, top_k))
+                penulis.write_table(pyarrow.Table.from_pandas(hasil, schema=penulis.schema, preserve_index=False))
+            else:
+                hasil.to_csv(path_output, mode='w' if total == 0 else 'a', header=total == 0, index=False)
+            total += len(hasil)
+            if progres is not None:
+                progres(total)
+    finally:
+        if penulis is not None:
+            penulis.close()
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prediksi rekomendasi tanaman untuk file survei tanah (CSV/Parquet).")
+    parser.add_argument('input', help="File input CSV/Parquet dengan kolom " + ", ".join(model_tanaman.FITUR_TANAMAN))
+    parser.add_argument('output', help="File output CSV/Parquet")
+    parser.add_argument('--chunk', type=int, default=UKURAN_CHUNK, help=f"Jumlah baris per chunk (default {UKURAN_CHUNK})")
+    parser.add_argument('--top-k', type=int, default=0, help="Tambahkan k rekomendasi teratas beserta probabilitasnya")
+    parser.add_argument('--ambang', type=float, default=0.0, help="Probabilitas minimum untuk rekomendasi top-k (0-1)")
+    args = parser.parse_args(argv)
+
+    mulai = time.perf_counter()
+    total = prediksi_file(
+        args.input, args.output, args.chunk,
+        progres=lambda n: print(f"\r{n:,} baris diproses", end='', file=sys.stderr),
+        top_k=args.top_k, ambang=args.ambang
+    )
+    durasi = time.perf_counter() - mulai
+    print(f"\nSelesai: {total:,} baris dalam {durasi:.2f} detik -> {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+"""
+Lapisan pratinjau dan pencarian tabel untuk st.dataframe.
+
+Hanya jendela baris yang sedang ditampilkan yang diambil dan diformat, sehingga biaya setiap
+rerun sebanding dengan jumlah baris per halaman, bukan jumlah baris dataset. Pembulatan
+dilakukan per kolom dengan operasi NumPy, hanya pada kolom numerik.
+
+Pencarian memakai indeks per kolom yang dibangun sekali per versi dataset: kolom numerik
+sebagai array terurut yang dicari dengan `np.searchsorted`, kolom teks sebagai kode kategori
+dengan indeks n-gram atas nilai uniknya. Setiap kueri hanya menyentuh baris yang cocok.
+"""
+import math
+import re
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from artefak import ambil_cache_lru
+
+# Pilihan jumlah baris per halaman pratinjau
+UKURAN_HALAMAN = [50, 100, 500, 1000]
+# Panjang n-gram untuk indeks kolom teks
+N_GRAM = 3
+
+_ANGKA = r'-?\d+(?:[.,]\d+)?'
+_POLA_RENTANG = re.compile(rf'^({_ANGKA})\s*(?:\.\.|-|s/d)\s*({_ANGKA})$')
+_POLA_BANDING = re.compile(rf'^(>=|<=|>|<|=)?\s*({_ANGKA})$')
+# Batas kelipatan sepuluh rentang awalan; float64 tidak melebihi 1e308
+_PANGKAT_MAKS = 308
+
+_cache_indeks = OrderedDict()
+_lock = threading.Lock()
+
+
+def jumlah_halaman(n_baris, ukuran_halaman):
+    return max(1, math.ceil(n_baris / ukuran_halaman))
+
+
+def bulatkan_atas(data):
+    """
+    Membulatkan ke atas semua kolom bilangan pecahan; kolom bilangan bulat sudah bulat
+    dan kolom non-numerik dibiarkan apa adanya.
+
+    Returns:
+        DataFrame baru; `data` tidak diubah
+    """
+    hasil = data.copy(deep=False)
+    for kolom, dtype in data.dtypes.items():
+        if pd.api.types.is_float_dtype(dtype):
+            hasil[kolom] = np.ceil(data[kolom].to_numpy())
+    return hasil
+
+
+def pratinjau(data, halaman=1, ukuran_halaman=UKURAN_HALAMAN[1]):
+    """
+    Potongan satu halaman DataFrame yang sudah diformat untuk ditampilkan.
+
+    Args:
+        data: DataFrame sumber (tidak disalin)
+        halaman: Nomor halaman mulai dari 1
+        ukuran_halaman: Jumlah baris per halaman
+    Returns:
+        DataFrame berisi paling banyak `ukuran_halaman` baris
+    """
+    halaman = min(max(1, int(halaman)), jumlah_halaman(len(data), ukuran_halaman))
+    awal = (halaman - 1) * ukuran_halaman
+    return bulatkan_atas(data.iloc[awal:awal + ukuran_halaman])
+
+
+def _indeks_angka(nilai):
+    nilai = nilai.to_numpy(dtype=float, na_value=np.nan)
+    posisi = np.flatnonzero(~np.isnan(nilai))
+    urutan = np.argsort(nilai[posisi], kind='stable')
+    return {'jenis': 'angka', 'nilai': nilai[posisi][urutan], 'posisi': posisi[urutan]}
+
+
+def _indeks_teks(nilai):
+    kode, kategori = pd.factorize(nilai)
+    kategori = np.array([str(k).lower() for k in kategori], dtype=object)
+    # Posisi baris dikelompokkan per kode: baris kategori k ada di posisi[batas[k]:batas[k + 1]]
+    urutan = np.argsort(kode, kind='stable')
+    batas = np.searchsorted(kode[urutan], np.arange(len(kategori) + 1))
+
+    ngram = {}
+    for k, teks in enumerate(kategori):
+        for g in {teks[i:i + N_GRAM] for i in range(len(teks) - N_GRAM + 1)}:
+            ngram.setdefault(g, []).append(k)
+    return {
+        'jenis': 'teks',
+        'kategori': kategori,
+        'posisi': urutan,
+        'batas': batas,
+        'ngram': {g: np.array(daftar) for g, daftar in ngram.items()},
+    }
+
+
+def buat_indeks(nilai):
+    """
+    Membangun indeks pencarian untuk satu kolom.
+
+    Args:
+        nilai: Series kolom dataset
+    Returns:
+        Dictionary indeks; jenis 'angka' untuk kolom numerik, 'teks' untuk kolom lain
+    """
+    if pd.api.types.is_numeric_dtype(nilai.dtype) and not pd.api.types.is_bool_dtype(nilai.dtype):
+        return _indeks_angka(nilai)
+    return _indeks_teks(nilai)
+
+
+def indeks_tersimpan(kunci, nilai):
+    """
+    Indeks `buat_indeks` yang disimpan per kunci, misalnya (versi dataset, nama kolom).
+    """
+    with _lock:
+        return ambil_cache_lru(_cache_indeks, tuple(kunci), lambda: buat_indeks(nilai))
+
+
+def _rentang_awalan(angka, maks):
+    """
+    Rentang nilai yang tulisan desimalnya diawali `angka`, misalnya "50" cocok dengan 50,
+    50.5, 500-509.9, 5000-5099.9 dan seterusnya: satu rentang per kelipatan sepuluh sampai
+    `maks`. Angka dengan titik desimal hanya memiliki satu rentang ("6.5" cocok dengan 6.5
+    sampai sebelum 6.6).
+    """
+    negatif = angka.startswith('-')
+    digit = angka.lstrip('-')
+    bulat, titik, pecahan = digit.partition('.')
+    if len(bulat) > 1 and bulat.startswith('0'):
+        # Tidak ada angka yang ditulis dengan nol di depan
+        return []
+    # Batas dihitung dengan Decimal agar tidak ada galat pembulatan pada ujung rentang
+    awal = Decimal(digit)
+    lebar = Decimal(1).scaleb(-len(pecahan))
+    rentang = []
+    for pangkat in range(_PANGKAT_MAKS + 1):
+        bawah, atas = awal.scaleb(pangkat), (awal + lebar).scaleb(pangkat)
+        if pangkat and bawah > maks:
+            break
+        if negatif:
+            # -0.x tidak mencakup 0, yang ditulis tanpa tanda minus
+            rentang.append((-float(atas), -float(bawah), False, bawah != 0))
+        else:
+            rentang.append((float(bawah), float(atas), True, False))
+        if titik or bulat == '0':
+            break
+    return rentang
+
+
+def _rentang_kueri(kueri, minimum=0.0, maksimum=0.0):
+    """
+    Menerjemahkan kueri numerik menjadi daftar rentang (bawah, atas, termasuk_bawah, termasuk_atas).
+
+    Bentuk yang didukung: "a-b" atau "a..b" (rentang inklusif), ">a", ">=a", "<a", "<=a", "=a"
+    (sama persis), dan "a" yang cocok dengan angka yang tulisannya diawali a (lihat `_rentang_awalan`),
+    seperti pencarian substring lama pada awal angka.
+
+    Args:
+        kueri: Teks kueri
+        minimum, maksimum: Nilai terkecil dan terbesar kolom, untuk membatasi rentang awalan
+    """
+    kueri = kueri.strip()
+    cocok = _POLA_RENTANG.match(kueri)
+    if cocok:
+        bawah, atas = sorted(float(x.replace(',', '.')) for x in cocok.groups())
+        return [(bawah, atas, True, True)]
+    cocok = _POLA_BANDING.match(kueri)
+    if not cocok:
+        raise ValueError(f"Kueri {kueri!r} tidak dikenali untuk kolom numerik; contoh: 50, 20-30, >=6.5")
+    operator, angka = cocok.groups()
+    angka = angka.replace(',', '.')
+    v = float(angka)
+    if operator == '=':
+        return [(v, v, True, True)]
+    if operator in ('>', '>='):
+        return [(v, np.inf, operator == '>=', True)]
+    if operator in ('<', '<='):
+        return [(-np.inf, v, True, operator == '<=')]
+    return _rentang_awalan(angka, -minimum if angka.startswith('-') else maksimum)
+
+
+def _cari_angka(indeks, kueri):
+    nilai = indeks['nilai']
+    minimum, maksimum = (float(nilai[0]), float(nilai[-1])) if len(nilai) else (0.0, 0.0)
+    hasil = []
+    for bawah, atas, termasuk_bawah, termasuk_atas in _rentang_kueri(kueri, minimum, maksimum):
+        kiri = np.searchsorted(nilai, bawah, 'left' if termasuk_bawah else 'right')
+        kanan = np.searchsorted(nilai, atas, 'right' if termasuk_atas else 'left')
+        hasil.append(indeks['posisi'][kiri:kanan])
+    # Rentang tidak saling beririsan sehingga tidak ada posisi ganda
+    return np.concatenate(hasil) if hasil else np.empty(0, dtype=np.intp)
+
+
+def _cari_teks(indeks, kueri):
+    kueri = kueri.strip().lower()
+    kategori = indeks['kategori']
+    if len(kueri) >= N_GRAM:
+        # Kandidat hanya kategori yang memuat semua n-gram kueri; kandidat lalu dicek ulang
+        kandidat = None
+        for g in {kueri[i:i + N_GRAM] for i in range(len(kueri) - N_GRAM + 1)}:
+            daftar = indeks['ngram'].get(g)
+            if daftar is None:
+                return np.empty(0, dtype=np.intp)
+            kandidat = daftar if kandidat is None else np.intersect1d(kandidat, daftar, assume_unique=True)
+    else:
+        kandidat = np.arange(len(kategori))
+    batas = indeks['batas']
+    return np.concatenate(
+        [indeks['posisi'][batas[k]:batas[k + 1]] for k in kandidat if kueri in kategori[k]]
+        or [np.empty(0, dtype=np.intp)]
+    )
+
+
+def cari(indeks, kueri):
+    """
+    Mencari baris yang cocok dengan kueri pada indeks satu kolom.
+
+    Args:
+        indeks: Hasil `buat_indeks` atau `indeks_tersimpan`
+        kueri: Teks pencarian; untuk kolom numerik lihat bentuk kueri pada `_rentang_kueri`,
+            untuk kolom teks dicocokkan sebagai substring tanpa membedakan huruf besar/kecil
+    Returns:
+        Array posisi baris (untuk `iloc`) terurut naik
+    Raises:
+        ValueError: Jika kueri tidak dapat dibaca untuk kolom numerik
+    """
+    if indeks['jenis'] == 'angka':
+        posisi = _cari_angka(indeks, kueri)
+    else:
+        posisi = _cari_teks(indeks, kueri)
+    return np.sort(posisi)
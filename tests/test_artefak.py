@@ -0,0 +1,126 @@
+import multiprocessing
+import os
+import time
+
+import numpy as np
+import pytest
+
+from artefak import buka_artefak, kunci_file, muat_array, simpan_array
+
+N_PROSES = 4
+N_ULANG = 100
+
+pytestmark = pytest.mark.skipif(
+    'fork' not in multiprocessing.get_all_start_methods(), reason="uji antar-proses memakai start method fork"
+)
+
+
+def _isi(versi):
+    return {'a': np.full(1000, versi, dtype=np.int64), 'b': np.arange(versi + 1, dtype=np.float32)}
+
+
+def _tulis_dan_baca(folder):
+    # Seperti beberapa pekerja Streamlit/pelatihan yang mengekspor lalu membuka artefak berversi yang sama
+    for _ in range(N_ULANG):
+        simpan_array(folder, _isi(7), {'versi': 7})
+        arrays, meta = buka_artefak(folder, lambda: simpan_array(folder, _isi(7), {'versi': 7}))
+        assert meta == {'versi': 7}
+        assert (arrays['a'] == 7).all() and len(arrays['b']) == 8
+    return True
+
+
+def _ganti_dengan_kunci(folder, versi):
+    for i in range(N_ULANG // 4):
+        with kunci_file(folder + '.lock'):
+            simpan_array(folder, _isi(versi + i), {'versi': versi + i}, ganti=True)
+    return True
+
+
+def _baca_selama_diganti(folder):
+    terbaca = 0
+    for _ in range(N_ULANG):
+        bundel = muat_array(folder)
+        if bundel is not None:
+            # Isi yang terbaca selalu berasal dari satu versi, tidak pernah campuran folder lama dan baru
+            arrays, meta = bundel
+            assert set(arrays) == {'a', 'b'}
+            assert (arrays['a'] == meta['versi']).all() and len(arrays['b']) == meta['versi'] + 1
+            terbaca += 1
+    return terbaca
+
+
+def _jalankan(fungsi, daftar_argumen):
+    with multiprocessing.get_context('fork').Pool(len(daftar_argumen)) as pool:
+        return pool.starmap(fungsi, daftar_argumen)
+
+
+def test_simpan_muat_serentak_penulis_pertama_menang(tmp_path):
+    folder = str(tmp_path / 'artefak')
+
+    assert _jalankan(_tulis_dan_baca, [(folder,)] * N_PROSES) == [True] * N_PROSES
+
+    # Tidak ada folder sementara yang tertinggal
+    assert os.listdir(tmp_path) == ['artefak']
+
+
+def test_simpan_tidak_menimpa_folder_yang_ada(tmp_path):
+    folder = str(tmp_path / 'artefak')
+
+    assert simpan_array(folder, _isi(1), {'versi': 1}) is True
+    assert simpan_array(folder, _isi(2), {'versi': 2}) is False
+
+    arrays, meta = muat_array(folder)
+    assert meta == {'versi': 1} and (arrays['a'] == 1).all()
+    assert os.listdir(tmp_path) == ['artefak']
+
+
+def test_ganti_selama_dibaca_proses_lain(tmp_path):
+    folder = str(tmp_path / 'data')
+    simpan_array(folder, _isi(0), {'versi': 0})
+    arrays_lama, _ = muat_array(folder)
+
+    with multiprocessing.get_context('fork').Pool(N_PROSES) as pool:
+        penulis = [pool.apply_async(_ganti_dengan_kunci, (folder, 100 * i)) for i in range(2)]
+        pembaca = [pool.apply_async(_baca_selama_diganti, (folder,)) for _ in range(N_PROSES - 2)]
+        assert [p.get() for p in penulis] == [True, True]
+        assert sum(p.get() for p in pembaca) > 0
+
+    # Memmap folder lama tetap dapat dibaca setelah folder diganti
+    assert (arrays_lama['a'] == 0).all()
+    _, meta = muat_array(folder)
+    assert meta['versi'] in (N_ULANG // 4 - 1, 100 + N_ULANG // 4 - 1)
+    assert sorted(os.listdir(tmp_path)) == ['data']
+
+
+def test_buka_artefak_gagal_jika_ekspor_tidak_menulis(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        buka_artefak(str(tmp_path / 'tidak_ada'), lambda: None)
+
+
+def _pegang_kunci(path, detik, batas_waktu):
+    with kunci_file(path, batas_waktu):
+        awal = time.monotonic()
+        time.sleep(detik)
+        return awal, time.monotonic()
+
+
+def test_kunci_file_tidak_diambil_alih_selama_pemegang_hidup(tmp_path):
+    path = str(tmp_path / 'data.lock')
+    # Pekerjaan di dalam kunci jauh lebih lama dari batas_waktu; kunci tetap diperbarui pemegangnya
+    (awal_a, akhir_a), (awal_b, akhir_b) = sorted(_jalankan(_pegang_kunci, [(path, 1.0, 0.2)] * 2))
+
+    assert awal_b >= akhir_a
+    assert not os.path.exists(path)
+
+
+def test_kunci_file_mengambil_alih_kunci_basi(tmp_path):
+    path = str(tmp_path / 'data.lock')
+    # Sisa proses yang mati: file kunci ada tetapi tidak pernah diperbarui lagi
+    open(path, 'w').close()
+    os.utime(path, (time.time() - 120, time.time() - 120))
+
+    awal = time.monotonic()
+    with kunci_file(path, batas_waktu=60.0):
+        assert os.path.exists(path)
+    assert time.monotonic() - awal < 5
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,106 @@
+import os
+import shutil
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import artefak
+import data_cuaca
+
+
+@pytest.fixture
+def dir_stasiun(tmp_path, monkeypatch):
+    folder = tmp_path / 'stasiun'
+    monkeypatch.setattr(data_cuaca, 'DIR_STASIUN', str(folder))
+    return folder
+
+
+def _gabungan(path, stasiun):
+    pd.DataFrame({
+        'ID_STASIUN': stasiun,
+        'TANGGAL': [f'{i + 1:02d}-01-2024' for i in range(len(stasiun))],
+        'TN': range(len(stasiun)),
+    }).to_csv(path, index=False)
+
+
+def test_pecah_per_stasiun_ulang_tidak_menggandakan(tmp_path, dir_stasiun):
+    path = tmp_path / 'gabungan.csv'
+    _gabungan(path, ['B01', 'B02', 'B01', 'B01'])
+
+    for _ in range(2):
+        assert data_cuaca.pecah_per_stasiun(str(path), ukuran_chunk=2) == ['B01', 'B02']
+
+    assert pd.read_csv(dir_stasiun / 'B01.csv')['TN'].tolist() == [0, 2, 3]
+    assert pd.read_csv(dir_stasiun / 'B02.csv')['TN'].tolist() == [1]
+    assert sorted(os.listdir(dir_stasiun)) == ['B01.csv', 'B02.csv']
+
+
+def test_pecah_per_stasiun_menolak_stasiun_utama(tmp_path, dir_stasiun, monkeypatch):
+    dataset_utama = tmp_path / 'utama.csv'
+    dataset_utama.write_text('TANGGAL,TN\n')
+    monkeypatch.setattr(data_cuaca, 'PATH_DATASET', str(dataset_utama))
+    path = tmp_path / 'gabungan.csv'
+    _gabungan(path, ['B01', data_cuaca.STASIUN_UTAMA])
+
+    with pytest.raises(ValueError):
+        data_cuaca.pecah_per_stasiun(str(path))
+
+    assert dataset_utama.read_text() == 'TANGGAL,TN\n'
+    assert os.listdir(dir_stasiun) == []
+
+
+@pytest.fixture
+def stasiun_inkremental(tmp_path, dir_stasiun, monkeypatch):
+    monkeypatch.setattr(artefak, 'CACHE_DIR', str(tmp_path / 'Cache'))
+    monkeypatch.setattr(data_cuaca, '_cache', OrderedDict())
+    dir_stasiun.mkdir()
+    # Baris asli stasiun utama; beberapa baris diberi nilai kosong (8888, sel kosong) agar ujung
+    # data lama perlu diinterpolasi ulang setelah baris baru tiba
+    baris = pd.read_csv(data_cuaca.PATH_DATASET, dtype=str, keep_default_na=False).head(300)
+    for awal, akhir in ((197, 202), (248, 250)):
+        baris.loc[awal:akhir, 'RR'] = '8888'
+        baris.loc[awal:akhir, 'TN'] = ''
+    return dir_stasiun / 'B01.csv', baris
+
+
+def _arrays(stasiun):
+    arrays, meta = data_cuaca._muat_arrays(stasiun)
+    return {nama: np.array(array) for nama, array in arrays.items()}, meta
+
+
+def test_pembaruan_inkremental_identik_dengan_bangun_ulang(stasiun_inkremental, monkeypatch):
+    path, baris = stasiun_inkremental
+    jumlah_ekspor = []
+    ekspor_asli = data_cuaca.ekspor_data
+    monkeypatch.setattr(data_cuaca, 'ekspor_data', lambda stasiun: jumlah_ekspor.append(1) or ekspor_asli(stasiun))
+
+    baris.iloc[:200].to_csv(path, index=False)
+    _arrays('B01')
+    with open(path, 'a') as file:
+        file.write(baris.iloc[200:250].to_csv(index=False, header=False))
+    _arrays('B01')
+    # Baris yang belum selesai ditulis (tanpa newline) menunggu pembaruan berikutnya
+    ekor = baris.iloc[250:].to_csv(index=False, header=False)
+    potong = ekor.index('\n') + 10
+    with open(path, 'a') as file:
+        file.write(ekor[:potong])
+    _, meta = _arrays('B01')
+    assert meta['n_baris'] == 251
+    with open(path, 'a') as file:
+        file.write(ekor[potong:])
+    inkremental, meta = _arrays('B01')
+    assert jumlah_ekspor == [1]
+    assert meta['n_baris'] == len(baris)
+
+    shutil.rmtree(data_cuaca.folder_data('B01'))
+    data_cuaca._cache.clear()
+    penuh, meta_penuh = _arrays('B01')
+    assert jumlah_ekspor == [1, 1]
+
+    assert set(inkremental) == set(penuh)
+    for nama in penuh:
+        assert inkremental[nama].dtype == penuh[nama].dtype, nama
+        assert inkremental[nama].tobytes() == penuh[nama].tobytes(), nama
+    assert meta == meta_penuh
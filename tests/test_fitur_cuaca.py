@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_cuaca
+import fitur_cuaca
+import peramalan
+from fitur_cuaca import FITUR_LAG, FITUR_ROLLING, VARIABEL_CUACA
+from model_cuaca import TARGET_CUACA
+
+
+class ModelRekam:
+    """
+    Model palsu yang mengembalikan nilai target sebenarnya hari demi hari dan merekam
+    setiap baris fitur yang diterimanya.
+    """
+
+    def __init__(self, nilai_target):
+        self.nilai_target = list(nilai_target)
+        self.baris = []
+
+    def predict(self, X):
+        self.baris.append(X.iloc[0].copy())
+        return np.full(len(X), self.nilai_target[len(self.baris) - 1])
+
+
+@pytest.fixture(scope='module')
+def histori():
+    return data_cuaca.muat_data()[list(data_cuaca.KOLOM_MODEL)].rename(columns=data_cuaca.KOLOM_MODEL)[VARIABEL_CUACA]
+
+
+def test_buat_fitur_sama_dengan_pandas(histori):
+    hasil_lag, hasil_rolling = fitur_cuaca.buat_fitur(histori.to_numpy())
+
+    np.testing.assert_allclose(hasil_lag[1], histori.shift(1).to_numpy(), rtol=1e-12)
+    np.testing.assert_allclose(hasil_rolling[3], histori.rolling(3).mean().to_numpy(), rtol=1e-12)
+
+
+def test_buat_fitur_sumbu_stasiun(histori):
+    nilai = histori.to_numpy()
+    tumpuk = np.stack([nilai, nilai[::-1]])
+    hasil_lag, hasil_rolling = fitur_cuaca.buat_fitur(tumpuk)
+
+    np.testing.assert_array_equal(hasil_rolling[3][1], fitur_cuaca.buat_fitur(nilai[::-1])[1][3])
+    np.testing.assert_array_equal(hasil_lag[1][0], fitur_cuaca.buat_fitur(nilai)[0][1])
+
+
+@pytest.mark.parametrize('target', list(TARGET_CUACA))
+def test_fitur_peramalan_sama_dengan_buat_fitur(histori, target):
+    kolom_target = TARGET_CUACA[target]['kolom']
+    posisi_target = VARIABEL_CUACA.index(kolom_target)
+    mulai, hari = 500, 10
+
+    # Histori acuan: data sebenarnya sampai hari pertama peramalan, lalu variabel selain target
+    # tetap pada nilai hari pertama seperti asumsi peramalan; target tetap nilai sebenarnya
+    acuan = histori.to_numpy(dtype=float)[:mulai + hari].copy()
+    for j in range(len(VARIABEL_CUACA)):
+        if j != posisi_target:
+            acuan[mulai:, j] = acuan[mulai, j]
+    hasil_lag, hasil_rolling = fitur_cuaca.buat_fitur(acuan)
+
+    fitur = fitur_cuaca.fitur_target(target)
+    kolom_kondisi = peramalan.fitur_kondisi(target)
+    kondisi = {kolom: acuan[mulai, VARIABEL_CUACA.index(kolom)] for kolom in VARIABEL_CUACA if kolom in kolom_kondisi}
+    kondisi.update({FITUR_LAG[v]: hasil_lag[1][mulai, j] for j, v in enumerate(VARIABEL_CUACA)})
+    kondisi.update({FITUR_ROLLING[v]: hasil_rolling[3][mulai, j] for j, v in enumerate(VARIABEL_CUACA)})
+
+    model = ModelRekam(acuan[mulai:, posisi_target])
+    peramalan.ramalkan(model, target, kondisi, histori.index[mulai - 1], hari)
+
+    assert len(model.baris) == hari
+    for i, baris in enumerate(model.baris):
+        t = mulai + i
+        harapan = dict(kondisi)
+        harapan.update({FITUR_LAG[v]: hasil_lag[1][t, j] for j, v in enumerate(VARIABEL_CUACA)})
+        harapan.update({FITUR_ROLLING[v]: hasil_rolling[3][t, j] for j, v in enumerate(VARIABEL_CUACA)})
+        if i > 0:
+            # Target hari t belum diketahui saat meramal: posisinya di jendela diisi nilai hari t-1
+            jendela = acuan[t - 2:t + 1, posisi_target].copy()
+            jendela[-1] = acuan[t - 1, posisi_target]
+            harapan[FITUR_ROLLING[kolom_target]] = fitur_cuaca.rata_bergulir(jendela)
+        baris = baris[kolom_kondisi]
+        np.testing.assert_allclose(
+            baris.to_numpy(dtype=float), pd.Series(harapan)[kolom_kondisi].to_numpy(dtype=float),
+            rtol=1e-12, atol=1e-12, err_msg=f'{target} hari ke-{i}'
+        )
+        tanggal = histori.index[t]
+        assert fitur == list(model.baris[i].index)
+        assert model.baris[i][['Hari', 'Bulan', 'Tahun']].tolist() == [tanggal.dayofweek, tanggal.month, tanggal.year]
+
+
+def test_riwayat_awal_mempertahankan_rolling_masukan():
+    lag, rolling, hari = np.array([1.0, 2.0]), np.array([3.0, 4.0]), np.array([5.0, 6.0])
+    for w in (2, 3, 5):
+        riwayat = fitur_cuaca.riwayat_awal(lag, rolling if w > 2 else (lag + hari) / 2, hari, w)
+        np.testing.assert_array_equal(riwayat[:, -2], lag)
+        np.testing.assert_array_equal(riwayat[:, -1], hari)
+        np.testing.assert_allclose(riwayat.mean(axis=-1), rolling if w > 2 else (lag + hari) / 2)
@@ -0,0 +1,227 @@
+import threading
+
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+import grafik
+
+
+@pytest.fixture(autouse=True)
+def cache_kosong():
+    grafik.kosongkan_cache()
+    yield
+    grafik.kosongkan_cache()
+
+
+def _pembuat_png(ukuran, dipanggil):
+    def pembuat():
+        dipanggil.append(ukuran)
+        return b'x' * ukuran, ukuran
+    return pembuat
+
+
+def test_figur_plotly_dibangun_sekali_per_kunci():
+    dipanggil = []
+
+    def pembuat():
+        dipanggil.append(1)
+        return go.Figure(go.Scatter(x=[1, 2, 3], y=[4, 5, 6]))
+
+    pertama = grafik.figur_plotly(('uji', 1), pembuat)
+    kedua = grafik.figur_plotly(('uji', 1), pembuat)
+
+    assert dipanggil == [1]
+    assert kedua is pertama
+    assert isinstance(pertama, dict)
+    np.testing.assert_array_equal(go.Figure(pertama).data[0].y, [4, 5, 6])
+
+
+def test_cache_figur_dibatasi_ukuran_byte(monkeypatch):
+    monkeypatch.setattr(grafik, 'BATAS_MEMORI_FIGUR', 100)
+    dipanggil = []
+
+    for i in range(4):
+        grafik._ambil_figur(('png', i), _pembuat_png(30, dipanggil))
+    # Empat entri 30 byte melebihi 100 byte: entri paling lama dibuang
+    assert list(grafik._cache_figur) == [('png', 1), ('png', 2), ('png', 3)]
+    assert grafik._ukuran_cache == 90
+
+    # Entri yang dipakai ulang pindah ke akhir sehingga yang dibuang berikutnya ('png', 2)
+    grafik._ambil_figur(('png', 1), _pembuat_png(30, dipanggil))
+    grafik._ambil_figur(('png', 4), _pembuat_png(30, dipanggil))
+    assert list(grafik._cache_figur) == [('png', 3), ('png', 1), ('png', 4)]
+    assert dipanggil == [30] * 5
+
+    # Figure yang lebih besar dari batas tetap dikembalikan, tetapi tidak disimpan
+    assert len(grafik._ambil_figur(('png', 'besar'), _pembuat_png(150, dipanggil))) == 150
+    assert ('png', 'besar') not in grafik._cache_figur
+    assert grafik._ukuran_cache == 90
+
+
+def test_sebaran_dihitung_di_luar_lock(monkeypatch):
+    mulai, lanjut = threading.Event(), threading.Event()
+    asli = grafik.sebaran
+
+    def sebaran_lambat(nilai, bins=20):
+        mulai.set()
+        assert lanjut.wait(10)
+        return asli(nilai, bins)
+
+    monkeypatch.setattr(grafik, 'sebaran', sebaran_lambat)
+    nilai = np.random.default_rng(0).normal(size=1000)
+    hasil = {}
+    pekerja = [
+        threading.Thread(target=lambda i=i: hasil.__setitem__(i, grafik.sebaran_tersimpan(('sebaran',), nilai)))
+        for i in range(2)
+    ]
+    for t in pekerja:
+        t.start()
+    assert mulai.wait(10)
+
+    # Selama KDE dihitung, sesi lain tetap dapat memakai cache figure
+    dipanggil = []
+    sesi_lain = threading.Thread(target=grafik._ambil_figur, args=(('png', 'lain'), _pembuat_png(10, dipanggil)))
+    sesi_lain.start()
+    sesi_lain.join(5)
+    tertahan = sesi_lain.is_alive()
+    lanjut.set()
+    sesi_lain.join(10)
+    assert not tertahan
+    assert dipanggil == [10]
+
+    for t in pekerja:
+        t.join(10)
+    # Perhitungan yang berlomba untuk kunci yang sama berakhir pada satu entri bersama
+    assert hasil[0] is hasil[1]
+    assert len(grafik._cache_sebaran) == 1
+
+
+def _lttb_naif(x, y, n_titik):
+    # LTTB (Steinarsson 2013) per titik dengan bucket yang sama: titik pertama dan terakhir tetap
+    n = len(y)
+    lebar = (n - 2) / (n_titik - 2)
+    terpilih = [0]
+    a = 0
+    for i in range(n_titik - 2):
+        awal, akhir = int(i * lebar) + 1, int((i + 1) * lebar) + 1
+        if i == n_titik - 3:
+            rata_x, rata_y = x[-1], y[-1]
+        else:
+            akhir_berikut = int((i + 2) * lebar) + 1
+            rata_x, rata_y = np.mean(x[akhir:akhir_berikut]), np.mean(y[akhir:akhir_berikut])
+        luas = [
+            abs((x[a] - rata_x) * (y[j] - y[a]) - (x[a] - x[j]) * (rata_y - y[a]))
+            for j in range(awal, akhir)
+        ]
+        a = awal + int(np.argmax(luas))
+        terpilih.append(a)
+    terpilih.append(n - 1)
+    return np.array(terpilih)
+
+
+def _minmax_naif(y, n_bucket):
+    ukuran = -(-len(y) // n_bucket)
+    terpilih = set()
+    for awal in range(0, len(y), ukuran):
+        bucket = y[awal:awal + ukuran]
+        terpilih.update((awal + int(np.nanargmin(bucket)), awal + int(np.nanargmax(bucket))))
+    return np.array(sorted(terpilih))
+
+
+@pytest.mark.parametrize('n, n_titik', [(1000, 100), (5003, 1200), (757, 3), (12345, 997)])
+def test_lttb_sama_dengan_implementasi_naif(n, n_titik):
+    rng = np.random.default_rng(n)
+    x = np.sort(rng.uniform(0, 1000, n))
+    y = np.cumsum(rng.normal(size=n))
+
+    indeks = grafik.indeks_sampel(x, y, n_titik)
+
+    np.testing.assert_array_equal(indeks, _lttb_naif(x - x[0], y, n_titik))
+
+
+def test_lttb_tanggal_dan_nilai_kosong():
+    rng = np.random.default_rng(1)
+    tanggal = np.arange('2000-01-01', '2010-01-01', dtype='datetime64[D]')
+    y = rng.normal(size=len(tanggal))
+    y[rng.choice(len(y), 300, replace=False)] = np.nan
+
+    indeks = grafik.indeks_sampel(tanggal, y, 500)
+
+    valid = np.flatnonzero(~np.isnan(y))
+    hari = (tanggal[valid] - tanggal[valid[0]]).astype('timedelta64[ns]').astype(np.int64).astype(float)
+    np.testing.assert_array_equal(indeks, valid[_lttb_naif(hari, y[valid], 500)])
+
+
+@pytest.mark.parametrize('n, n_titik', [(1000, 100), (5003, 1200), (101, 40)])
+def test_minmax_sama_dengan_implementasi_naif(n, n_titik):
+    rng = np.random.default_rng(n)
+    y = rng.normal(size=n)
+    y[::17] = np.nan
+
+    indeks = grafik.indeks_sampel(np.arange(n), y, n_titik, metode='minmax')
+
+    np.testing.assert_array_equal(indeks, _minmax_naif(y, n_titik // 2))
+    assert len(indeks) <= n_titik
+
+
+def test_indeks_sampel_tidak_memotong_data_pendek():
+    np.testing.assert_array_equal(grafik.indeks_sampel(np.arange(10), np.ones(10), 20), np.arange(10))
+    with pytest.raises(ValueError):
+        grafik.indeks_sampel(np.arange(100), np.ones(100), 10, metode='acak')
+
+
+def _kde_langsung(x, titik):
+    # KDE Gaussian bandwidth Scott dijumlahkan langsung: O(n x grid)
+    h = x.std(ddof=1) * len(x) ** (-1 / 5)
+    z = (titik[:, np.newaxis] - x[np.newaxis, :]) / h
+    return np.exp(-0.5 * z ** 2).sum(axis=1) / (len(x) * h * np.sqrt(2 * np.pi))
+
+
+@pytest.mark.parametrize('bentuk', ['normal', 'bimodal', 'miring'])
+def test_kde_fft_mendekati_kde_langsung(bentuk):
+    rng = np.random.default_rng(7)
+    x = {
+        'normal': rng.normal(27, 1.5, 5000),
+        'bimodal': np.concatenate([rng.normal(0, 1, 3000), rng.normal(8, 0.5, 2000)]),
+        'miring': rng.exponential(10, 5000),
+    }[bentuk]
+
+    titik, densitas = grafik.kde_fft(x)
+    acuan = _kde_langsung(x, titik)
+
+    assert titik[0] == x.min() and titik[-1] == x.max()
+    np.testing.assert_allclose(densitas, acuan, rtol=0, atol=1e-3 * acuan.max())
+
+
+def test_kde_fft_sama_dengan_scipy():
+    stats = pytest.importorskip('scipy.stats')
+    x = np.random.default_rng(3).gamma(2, 3, 2000)
+
+    titik, densitas = grafik.kde_fft(x)
+    acuan = stats.gaussian_kde(x)(titik)
+
+    np.testing.assert_allclose(densitas, acuan, rtol=0, atol=1e-3 * acuan.max())
+
+
+def test_kde_fft_data_tidak_terdefinisi():
+    assert grafik.kde_fft([1.0]) is None
+    assert grafik.kde_fft([2.0, 2.0, 2.0]) is None
+    assert grafik.kde_fft([np.nan, 1.0, np.inf]) is None
+
+
+def test_sebaran_histogram_dan_skala_frekuensi():
+    x = np.random.default_rng(5).normal(80, 6, 3000)
+    x[::50] = np.nan
+
+    hasil = grafik.sebaran(x, bins=20)
+
+    valid = x[np.isfinite(x)]
+    frekuensi, tepi = np.histogram(valid, bins=20)
+    np.testing.assert_array_equal(hasil['frekuensi'], frekuensi)
+    np.testing.assert_array_equal(hasil['tepi'], tepi)
+    acuan = _kde_langsung(valid, hasil['kde_x']) * len(valid) * (tepi[1] - tepi[0])
+    np.testing.assert_allclose(hasil['kde_y'], acuan, rtol=0, atol=1e-3 * acuan.max())
+
+    kosong = grafik.sebaran(np.full(5, 3.0))
+    assert len(kosong['kde_x']) == len(kosong['kde_y']) == 0
@@ -0,0 +1,18 @@
+import os
+
+from streamlit.testing.v1 import AppTest
+
+import model_cuaca
+from artefak import BASE_DIR
+
+
+def test_halaman_tanpa_file_model_menampilkan_pesan(tmp_path, monkeypatch):
+    # Folder model kosong: evaluasi dan prediksi menampilkan st.error, bukan traceback
+    monkeypatch.setattr(model_cuaca, 'MODEL_DIR', str(tmp_path))
+
+    halaman = AppTest.from_file(os.path.join(BASE_DIR, 'suhu.py'), default_timeout=120).run()
+
+    assert not halaman.exception
+    pesan = [error.value for error in halaman.error]
+    assert any("model_suhu_rf.joblib" in p for p in pesan)
+    assert all("tidak ditemukan" in p for p in pesan)
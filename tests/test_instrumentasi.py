@@ -0,0 +1,114 @@
+import json
+from collections import deque
+
+import numpy as np
+import pytest
+
+import instrumentasi
+
+
+@pytest.fixture(autouse=True)
+def buffer_kosong(monkeypatch):
+    monkeypatch.setattr(instrumentasi, '_catatan', deque(maxlen=instrumentasi.KAPASITAS))
+    pelacakan = instrumentasi.pelacakan_memori()
+    yield
+    instrumentasi.atur_pelacakan_memori(pelacakan)
+
+
+def _catatan(halaman, bagian, wall_ms, puncak_kb=None):
+    return {
+        'waktu': 0.0, 'halaman': halaman, 'rerun': None, 'bagian': bagian,
+        'wall_ms': wall_ms, 'cpu_ms': wall_ms / 2, 'puncak_kb': puncak_kb, 'galat': None,
+    }
+
+
+def test_ring_buffer_membuang_catatan_tertua(monkeypatch):
+    monkeypatch.setattr(instrumentasi, '_catatan', deque(maxlen=5))
+
+    for i in range(12):
+        with instrumentasi.ukur(f'bagian{i}'):
+            pass
+
+    assert [c['bagian'] for c in instrumentasi.catatan()] == [f'bagian{i}' for i in range(7, 12)]
+
+
+def test_ringkasan_sama_dengan_np_percentile():
+    rng = np.random.default_rng(0)
+    wall_a, wall_b = rng.exponential(20, 500), rng.exponential(5, 37)
+    puncak_a = rng.uniform(0, 100, 500)
+    data = (
+        [_catatan('suhu', 'a', w, p if i % 3 else None) for i, (w, p) in enumerate(zip(wall_a, puncak_a))]
+        + [_catatan('suhu', 'b', w) for w in wall_b]
+        + [_catatan(None, 'a', 1.0)]
+    )
+
+    hasil = instrumentasi.ringkasan(data)
+
+    assert [(b['halaman'], b['bagian'], b['n']) for b in hasil] == [('suhu', 'a', 500), ('suhu', 'b', 37), (None, 'a', 1)]
+    a, b = hasil[0], hasil[1]
+    for p, acuan_wall, acuan_cpu in zip(
+        instrumentasi.PERSENTIL, np.percentile(wall_a, instrumentasi.PERSENTIL), np.percentile(wall_a / 2, instrumentasi.PERSENTIL)
+    ):
+        assert a[f'wall_ms_p{p}'] == pytest.approx(acuan_wall)
+        assert a[f'cpu_ms_p{p}'] == pytest.approx(acuan_cpu)
+    terlacak = [p for i, p in enumerate(puncak_a) if i % 3]
+    for p, acuan in zip(instrumentasi.PERSENTIL, np.percentile(terlacak, instrumentasi.PERSENTIL)):
+        assert a[f'puncak_kb_p{p}'] == pytest.approx(acuan)
+        assert b[f'puncak_kb_p{p}'] is None
+    assert a['wall_ms_total'] == pytest.approx(wall_a.sum())
+
+
+def test_terukur_dan_rerun_memberi_tag():
+    @instrumentasi.terukur
+    def hitung():
+        return 1
+
+    @instrumentasi.terukur(bagian='nama.khusus')
+    def gagal():
+        raise KeyError('x')
+
+    with instrumentasi.rerun('kelembapan'):
+        assert hitung() == 1
+        with pytest.raises(KeyError):
+            gagal()
+    hitung()
+
+    data = instrumentasi.catatan()
+    assert [c['bagian'] for c in data] == [
+        f'{__name__}.test_terukur_dan_rerun_memberi_tag.<locals>.hitung', 'nama.khusus', 'rerun', data[0]['bagian'],
+    ]
+    assert [c['halaman'] for c in data] == ['kelembapan'] * 3 + [None]
+    assert data[0]['rerun'] == data[1]['rerun'] == data[2]['rerun'] is not None
+    # Galat yang ditangkap di dalam rerun tidak membuat rerun itu sendiri gagal
+    assert [c['galat'] for c in data] == [None, 'KeyError', None, None]
+    assert all(c['wall_ms'] >= 0 and c['cpu_ms'] >= 0 for c in data)
+
+
+def test_puncak_memori_hanya_saat_pelacakan_aktif():
+    instrumentasi.atur_pelacakan_memori(False)
+    with instrumentasi.ukur('mati'):
+        np.ones(100_000)
+    instrumentasi.atur_pelacakan_memori(True)
+    with instrumentasi.ukur('luar'):
+        with instrumentasi.ukur('dalam'):
+            np.ones(1_000_000)
+    instrumentasi.atur_pelacakan_memori(False)
+
+    puncak = {c['bagian']: c['puncak_kb'] for c in instrumentasi.catatan()}
+    assert puncak['mati'] is None
+    # 1 juta float64 = 7812,5 KiB, juga terhitung pada bagian luar yang membungkusnya
+    assert puncak['dalam'] >= 7812
+    assert puncak['luar'] >= 7812
+
+
+def test_ekspor_json(tmp_path):
+    with instrumentasi.ukur('ekspor'):
+        pass
+    path = tmp_path / 'instrumentasi.json'
+
+    isi = json.loads(instrumentasi.ekspor_json(str(path)))
+
+    assert json.loads(path.read_text(encoding='utf-8')) == isi
+    assert isi['kapasitas'] == instrumentasi.KAPASITAS
+    assert [c['bagian'] for c in isi['catatan']] == ['ekspor']
+    assert isi['ringkasan'] == instrumentasi.ringkasan(instrumentasi.catatan())
@@ -0,0 +1,99 @@
+import os
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.metrics import (
+    mean_absolute_error, mean_absolute_percentage_error, mean_squared_error, r2_score
+)
+
+import model_cuaca
+
+
+@pytest.fixture
+def prediksi():
+    rng = np.random.default_rng(0)
+    y_test = rng.uniform(20, 35, size=500)
+    y_pred = y_test + rng.normal(scale=[[0.5], [1.0], [2.0]], size=(3, len(y_test)))
+    return y_test, y_pred
+
+
+def test_hitung_evaluasi_sama_dengan_sklearn(prediksi):
+    y_test, y_pred = prediksi
+    hasil = model_cuaca.hitung_evaluasi(y_test, y_pred, bins=20)
+
+    for i, pred in enumerate(y_pred):
+        metrik = dict(zip(model_cuaca.METRIK, hasil['metrik'][i]))
+        assert metrik['MAE'] == pytest.approx(mean_absolute_error(y_test, pred))
+        assert metrik['MSE'] == pytest.approx(mean_squared_error(y_test, pred))
+        assert metrik['RMSE'] == pytest.approx(np.sqrt(mean_squared_error(y_test, pred)))
+        assert metrik['R²'] == pytest.approx(r2_score(y_test, pred))
+        assert metrik['MAPE'] == pytest.approx(mean_absolute_percentage_error(y_test, pred) * 100)
+
+        error = y_test - pred
+        statistik = dict(zip(model_cuaca.STATISTIK_ERROR, hasil['statistik_error'][i]))
+        assert statistik == pytest.approx({
+            'Min': error.min(), 'Max': error.max(), 'Mean': error.mean(), 'Median': np.median(error),
+            'Std Dev': error.std(),
+        })
+
+        histogram, _ = np.histogram(error, bins=hasil['tepi_bin'])
+        np.testing.assert_array_equal(hasil['histogram'][i], histogram)
+
+
+def test_hitung_metrik_satu_model(prediksi):
+    y_test, y_pred = prediksi
+    metrik = model_cuaca.hitung_metrik(y_test, y_pred[1])
+
+    assert list(metrik) == model_cuaca.METRIK
+    assert metrik['RMSE'] == pytest.approx(np.sqrt(mean_squared_error(y_test, y_pred[1])))
+    assert metrik['R²'] == pytest.approx(r2_score(y_test, y_pred[1]))
+
+
+def test_hitung_evaluasi_prediksi_sempurna():
+    y = np.array([1.0, 2.0, 3.0])
+    hasil = model_cuaca.hitung_evaluasi(y, y)
+
+    np.testing.assert_array_equal(hasil['metrik'][0], [0.0, 0.0, 0.0, 1.0, 0.0])
+    assert hasil['histogram'].sum() == len(y)
+
+
+@pytest.fixture
+def direktori_model(tmp_path, monkeypatch):
+    import shutil
+    from collections import OrderedDict
+
+    import artefak
+
+    monkeypatch.setattr(model_cuaca, 'MODEL_DIR', str(tmp_path / 'Model'))
+    monkeypatch.setattr(model_cuaca, 'SPLIT_DIR', str(tmp_path / 'Split_Data'))
+    monkeypatch.setattr(artefak, 'CACHE_DIR', str(tmp_path / 'Cache'))
+    monkeypatch.setattr(model_cuaca, '_cache', OrderedDict())
+    os.makedirs(model_cuaca.MODEL_DIR)
+    os.makedirs(model_cuaca.SPLIT_DIR)
+    shutil.copy(os.path.join(artefak.BASE_DIR, 'Split_Data', 'split_data_suhu.pkl'), model_cuaca.SPLIT_DIR)
+    return tmp_path
+
+
+def test_latih_ulang_model_membuang_artefak_lama_stasiun_pemilik(direktori_model):
+    from sklearn.ensemble import RandomForestRegressor
+
+    X_train, X_test, y_train, y_test = model_cuaca.load_split('suhu')
+    joblib.dump(RandomForestRegressor(n_estimators=3, random_state=0).fit(X_train, y_train), model_cuaca.path_model('suhu', 'rf'))
+
+    def kunci_artefak():
+        return [k for k in model_cuaca._cache if k[0] == 'artefak']
+
+    # Stasiun tanpa model sendiri memakai artefak milik stasiun utama
+    model_cuaca.load_artefak('suhu', 'rf', 'B01')
+    assert [k[3] for k in kunci_artefak()] == ['utama']
+
+    model_cuaca.latih_ulang_model('suhu', 'rf', 'B01')
+    assert os.path.exists(os.path.join(model_cuaca.MODEL_DIR, 'B01', 'model_suhu_rf.joblib'))
+    # Entri versi lama milik B01 dibuang; artefak stasiun utama tidak berubah dan tetap tersimpan
+    model_cuaca._cache[('artefak', 'suhu', 'rf', 'B01', 'versi-lama')] = {}
+    versi = model_cuaca.latih_ulang_model('suhu', 'rf', 'B01')['versi']
+
+    kunci = kunci_artefak()
+    assert ('artefak', 'suhu', 'rf', 'B01', versi) in kunci
+    assert sorted(k[3] for k in kunci) == ['B01', 'utama']
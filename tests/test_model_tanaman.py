@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+import model_tanaman
+import pohon
+
+
+def _cek_top_k(model, X, k):
+    proba = model_tanaman.prediksi_proba(model, X)
+    classes = np.asarray(model['classes'] if isinstance(model, dict) else model.classes_)
+    kode, proba_top = model_tanaman.rekomendasi_top_k(model, X, k)
+
+    k = min(k, proba.shape[1])
+    assert kode.shape == proba_top.shape == (len(proba), k)
+    # Probabilitas sama dengan k nilai terbesar hasil argsort; kelas yang seri boleh berbeda urutan
+    harapan = np.take_along_axis(proba, np.argsort(-proba, axis=1, kind='stable')[:, :k], axis=1)
+    np.testing.assert_array_equal(proba_top, harapan)
+    # Setiap kode menunjuk kelas dengan probabilitas yang dilaporkan, tanpa kelas ganda per baris
+    kolom = np.searchsorted(classes, kode)
+    np.testing.assert_array_equal(np.take_along_axis(proba, kolom, axis=1), proba_top)
+    assert all(len(set(baris)) == k for baris in kode.tolist())
+    # Rekomendasi pertama sama dengan prediksi model
+    np.testing.assert_array_equal(kode[:, 0], classes[proba.argmax(axis=1)])
+
+
+@pytest.mark.parametrize('k', [1, 3, 5, 100])
+def test_top_k_mesin_tanaman_sama_dengan_argsort(k):
+    X = model_tanaman.load_dataset()[model_tanaman.FITUR_TANAMAN]
+    _cek_top_k(model_tanaman.load_mesin(), X, k)
+
+
+@pytest.mark.parametrize('k', [1, 2, 4])
+def test_top_k_dengan_banyak_probabilitas_seri(k):
+    # Pohon dangkal menghasilkan banyak probabilitas yang sama persis, termasuk seri di posisi teratas
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(400, len(model_tanaman.FITUR_TANAMAN)))
+    y = rng.integers(0, 6, size=len(X))
+    model = RandomForestClassifier(n_estimators=4, max_depth=2, random_state=0).fit(X, y)
+    mesin = pohon.ratakan_klasifikasi(model)
+    for m in (model, mesin):
+        _cek_top_k(m, X, k)
+
+
+def test_top_k_ambang():
+    X = model_tanaman.load_dataset()[model_tanaman.FITUR_TANAMAN].head(200)
+    mesin = model_tanaman.load_mesin()
+    kode, proba = model_tanaman.rekomendasi_top_k(mesin, X, 3)
+    kode_ambang, proba_ambang = model_tanaman.rekomendasi_top_k(mesin, X, 3, ambang=0.2)
+
+    di_bawah = proba < 0.2
+    assert (kode_ambang[di_bawah] == -1).all() and np.isnan(proba_ambang[di_bawah]).all()
+    np.testing.assert_array_equal(kode_ambang[~di_bawah], kode[~di_bawah])
+
+
+def test_bundel_evaluasi_sama_dengan_perhitungan_langsung(tmp_path, monkeypatch):
+    import pandas as pd
+    from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+
+    monkeypatch.setattr(model_tanaman, 'CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(model_tanaman, '_cache', {})
+    evaluasi = model_tanaman.load_evaluasi()
+
+    # Perhitungan halaman rekomendasi sebelum ada bundel: predict model pickle pada data uji
+    X_test = pd.read_csv(model_tanaman.X_TEST_PATH)
+    y_test = pd.read_csv(model_tanaman.Y_TEST_PATH).values.ravel()
+    y_pred = model_tanaman.load_model().predict(X_test)
+    nama = model_tanaman.NAMA_TANAMAN
+
+    np.testing.assert_array_equal(evaluasi['y_pred'], y_pred)
+    np.testing.assert_array_equal(evaluasi['confusion_matrix'], confusion_matrix(y_test, y_pred))
+    assert evaluasi['accuracy'] == accuracy_score(y_test, y_pred)
+    assert evaluasi['report'] == classification_report(
+        [nama[v] for v in y_test], [nama[v] for v in y_pred], output_dict=True
+    )
+
+    # Proses baru membuka bundel dari disk tanpa menjalankan inferensi lagi
+    monkeypatch.setattr(model_tanaman, '_cache', {})
+    monkeypatch.setattr(model_tanaman, 'buat_evaluasi', lambda versi=None: pytest.fail("bundel dibuat ulang"))
+    ulang = model_tanaman.load_evaluasi()
+    assert ulang['versi'] == evaluasi['versi']
+    np.testing.assert_array_equal(ulang['confusion_matrix'], evaluasi['confusion_matrix'])
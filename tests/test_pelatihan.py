@@ -0,0 +1,83 @@
+import os
+import time
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+
+import model_cuaca
+import pelatihan
+
+
+def test_jumlah_pekerja_konvensi_sklearn(monkeypatch):
+    monkeypatch.setattr(os, 'cpu_count', lambda: 8)
+
+    assert pelatihan.jumlah_pekerja(None) == 1
+    assert pelatihan.jumlah_pekerja(3) == 3
+    assert pelatihan.jumlah_pekerja(-1) == 8
+    assert pelatihan.jumlah_pekerja(-2) == 7
+    assert pelatihan.jumlah_pekerja(-20) == 1
+    with pytest.raises(ValueError):
+        pelatihan.jumlah_pekerja(0)
+
+
+def test_buat_model_clone_hyperparameter_file_model(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_cuaca, 'MODEL_DIR', str(tmp_path))
+    asli = RandomForestRegressor(n_estimators=7, max_depth=4, random_state=3).fit(np.eye(3), [0.0, 1.0, 2.0])
+    joblib.dump(asli, model_cuaca.path_model('suhu', 'rf'))
+
+    # Stasiun tanpa model sendiri memakai hyperparameter model stasiun utama
+    for stasiun in ('utama', 'B01'):
+        model = pelatihan.buat_model('suhu', 'rf', stasiun, n_thread=2)
+        assert not hasattr(model, 'estimators_')
+        assert model.get_params() == dict(asli.get_params(), n_jobs=2)
+
+
+def test_buat_model_tanpa_file_memakai_parameter_bawaan(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_cuaca, 'MODEL_DIR', str(tmp_path))
+    joblib.dump(np.zeros(3), model_cuaca.path_model('suhu', 'gb'))
+
+    for algoritma in ('rf', 'gb'):
+        model = pelatihan.buat_model('suhu', algoritma)
+        harapan = dict(type(model)().get_params(), random_state=0)
+        if 'n_jobs' in harapan:
+            harapan['n_jobs'] = 1
+        assert model.get_params() == harapan
+    with pytest.raises(ValueError):
+        pelatihan.buat_model('suhu', 'svm')
+
+
+def _tugas_lambat(target, algoritma, stasiun, n_thread):
+    time.sleep(30)
+
+
+def _tugas_cepat(target, algoritma, stasiun, n_thread):
+    return {'target': target, 'algoritma': algoritma, 'stasiun': stasiun, 'n_thread': n_thread, 'pid': os.getpid()}
+
+
+@pytest.fixture
+def tanpa_split(monkeypatch):
+    monkeypatch.setattr(pelatihan, 'siapkan_split', lambda *args: None)
+
+
+def test_latih_semua_paralel(monkeypatch, tanpa_split):
+    monkeypatch.setattr(pelatihan, 'latih_satu', _tugas_cepat)
+    progres = []
+
+    hasil = pelatihan.latih_semua(['suhu', 'kelembapan'], ['rf', 'gb'], ['utama'], n_jobs=2, progres=progres.append)
+
+    assert sorted((h['target'], h['algoritma']) for h in hasil) == [
+        ('kelembapan', 'gb'), ('kelembapan', 'rf'), ('suhu', 'gb'), ('suhu', 'rf')
+    ]
+    assert progres == hasil
+    assert all(h['pid'] != os.getpid() and h['n_thread'] == 1 for h in hasil)
+
+
+def test_latih_semua_batas_waktu_menghentikan_pekerja(monkeypatch, tanpa_split):
+    monkeypatch.setattr(pelatihan, 'latih_satu', _tugas_lambat)
+
+    mulai = time.monotonic()
+    with pytest.raises(TimeoutError):
+        pelatihan.latih_semua(['suhu', 'kelembapan'], ['rf'], ['utama'], n_jobs=2, batas_waktu=0.5)
+    assert time.monotonic() - mulai < 10
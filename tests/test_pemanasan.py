@@ -0,0 +1,53 @@
+import os
+import time
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import grafik
+import pemanasan
+from artefak import BASE_DIR
+
+
+@pytest.fixture
+def pemanasan_baru(monkeypatch):
+    monkeypatch.setattr(pemanasan, '_pool', None)
+    monkeypatch.setattr(pemanasan, '_status', {})
+
+
+def _tunggu_siap(batas=10):
+    akhir = time.monotonic() + batas
+    while not pemanasan.siap():
+        assert time.monotonic() < akhir, pemanasan.status()
+        time.sleep(0.01)
+
+
+def test_mulai_sekali_per_proses_dan_status(pemanasan_baru):
+    dijalankan = []
+
+    def gagal():
+        raise RuntimeError('rusak')
+
+    assert not pemanasan.siap()
+    assert pemanasan.mulai([('a', lambda: dijalankan.append('a')), ('b', gagal)])
+    assert not pemanasan.mulai([('c', lambda: dijalankan.append('c'))])
+    _tunggu_siap()
+
+    status = pemanasan.status()
+    assert dijalankan == ['a']
+    assert set(status) == {'a', 'b'}
+    assert status['a']['status'] == 'siap' and status['a']['detik'] >= 0
+    assert status['b']['status'] == 'gagal' and 'rusak' in status['b']['galat']
+
+
+def test_figure_pemanasan_dipakai_halaman_rekomendasi():
+    grafik.kosongkan_cache()
+    pemanasan._panaskan_tanaman()
+    kunci_hangat = set(grafik._cache_figur)
+    assert len(kunci_hangat) == 3
+
+    halaman = AppTest.from_file(os.path.join(BASE_DIR, 'rekomendasi.py'), default_timeout=120).run()
+
+    assert not halaman.exception
+    # Filter default halaman memakai kunci yang sama persis: tidak ada figure yang dibangun ulang
+    assert set(grafik._cache_figur) == kunci_hangat
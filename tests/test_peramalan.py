@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+
+import data_cuaca
+import peramalan
+from fitur_cuaca import FITUR_LAG, FITUR_ROLLING, JENDELA_ROLLING, VARIABEL_CUACA, fitur_target
+from model_cuaca import TARGET_CUACA
+
+
+def _ramalkan_acuan(model, target, kondisi, tanggal_terakhir, hari):
+    """
+    Loop per hari seperti halaman lama: satu DataFrame dan satu `model.predict` per hari, state
+    disimpan sebagai list Python biasa dengan jendela yang sama seperti data latih.
+    """
+    kolom_target = TARGET_CUACA[target]['kolom']
+    fitur = fitur_target(target)
+    baris = {nama: float(nilai) for nama, nilai in kondisi.items()}
+    riwayat = {}
+    hasil = []
+    for i in range(hari):
+        tanggal = pd.Timestamp(tanggal_terakhir) + pd.Timedelta(days=i + 1)
+        baris.update({'Hari': tanggal.dayofweek, 'Bulan': tanggal.month, 'Tahun': tanggal.year})
+        prediksi = float(model.predict(pd.DataFrame([baris], columns=fitur))[0])
+        hasil.append(prediksi)
+
+        for v in VARIABEL_CUACA:
+            hari_ini = prediksi if v == kolom_target else baris[v]
+            if i == 0:
+                # Hari-hari sebelum lag diisi nilai yang mempertahankan rolling kondisi awal
+                lag, rolling = baris[FITUR_LAG[v]], baris[FITUR_ROLLING[v]]
+                sebelumnya = (JENDELA_ROLLING * rolling - lag - hari_ini) / (JENDELA_ROLLING - 2)
+                riwayat[v] = [sebelumnya] * (JENDELA_ROLLING - 2) + [lag, hari_ini]
+            else:
+                riwayat[v][-1] = hari_ini
+            # Hari berikutnya: nilai target yang belum diketahui diisi prediksi hari ini
+            riwayat[v] = riwayat[v][1:] + [hari_ini]
+            baris[FITUR_LAG[v]] = riwayat[v][-2]
+            total = riwayat[v][0]
+            for nilai in riwayat[v][1:]:
+                total += nilai
+            baris[FITUR_ROLLING[v]] = total / JENDELA_ROLLING
+    tanggal = pd.date_range(pd.Timestamp(tanggal_terakhir) + pd.Timedelta(days=1), periods=hari, freq='D')
+    return tanggal, np.array(hasil)
+
+
+@pytest.fixture(scope='module', params=list(TARGET_CUACA))
+def model_target(request):
+    target = request.param
+    X, y = data_cuaca.data_latih(target)
+    model = RandomForestRegressor(n_estimators=20, max_depth=10, random_state=0).fit(X.iloc[:-30], y.iloc[:-30])
+    kondisi = X.iloc[-30][peramalan.fitur_kondisi(target)].to_dict()
+    return target, model, kondisi, X.index[-31]
+
+
+@pytest.mark.parametrize('hari', [1, 2, 14])
+def test_ramalkan_sama_dengan_loop_per_hari(model_target, hari):
+    target, model, kondisi, tanggal_terakhir = model_target
+
+    tanggal, hasil = peramalan.ramalkan(model, target, kondisi, tanggal_terakhir, hari)
+    tanggal_acuan, acuan = _ramalkan_acuan(model, target, kondisi, tanggal_terakhir, hari)
+
+    pd.testing.assert_index_equal(tanggal, tanggal_acuan)
+    np.testing.assert_allclose(hasil, acuan, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize('buat_model', [
+    lambda: GradientBoostingRegressor(n_estimators=20, random_state=0),
+    # Model tanpa pohon tidak dapat diratakan sehingga memakai predict sklearn
+    LinearRegression,
+], ids=['GradientBoosting', 'LinearRegression'])
+def test_ramalkan_model_lain(model_target, buat_model):
+    target, _, kondisi, tanggal_terakhir = model_target
+    X, y = data_cuaca.data_latih(target)
+    model = buat_model().fit(X, y)
+
+    _, hasil = peramalan.ramalkan(model, target, kondisi, tanggal_terakhir, 7)
+    _, acuan = _ramalkan_acuan(model, target, kondisi, tanggal_terakhir, 7)
+    np.testing.assert_allclose(hasil, acuan, rtol=1e-12, atol=1e-12)
+
+
+def test_ramalkan_skenario_sama_dengan_ramalkan_per_skenario(model_target):
+    target, model, kondisi, tanggal_terakhir = model_target
+    kolom_kondisi = peramalan.fitur_kondisi(target)
+    kolom = kolom_kondisi[0]
+    nilai = np.linspace(0.5, 1.5, 9) * kondisi[kolom]
+    matriks = peramalan.sapuan_skenario(kondisi, kolom, nilai, kolom_kondisi)
+
+    tanggal, hasil = peramalan.ramalkan_skenario(model, target, matriks, tanggal_terakhir, 10)
+
+    assert hasil.shape == (len(nilai), 10)
+    for i, v in enumerate(nilai):
+        tanggal_satu, satu = peramalan.ramalkan(model, target, dict(kondisi, **{kolom: v}), tanggal_terakhir, 10)
+        pd.testing.assert_index_equal(tanggal, tanggal_satu)
+        np.testing.assert_allclose(hasil[i], satu, rtol=1e-12, atol=1e-12)
+
+    # DataFrame kondisi diurutkan menurut kolom, bukan posisi
+    df = pd.DataFrame(matriks, columns=kolom_kondisi)[kolom_kondisi[::-1]]
+    np.testing.assert_allclose(peramalan.ramalkan_skenario(model, target, df, tanggal_terakhir, 10)[1], hasil, rtol=1e-12, atol=1e-12)
+
+
+def test_ramalkan_skenario_besar_memakai_predict_sklearn(model_target, monkeypatch):
+    target, model, kondisi, tanggal_terakhir = model_target
+    kolom_kondisi = peramalan.fitur_kondisi(target)
+    matriks = peramalan.sapuan_skenario(kondisi, kolom_kondisi[1], np.linspace(0, 100, 50), kolom_kondisi)
+    _, datar = peramalan.ramalkan_skenario(model, target, matriks, tanggal_terakhir, 5)
+
+    monkeypatch.setattr(peramalan, 'BATAS_TRAVERSAL_DATAR', 0)
+    _, sklearn = peramalan.ramalkan_skenario(model, target, matriks, tanggal_terakhir, 5)
+    np.testing.assert_allclose(sklearn, datar, rtol=1e-12, atol=1e-12)
+
+
+def test_ramalkan_skenario_jumlah_kolom_salah(model_target):
+    target, model, kondisi, tanggal_terakhir = model_target
+    with pytest.raises(ValueError):
+        peramalan.ramalkan_skenario(model, target, np.zeros((2, 3)), tanggal_terakhir, 5)
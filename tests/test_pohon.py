@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import (
+    ExtraTreesClassifier, ExtraTreesRegressor, GradientBoostingRegressor, RandomForestClassifier,
+    RandomForestRegressor
+)
+from sklearn.tree import DecisionTreeRegressor
+
+import model_tanaman
+import pohon
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(600, 5))
+    y = X[:, 0] * 2 + np.sin(X[:, 1] * 3) + rng.normal(scale=0.1, size=len(X))
+    kelas = np.digitize(y, [-1.0, 0.5, 2.0]) * 10
+    # Lebih besar dari satu blok traversal agar jalur per blok ikut diuji
+    X_uji = rng.normal(size=(3 * pohon._UKURAN_BLOK + 7, 5))
+    return X, y, kelas, X_uji
+
+
+@pytest.mark.parametrize('model', [
+    DecisionTreeRegressor(max_depth=6, random_state=0),
+    RandomForestRegressor(n_estimators=15, random_state=0),
+    ExtraTreesRegressor(n_estimators=15, random_state=0),
+    GradientBoostingRegressor(n_estimators=30, random_state=0),
+], ids=lambda model: type(model).__name__)
+def test_prediksi_regresor_sama_dengan_sklearn(data, model):
+    X, y, _, X_uji = data
+    model.fit(X, y)
+    hutan = pohon.ratakan_regresor(model)
+
+    np.testing.assert_allclose(pohon.prediksi(hutan, X_uji), model.predict(X_uji), rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(pohon.prediksi(hutan, X_uji[:1]), model.predict(X_uji[:1]), rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize('kelas_model', [RandomForestClassifier, ExtraTreesClassifier])
+def test_prediksi_klasifikasi_identik_dengan_sklearn(data, kelas_model):
+    X, _, kelas, X_uji = data
+    model = kelas_model(n_estimators=15, random_state=0).fit(X, kelas)
+    hutan = pohon.ratakan_klasifikasi(model)
+
+    np.testing.assert_array_equal(pohon.prediksi_proba(hutan, X_uji), model.predict_proba(X_uji))
+    np.testing.assert_array_equal(pohon.prediksi_kelas(hutan, X_uji), model.predict(X_uji))
+
+
+def test_model_tidak_didukung():
+    assert pohon.ratakan_klasifikasi(GradientBoostingRegressor()) is None
+
+
+def test_mesin_tanaman_sama_dengan_model_pickle():
+    X = model_tanaman.load_dataset()[model_tanaman.FITUR_TANAMAN]
+    model = model_tanaman.load_model()
+    mesin = model_tanaman.load_mesin()
+
+    np.testing.assert_array_equal(model_tanaman.prediksi_proba(mesin, X), model.predict_proba(X))
+    np.testing.assert_array_equal(model_tanaman.prediksi(mesin, X), model.predict(X))
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import model_tanaman
+import rekomendasi_batch
+
+
+@pytest.fixture(scope='module')
+def survei():
+    df = pd.read_csv(model_tanaman.DATASET_PATH)[model_tanaman.FITUR_TANAMAN].head(250).copy()
+    df['N'] = df['N'].astype(np.int64)
+    return df
+
+
+def _tulis_csv_chunk_terakhir_kosong(path, df):
+    # Sel N kosong hanya di chunk terakhir: pandas membaca N sebagai int64 di chunk awal dan float64 di chunk itu
+    df.to_csv(path, index=False)
+    baris = path.read_text().splitlines()
+    baris[-1] = ',' + baris[-1].split(',', 1)[1]
+    path.write_text('\n'.join(baris) + '\n')
+
+
+@pytest.mark.parametrize('top_k, ambang', [(0, 0.0), (3, 0.0), (3, 1.5)])
+def test_parquet_chunk_dtype_berbeda(tmp_path, survei, top_k, ambang):
+    pytest.importorskip('pyarrow')
+    path_input, path_output = tmp_path / 'survei.csv', tmp_path / 'hasil.parquet'
+    _tulis_csv_chunk_terakhir_kosong(path_input, survei)
+
+    total = rekomendasi_batch.prediksi_file(str(path_input), str(path_output), ukuran_chunk=100, top_k=top_k, ambang=ambang)
+
+    hasil = pd.read_parquet(path_output)
+    assert total == len(hasil) == len(survei)
+    assert (hasil[model_tanaman.FITUR_TANAMAN].dtypes == np.float64).all()
+    assert np.isnan(hasil['N'].iloc[-1])
+    assert hasil['tanaman'].iloc[-1] == rekomendasi_batch.LABEL_TIDAK_LENGKAP
+    assert (hasil['kode_tanaman'].iloc[:-1] >= 0).all()
+    if ambang > 1.0:
+        # Ambang di atas semua probabilitas: kolom top-k setiap chunk seluruhnya kosong
+        assert hasil[[f'tanaman_{i}' for i in range(1, top_k + 1)]].isna().all().all()
+
+
+def test_csv_sama_dengan_prediksi_model(tmp_path, survei):
+    path_input, path_output = tmp_path / 'survei.csv', tmp_path / 'hasil.csv'
+    survei.to_csv(path_input, index=False)
+
+    rekomendasi_batch.prediksi_file(str(path_input), str(path_output), ukuran_chunk=100)
+
+    hasil = pd.read_csv(path_output)
+    harapan = model_tanaman.load_model().predict(survei.astype(float))
+    np.testing.assert_array_equal(hasil['kode_tanaman'].to_numpy(), harapan)
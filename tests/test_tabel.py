@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import model_tanaman
+import tabel
+
+
+@pytest.fixture(scope='module')
+def dataset():
+    df = model_tanaman.load_dataset().copy()
+    # Kolom tambahan dengan nilai kosong, negatif dan teks campuran
+    rng = np.random.default_rng(0)
+    df['selisih'] = np.round(rng.normal(scale=60, size=len(df)), 2)
+    df.loc[::17, 'selisih'] = np.nan
+    df['catatan'] = np.where(np.arange(len(df)) % 3, df['label'].str.upper(), None)
+    return df
+
+
+def _cari(df, kolom, kueri):
+    return tabel.cari(tabel.buat_indeks(df[kolom]), kueri)
+
+
+def _posisi(mask):
+    return np.flatnonzero(mask.fillna(False).to_numpy(dtype=bool))
+
+
+@pytest.mark.parametrize('kueri', ['5', '50', '1', '0', '9', '120', '6.5', '23.5', '0.5', '-5', '-0', '05', '2,5'])
+def test_awalan_angka_sama_dengan_startswith(dataset, kueri):
+    for kolom in model_tanaman.FITUR_TANAMAN + ['selisih']:
+        teks = dataset[kolom].astype(str).where(dataset[kolom].notna())
+        harapan = _posisi(teks.str.startswith(kueri.replace(',', '.')))
+        np.testing.assert_array_equal(_cari(dataset, kolom, kueri), harapan, err_msg=f'{kolom} {kueri!r}')
+
+
+@pytest.mark.parametrize('kueri, filter_pandas', [
+    ('20-30', lambda s: s.between(20, 30)),
+    ('30..20', lambda s: s.between(20, 30)),
+    ('-50 s/d 10,5', lambda s: s.between(-50, 10.5)),
+    ('>=6.5', lambda s: s >= 6.5),
+    ('>6.5', lambda s: s > 6.5),
+    ('<100', lambda s: s < 100),
+    ('<=100', lambda s: s <= 100),
+    ('=50', lambda s: s == 50),
+])
+def test_kueri_banding_sama_dengan_filter_pandas(dataset, kueri, filter_pandas):
+    for kolom in model_tanaman.FITUR_TANAMAN + ['selisih']:
+        harapan = _posisi(filter_pandas(dataset[kolom]))
+        np.testing.assert_array_equal(_cari(dataset, kolom, kueri), harapan, err_msg=f'{kolom} {kueri!r}')
+
+
+@pytest.mark.parametrize('kueri', ['jag', 'PADI', 'a', 'an', 'ngg', 'non', 'tidak ada', ' kopi '])
+def test_teks_sama_dengan_str_contains(dataset, kueri):
+    for kolom in ('label', 'catatan'):
+        # Sel kosong tidak pernah cocok
+        harapan = _posisi(dataset[kolom].str.lower().str.contains(kueri.strip().lower(), regex=False))
+        np.testing.assert_array_equal(_cari(dataset, kolom, kueri), harapan, err_msg=f'{kolom} {kueri!r}')
+
+
+def test_kueri_angka_tidak_valid(dataset):
+    with pytest.raises(ValueError):
+        _cari(dataset, 'N', 'lima')
+
+
+def test_pratinjau_sama_dengan_pembulatan_penuh(dataset):
+    harapan = dataset.apply(lambda s: np.ceil(s) if pd.api.types.is_float_dtype(s) else s)
+    for halaman, ukuran in [(1, 50), (3, 100), (tabel.jumlah_halaman(len(dataset), 500), 500), (10_000, 100)]:
+        hasil = tabel.pratinjau(dataset, halaman, ukuran)
+        halaman = min(halaman, tabel.jumlah_halaman(len(dataset), ukuran))
+        pd.testing.assert_frame_equal(hasil, harapan.iloc[(halaman - 1) * ukuran:halaman * ukuran])